@@ -2,22 +2,48 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .datasets import TailData
+from .datasets import DatasetCatalog, TailData
+from .dynamic import DegreeTracker
 from .estimators.base import BaseTailEstimator
+from .estimators.cost import calibrate
 from .estimators.estimator_set import TailEstimatorSet
+from .estimators.functional import (
+    hill,
+    kernel_type,
+    moments,
+    pickands,
+    pot,
+    power_law,
+    smooth_hill,
+)
 from .estimators.hill import HillEstimator
 from .estimators.kernel import KernelTypeEstimator
 from .estimators.moments import MomentsEstimator
 from .estimators.pickands import PickandsEstimator
+from .estimators.pot import POTEstimator
+from .estimators.power_law import PowerLawEstimator, goodness_of_fit
 from .estimators.smooth_hill import SmoothHillEstimator
 
 __all__ = [
     "BaseTailEstimator",
+    "DatasetCatalog",
+    "DegreeTracker",
     "HillEstimator",
     "KernelTypeEstimator",
     "MomentsEstimator",
+    "POTEstimator",
     "PickandsEstimator",
+    "PowerLawEstimator",
     "SmoothHillEstimator",
     "TailData",
     "TailEstimatorSet",
+    "calibrate",
+    "goodness_of_fit",
+    "hill",
+    "kernel_type",
+    "moments",
+    "pickands",
+    "pot",
+    "power_law",
+    "smooth_hill",
 ]
@@ -1,8 +1,306 @@
+import bz2
+import gzip
 import logging
+import lzma
 import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
+_PACKAGE_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# (magic bytes, file extension, opener) of supported compression formats
+_COMPRESSION_FORMATS = (
+    (b"\x1f\x8b", ".gz", gzip.open),
+    (b"BZh", ".bz2", bz2.open),
+    (b"\xfd7zXZ\x00", ".xz", lzma.open),
+)
+
+_COMMENT_PREFIXES = (b"%", b"#")
+
+# Lookup table of the ASCII whitespace bytes separating fields
+_WHITESPACE = np.zeros(256, dtype=bool)
+_WHITESPACE[list(b" \t\n\r\v\f")] = True
+
+
+def _open_data_file(file_path):
+    """Open a data file for binary reading, transparently decompressing it.
+
+    The compression format is detected from the file extension or, failing
+    that, from the magic bytes at the start of the file.
+    """
+    with open(file_path, "rb") as file:
+        head = file.read(6)
+    for magic, extension, opener in _COMPRESSION_FORMATS:
+        if file_path.endswith(extension) or head.startswith(magic):
+            return opener(file_path, "rb")
+    return open(file_path, "rb")
+
+
+def _iter_line_chunks(fileobj, chunk_size):
+    """Yield chunks of whole lines read from `fileobj`.
+
+    Reading (and decompression) runs on a background thread that stays at most
+    one chunk ahead of the consumer, so parsing overlaps with I/O.
+    """
+    blocks = queue.Queue(maxsize=1)
+    stop = threading.Event()
+
+    def read():
+        try:
+            while not stop.is_set():
+                block = fileobj.read(chunk_size)
+                blocks.put(block)
+                if not block:
+                    return
+        except BaseException as exc:
+            blocks.put(exc)
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    remainder = b""
+    try:
+        while True:
+            block = blocks.get()
+            if isinstance(block, BaseException):
+                raise block
+            if not block:
+                if remainder.strip():
+                    yield remainder + b"\n"
+                return
+            block = remainder + block
+            cut = block.rfind(b"\n") + 1
+            remainder = block[cut:]
+            if cut:
+                yield block[:cut]
+    finally:
+        stop.set()
+        # Unblock the reader if it is waiting on a full queue
+        while reader.is_alive():
+            try:
+                blocks.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+def _fields_per_line(chunk):
+    """Return the number of whitespace-separated fields on each line of `chunk`.
+
+    `chunk` must end with a newline.
+    """
+    raw = np.frombuffer(chunk, dtype=np.uint8)
+    space = _WHITESPACE[raw]
+    starts = ~space
+    starts[1:] &= space[:-1]
+    newlines = raw == ord("\n")
+    lines = np.cumsum(newlines, dtype=np.int64) - newlines
+    return np.bincount(lines[starts], minlength=int(newlines.sum()))
+
+
+def _parse_lines(chunk, n_columns):
+    """Parse a chunk of whitespace-separated numeric lines into rows.
+
+    Plain numeric chunks with `n_columns` fields on every line take a
+    vectorized fast path; other chunks (blank or comment lines, lines with
+    a different number of fields) fall back to line-by-line parsing.
+    """
+    if not any(prefix in chunk for prefix in _COMMENT_PREFIXES):
+        try:
+            parsed = np.fromstring(chunk, sep=" ")
+        except ValueError:
+            parsed = None
+        if (
+            parsed is not None
+            and parsed.size == n_columns * chunk.count(b"\n")
+            and np.all(_fields_per_line(chunk) == n_columns)
+        ):
+            return parsed.reshape(-1, n_columns)
+
+    rows = []
+    for line in chunk.splitlines():
+        fields = line.split()
+        if not fields or line.lstrip().startswith(_COMMENT_PREFIXES):
+            continue
+        if len(fields) != n_columns:
+            raise ValueError(
+                f"Expected {n_columns} column(s) per line, got line {line!r}"
+            )
+        rows.append([float(field) for field in fields])
+    return np.array(rows, dtype=np.float64).reshape(-1, n_columns)
+
+
+def _count_columns(chunk):
+    """Return the number of columns of the first data line in `chunk`."""
+    for line in chunk.splitlines():
+        fields = line.split()
+        if fields and not line.lstrip().startswith(_COMMENT_PREFIXES):
+            return len(fields)
+    return None
+
+
+def _append(buffer, size, block):
+    """Append `block` to the first `size` entries of a growable `buffer`."""
+    needed = size + len(block)
+    if needed > len(buffer):
+        buffer.resize(max(needed, 2 * len(buffer)), refcheck=False)
+    buffer[size:needed] = block
+    return needed
+
+
+def read_data_file(file_path, chunk_size=1 << 20):
+    """Stream a (possibly compressed) text data file into numpy arrays.
+
+    Two file layouts are supported: a ``(value, count)`` histogram with two
+    columns per line, or raw samples with one value per line. Files may be
+    gzip, bzip2 or xz compressed. Lines starting with ``%`` or ``#`` are
+    treated as comments.
+
+    The file is parsed in chunks of about `chunk_size` bytes while the next
+    chunk is read and decompressed on a background thread. Output arrays grow
+    in place, so peak memory is about the output plus one chunk.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the data file.
+    chunk_size : int, default=1048576
+        Number of (decompressed) bytes parsed at once.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Values of the histogram, or the samples for raw data.
+    counts : numpy.ndarray or None
+        Counts of the histogram as int64, or None for raw data.
+
+    Raises
+    ------
+    ValueError
+        If the file has more than two columns or a malformed line.
+    """
+    raw = False
+    size = 0
+    values = np.empty(0, dtype=np.float64)
+    counts = np.empty(0, dtype=np.int64)
+    for block_values, block_counts in _iter_data_blocks(file_path, chunk_size):
+        raw = block_counts is None
+        if not raw:
+            _append(counts, size, block_counts)
+        size = _append(values, size, block_values)
+    values.resize(size, refcheck=False)
+    if raw:
+        return values, None
+    counts.resize(size, refcheck=False)
+    return values, counts
+
+
+def _iter_data_blocks(file_path, chunk_size=1 << 20):
+    """Yield the ``(values, counts)`` blocks of a text data file, chunk by chunk.
+
+    `counts` is None for files of raw samples. See `read_data_file` for the
+    file layouts and the errors raised.
+    """
+    n_columns = None
+    with _open_data_file(file_path) as fileobj:
+        for chunk in _iter_line_chunks(fileobj, chunk_size):
+            if n_columns is None:
+                n_columns = _count_columns(chunk)
+                if n_columns is None:
+                    continue
+                if n_columns not in (1, 2):
+                    raise ValueError(
+                        f"Data file must have 1 or 2 columns, found {n_columns}"
+                    )
+            rows = _parse_lines(chunk, n_columns)
+            if n_columns == 2:
+                yield rows[:, 0], rows[:, 1].astype(np.int64)
+            else:
+                yield rows[:, 0], None
+
+
+def _iter_npy_blocks(file_path, block_size=1 << 20):
+    """Yield blocks of the values of a ``.npy`` file read through a memory map."""
+    data = np.load(file_path, mmap_mode="r").reshape(-1)
+    for start in range(0, len(data), block_size):
+        yield np.asarray(data[start : start + block_size]), None
+
+
+def _summary_stats(blocks):
+    """Return ``n``, ``n_unique`` and ``max_value`` of a stream of data blocks.
+
+    `blocks` yields ``(values, counts)`` pairs, with `counts` None for raw
+    samples. Only the distinct values seen so far are held in memory; the
+    distinct values of the blocks are merged once they outnumber those
+    merged before.
+    """
+    n = 0
+    max_value = None
+    merged = None
+    pending = []
+    n_pending = 0
+    for values, counts in blocks:
+        if counts is None:
+            n += len(values)
+        else:
+            n += int(counts.sum())
+            values = values[counts > 0]
+        if not len(values):
+            continue
+        block_max = float(values.max())
+        max_value = block_max if max_value is None else max(max_value, block_max)
+        pending.append(np.unique(values))
+        n_pending += len(pending[-1])
+        if merged is None or n_pending > len(merged):
+            merged = np.unique(
+                np.concatenate(pending if merged is None else [merged, *pending])
+            )
+            pending, n_pending = [], 0
+    if merged is None:
+        return {"n": n, "n_unique": 0, "max_value": None}
+    n_unique = len(np.unique(np.concatenate([merged, *pending])))
+    return {"n": n, "n_unique": n_unique, "max_value": max_value}
+
+
+_DEGREE_DIRECTIONS = ("in", "out", "total")
+
+
+def _add_bincount(totals, ids):
+    """Add the occurrences of each node id in `ids` to `totals` (grown as needed)."""
+    counts = np.bincount(ids)
+    if len(counts) > len(totals):
+        grown = np.zeros(len(counts), dtype=np.int64)
+        grown[: len(totals)] = totals
+        totals = grown
+    totals[: len(counts)] += counts
+    return totals
+
+
+def _degree_histogram(degrees):
+    """Convert per-node degrees to a ``(degree, count)`` histogram.
+
+    Nodes with zero degree are dropped.
+    """
+    counts = np.bincount(degrees)
+    values = np.flatnonzero(counts)
+    values = values[values > 0]
+    return values.astype(np.float64), counts[values].astype(np.int64)
+
+
+def _check_directions(direction):
+    """Normalize `direction` to a tuple of valid degree directions."""
+    directions = (direction,) if isinstance(direction, str) else tuple(direction)
+    for d in directions:
+        if d not in _DEGREE_DIRECTIONS:
+            raise ValueError(
+                f"direction must be one of {_DEGREE_DIRECTIONS}, got {d!r}"
+            )
+    return directions
+
 
 class TailData:
     """Load and manage tail distribution datasets.
@@ -10,6 +308,12 @@ class TailData:
     This class provides functionality to load datasets either from the package's
     built-in data directory using a name, or from a custom path provided by the user.
 
+    Dataset files store a ``(value, count)`` histogram, one pair per line. The
+    histogram is kept as the primary representation; the dense array of
+    observations is only materialized (and cached) when :attr:`data` is accessed.
+    Files with a single column are read as raw samples. Files may be gzip,
+    bzip2 or xz compressed; they are decompressed while being parsed.
+
     Parameters
     ----------
     name : str, optional
@@ -18,6 +322,8 @@ class TailData:
     path : str, optional
         Path to a custom dataset file. If provided, this takes precedence over `name`.
         Must be provided if `name` is None.
+    chunk_size : int, default=1048576
+        Number of bytes parsed at once when streaming the file.
 
     Attributes
     ----------
@@ -25,8 +331,17 @@ class TailData:
         Name of the dataset if a built-in dataset was loaded.
     path : str or None
         Path to the dataset file if a custom dataset was loaded.
+    values : numpy.ndarray
+        Values listed in the dataset file, in file order. For datasets built
+        from an array, the sorted unique values, computed on first access.
+    counts : numpy.ndarray
+        Number of occurrences of each entry of `values`.
     data : numpy.ndarray
-        The loaded dataset as a numpy array.
+        The loaded dataset as a numpy array. Expanded from `values` and
+        `counts` on first access. Datasets built with :meth:`from_array`,
+        :meth:`from_buffer` or :meth:`from_npy` keep the source array and its
+        dtype as is. Assigning an array replaces the observations, and
+        `values`, `counts` and the statistics follow the new data.
 
     Examples
     --------
@@ -39,26 +354,253 @@ class TailData:
 
     >>> data = TailData(path='path/to/my/data.dat')
     >>> print(len(data.data))
+
+    Wrap an existing ``.npy`` dump without loading it into memory:
+
+    >>> data = TailData.from_npy('path/to/degrees.npy')
+
+    Inspect the dataset without expanding it:
+
+    >>> data = TailData(name='CAIDA_KONECT')
+    >>> print(data.n, data.n_unique, data.max_value)
     """
 
-    def __init__(self, name=None, path=None):
+    def __init__(self, name=None, path=None, chunk_size=1 << 20):
         if name is None and path is None:
             raise ValueError("Either 'name' or 'path' must be provided")
 
         if name is not None and path is not None:
-            logging.info("Both 'name' and 'path' provided; 'path' will take precedence")
+            logger.info("Both 'name' and 'path' provided; 'path' will take precedence")
 
         self.name = name
         self.path = path
-        self.data = self.load_data()
+        self.chunk_size = chunk_size
+        self._data, self._values, self._counts = None, None, None
+        values, counts = self._read()
+        if counts is None:
+            self._data = values
+        else:
+            self._values, self._counts = values, counts
 
-    def load_data(self):
-        """Load data from either a built-in dataset or a custom file path.
+    @classmethod
+    def _from_dense(cls, data, name=None, path=None):
+        """Create a dataset that wraps an existing dense array."""
+        if data.ndim != 1:
+            raise ValueError(
+                f"Data must be a one-dimensional array, got shape {data.shape}"
+            )
+        obj = cls.__new__(cls)
+        obj.name = name
+        obj.path = path
+        obj.chunk_size = None
+        obj._data = data
+        obj._values, obj._counts = None, None
+        return obj
+
+    @classmethod
+    def from_array(cls, arr, copy=False):
+        """Create a dataset from an array-like object.
+
+        Parameters
+        ----------
+        arr : array_like
+            One-dimensional sequence of observations.
+        copy : bool, default=False
+            Whether to copy the data. If False and `arr` is already a numpy
+            array, the dataset is a view of it and keeps its dtype.
 
         Returns
         -------
-        numpy.ndarray
-            The loaded dataset as a numpy array.
+        TailData
+            Dataset wrapping `arr`.
+        """
+        data = np.array(arr, copy=True) if copy else np.asarray(arr)
+        return cls._from_dense(data)
+
+    @classmethod
+    def from_buffer(cls, obj, dtype=None):
+        """Create a dataset from an object exposing the buffer protocol.
+
+        The returned dataset shares memory with `obj` (e.g. ``memoryview``,
+        ``array.array`` or ``bytes``); nothing is copied.
+
+        Parameters
+        ----------
+        obj : buffer
+            Object exposing the buffer protocol.
+        dtype : data-type, optional
+            Data type used to interpret the buffer. If None, the dtype is
+            taken from the buffer format (``bytes`` are read as uint8).
+
+        Returns
+        -------
+        TailData
+            Dataset backed by the memory of `obj`.
+        """
+        if dtype is None:
+            data = np.asarray(memoryview(obj))
+        else:
+            data = np.frombuffer(obj, dtype=dtype)
+        return cls._from_dense(data)
+
+    @classmethod
+    def from_npy(cls, path, mmap=True):
+        """Create a dataset from a ``.npy`` file.
+
+        Parameters
+        ----------
+        path : str
+            Path to a ``.npy`` file containing a one-dimensional array.
+        mmap : bool, default=True
+            Whether to memory-map the file read-only instead of loading it.
+            Memory-mapped data is only paged in as it is read.
+
+        Returns
+        -------
+        TailData
+            Dataset backed by the file contents, in the stored dtype.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file cannot be found.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Data file not found at path: {path}")
+        logger.info(f"Loading data from file: {path}")
+        data = np.load(path, mmap_mode="r" if mmap else None)
+        return cls._from_dense(data, path=path)
+
+    @classmethod
+    def _from_histogram(cls, values, counts, name=None, path=None):
+        """Create a dataset from a ``(value, count)`` histogram."""
+        obj = cls.__new__(cls)
+        obj.name = name
+        obj.path = path
+        obj.chunk_size = None
+        obj._data = None
+        obj._values, obj._counts = values, counts
+        return obj
+
+    @classmethod
+    def from_edgelist(cls, path, direction="total", chunk_size=1 << 20):
+        """Create degree-sequence datasets from an edge list file.
+
+        The file is streamed in chunks (see :func:`read_data_file`) and the
+        degrees are accumulated with ``np.bincount``, so memory is bounded by
+        the number of nodes plus one chunk, independently of the number of
+        edges. Each line holds a source and a target node id; further
+        columns (weights, timestamps) are ignored, as are KONECT-style ``%``
+        comment lines. Nodes with zero degree in the requested direction are
+        not part of the returned sequence.
+
+        Parameters
+        ----------
+        path : str
+            Path to the (possibly compressed) edge list file.
+        direction : {'in', 'out', 'total'} or sequence of them, default='total'
+            Which degree to extract. Use ``'total'`` for undirected graphs.
+            If a sequence is given, all requested degree sequences are built
+            from a single pass over the file.
+        chunk_size : int, default=1048576
+            Number of bytes parsed at once.
+
+        Returns
+        -------
+        TailData or tuple of TailData
+            Degree-sequence dataset(s), stored as ``(degree, count)``
+            histograms. A tuple in the order of `direction` if a sequence was
+            given.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file cannot be found.
+        ValueError
+            If `direction` is invalid or a line has fewer than two columns.
+
+        Examples
+        --------
+        >>> in_deg, out_deg = TailData.from_edgelist('out.edges', ('in', 'out'))
+        """
+        directions = _check_directions(direction)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Data file not found at path: {path}")
+        logger.info(f"Loading edge list from file: {path}")
+
+        n_columns = None
+        out_degrees = np.zeros(0, dtype=np.int64)
+        in_degrees = np.zeros(0, dtype=np.int64)
+        with _open_data_file(path) as fileobj:
+            for chunk in _iter_line_chunks(fileobj, chunk_size):
+                if n_columns is None:
+                    n_columns = _count_columns(chunk)
+                    if n_columns is None:
+                        continue
+                    if n_columns < 2:
+                        raise ValueError(
+                            "Edge list must have at least 2 columns "
+                            "(source and target node ids)"
+                        )
+                edges = _parse_lines(chunk, n_columns)[:, :2].astype(np.int64)
+                out_degrees = _add_bincount(out_degrees, edges[:, 0])
+                in_degrees = _add_bincount(in_degrees, edges[:, 1])
+
+        degrees = {"in": in_degrees, "out": out_degrees}
+        datasets = []
+        for d in directions:
+            if d == "total":
+                size = max(len(in_degrees), len(out_degrees))
+                total = np.zeros(size, dtype=np.int64)
+                total[: len(in_degrees)] += in_degrees
+                total[: len(out_degrees)] += out_degrees
+                degrees["total"] = total
+            values, counts = _degree_histogram(degrees[d])
+            datasets.append(cls._from_histogram(values, counts, path=path))
+        return datasets[0] if isinstance(direction, str) else tuple(datasets)
+
+    @classmethod
+    def from_csr(cls, indptr, indices=None, direction="out"):
+        """Create a degree-sequence dataset from a CSR adjacency structure.
+
+        Parameters
+        ----------
+        indptr : array_like
+            CSR row pointer array of length ``n_nodes + 1``
+            (e.g. ``scipy.sparse.csr_array.indptr``).
+        indices : array_like, optional
+            CSR column index array. Required for ``'in'`` and ``'total'``.
+        direction : {'in', 'out', 'total'}, default='out'
+            Which degree to extract. Row lengths are out-degrees, column
+            occurrences are in-degrees.
+
+        Returns
+        -------
+        TailData
+            Degree-sequence dataset stored as a ``(degree, count)`` histogram.
+            Nodes with zero degree are not included.
+        """
+        (direction,) = _check_directions(direction)
+        indptr = np.asarray(indptr)
+        out_degrees = np.diff(indptr).astype(np.int64)
+        if direction == "out":
+            degrees = out_degrees
+        else:
+            if indices is None:
+                raise ValueError(f"indices are required for direction={direction!r}")
+            degrees = np.bincount(np.asarray(indices), minlength=len(out_degrees))
+            if direction == "total":
+                degrees[: len(out_degrees)] += out_degrees
+        values, counts = _degree_histogram(degrees)
+        return cls._from_histogram(values, counts)
+
+    def _resolve_path(self):
+        """Resolve the file path of the dataset.
+
+        Returns
+        -------
+        str
+            Path to the dataset file.
 
         Raises
         ------
@@ -69,12 +611,16 @@ class TailData:
         if self.path is not None:
             # Use the provided custom path
             file_path = self.path
-            logging.info(f"Using custom path: {file_path}")
+            logger.info(f"Using custom path: {file_path}")
         else:
             # Use the package data directory with the provided name
-            data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-            file_path = os.path.join(data_dir, f"{self.name}.dat")
-            logging.info(f"Using package data path: {file_path}")
+            file_path = os.path.join(_PACKAGE_DATA_DIR, f"{self.name}.dat")
+            for _, extension, _ in _COMPRESSION_FORMATS:
+                if not os.path.exists(file_path) and os.path.exists(
+                    file_path + extension
+                ):
+                    file_path += extension
+            logger.info(f"Using package data path: {file_path}")
 
         # Check if the file exists
         if not os.path.exists(file_path):
@@ -84,24 +630,142 @@ class TailData:
                 raise FileNotFoundError(
                     f"Data file '{self.name}.dat' not found in package data directory."
                 )
+        return file_path
 
-        # Load the data from the file using the provided method
-        logging.info(f"Loading data from file: {file_path}")
-        with open(file_path) as file:
-            lines = file.readlines()
+    def _read(self):
+        """Read the dataset file, see :func:`read_data_file`."""
+        file_path = self._resolve_path()
+        logger.info(f"Loading data from file: {file_path}")
+        return read_data_file(file_path, chunk_size=self.chunk_size)
 
-        # Determine the total number of data points
-        N = sum(int(line.strip().split()[1]) for line in lines)
-        ordered_data = np.zeros(N)
-        current_index = 0
+    def load_counts(self):
+        """Load the ``(value, count)`` histogram from the dataset file.
 
-        # Populate the ordered_data array
-        for line in lines:
-            degree, count = line.strip().split()
-            ordered_data[current_index : current_index + int(count)] = float(degree)
-            current_index += int(count)
+        Returns
+        -------
+        values : numpy.ndarray
+            Values listed in the file, as float64. For files of raw samples,
+            the sorted unique values.
+        counts : numpy.ndarray
+            Number of occurrences of each value, as int64.
 
-        return ordered_data
+        Raises
+        ------
+        FileNotFoundError
+            If the specified dataset file cannot be found.
+        """
+        values, counts = self._read()
+        if counts is None:
+            return np.unique(values, return_counts=True)
+        return values, counts
+
+    def load_data(self):
+        """Load data from either a built-in dataset or a custom file path.
+
+        Returns
+        -------
+        numpy.ndarray
+            The loaded dataset as a numpy array.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the specified dataset file cannot be found.
+        """
+        values, counts = self._read()
+        if counts is None:
+            return values
+        return np.repeat(values, counts)
+
+    def _build_histogram(self):
+        """Compute `values` and `counts` from the dense data."""
+        self._values, self._counts = np.unique(self._data, return_counts=True)
+
+    @property
+    def values(self):
+        """numpy.ndarray: Values of the ``(value, count)`` histogram."""
+        if self._values is None:
+            self._build_histogram()
+        return self._values
+
+    @property
+    def counts(self):
+        """numpy.ndarray: Counts of the ``(value, count)`` histogram."""
+        if self._counts is None:
+            self._build_histogram()
+        return self._counts
+
+    @property
+    def data(self):
+        """numpy.ndarray: The dataset expanded to one entry per observation.
+
+        The array is materialized from `values` and `counts` on first access
+        and cached afterwards.
+        """
+        if self._data is None:
+            self._data = np.repeat(self._values, self._counts)
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        """Replace the observations; the histogram is recomputed on demand."""
+        data = np.asarray(data)
+        if data.ndim != 1:
+            raise ValueError(
+                f"Data must be a one-dimensional array, got shape {data.shape}"
+            )
+        self._data = data
+        self._values, self._counts = None, None
+
+    @property
+    def nbytes(self):
+        """int: Memory held by the dataset's arrays, in bytes."""
+        arrays = (self._data, self._values, self._counts)
+        return sum(a.nbytes for a in arrays if a is not None)
+
+    @property
+    def is_materialized(self):
+        """bool: Whether the dense :attr:`data` array has been built."""
+        return self._data is not None
+
+    @property
+    def n(self):
+        """int: Total number of observations."""
+        if self._counts is None:
+            return len(self._data)
+        return int(self._counts.sum())
+
+    @property
+    def n_unique(self):
+        """int: Number of distinct values."""
+        return int(np.unique(self.values[self.counts > 0]).size)
+
+    @property
+    def max_value(self):
+        """float: Largest observed value."""
+        if self._values is None:
+            return float(self._data.max())
+        return float(self._values[self._counts > 0].max())
+
+    def get_ccdf(self):
+        """Compute the CCDF directly from the histogram.
+
+        Equivalent to ``tail_methods.get_ccdf(self.data)`` without expanding
+        the data.
+
+        Returns
+        -------
+        uniques : numpy.ndarray
+            Unique values in decreasing order.
+        ccdf : numpy.ndarray
+            CCDF values corresponding to `uniques`.
+        """
+        present = self.counts > 0
+        uniques, inverse = np.unique(self.values[present], return_inverse=True)
+        counts = np.zeros(uniques.size, dtype=np.int64)
+        np.add.at(counts, inverse, self.counts[present])
+        cumprob = np.cumsum(counts).astype(np.double) / self.n
+        return uniques[::-1], (1.0 - cumprob)[::-1]
 
     def __repr__(self):
         """Return a string representation of the TailData object.
@@ -112,6 +776,437 @@ class TailData:
             String representation including the data source and length.
         """
         if self.path is not None:
-            return f"TailData(path='{self.path}', data_length={len(self.data)})"
+            return f"TailData(path='{self.path}', data_length={self.n})"
+        elif self.name is not None:
+            return f"TailData(name='{self.name}', data_length={self.n})"
         else:
-            return f"TailData(name='{self.name}', data_length={len(self.data)})"
+            return f"TailData(data_length={self.n})"
+
+
+def _sample_pareto(rng, size, xi):
+    """Pareto samples with x_min = 1 and tail index `xi`."""
+    return np.exp(xi * rng.standard_exponential(size))
+
+
+def _sample_student_t(rng, size, xi):
+    """Absolute Student-t samples with 1 / `xi` degrees of freedom."""
+    return np.abs(rng.standard_t(1.0 / xi, size))
+
+
+def _sample_frechet(rng, size, xi):
+    """Standard Fréchet samples with tail index `xi`."""
+    return rng.standard_exponential(size) ** (-xi)
+
+
+def _sample_zipf(rng, size, xi):
+    """Discrete power-law (Zipf) samples with exponent 1 + 1 / `xi`."""
+    return rng.zipf(1.0 + 1.0 / xi, size)
+
+
+_SAMPLERS = {
+    "pareto": (_sample_pareto, np.float64),
+    "student_t": (_sample_student_t, np.float64),
+    "frechet": (_sample_frechet, np.float64),
+    "zipf": (_sample_zipf, np.int64),
+}
+
+
+def _integer_histogram(sample, dense_limit=1 << 16):
+    """Histogram of non-negative integer samples.
+
+    Values below `dense_limit` (the bulk of a power law) are counted with
+    ``np.bincount``; only the sparse tail is sorted.
+    """
+    small = sample < dense_limit
+    small_counts = np.bincount(sample[small])
+    small_values = np.flatnonzero(small_counts)
+    large_values, large_counts = np.unique(sample[~small], return_counts=True)
+    return (
+        np.concatenate([small_values, large_values]),
+        np.concatenate([small_counts[small_values], large_counts]),
+    )
+
+
+def _merge_histograms(values, counts, new_values, new_counts):
+    """Merge two ``(value, count)`` histograms into one sorted histogram."""
+    merged, inverse = np.unique(
+        np.concatenate([values, new_values]), return_inverse=True
+    )
+    merged_counts = np.zeros(merged.size, dtype=np.int64)
+    np.add.at(merged_counts, inverse, np.concatenate([counts, new_counts]))
+    return merged, merged_counts
+
+
+def generate_samples(
+    distribution,
+    n,
+    xi=0.5,
+    seed=None,
+    chunk_size=1 << 20,
+    out=None,
+    histogram=False,
+    max_workers=None,
+):
+    """Generate heavy-tailed samples with a known tail index.
+
+    Samples are drawn in chunks of `chunk_size`. Each chunk has its own
+    random stream spawned from ``SeedSequence(seed)``, so the output only
+    depends on `seed` and `chunk_size`, not on the number of threads. Chunks
+    are drawn concurrently on a thread pool.
+
+    Supported distributions, all with tail index `xi` (ξ):
+
+    - ``'pareto'``: Pareto with x_min = 1, P(X > x) = x^(-1/ξ).
+    - ``'student_t'``: absolute value of a Student-t with 1/ξ degrees of freedom.
+    - ``'frechet'``: standard Fréchet, P(X <= x) = exp(-x^(-1/ξ)).
+    - ``'zipf'``: discrete power law P(X = k) ∝ k^(-(1 + 1/ξ)), k >= 1.
+
+    Parameters
+    ----------
+    distribution : {'pareto', 'student_t', 'frechet', 'zipf'}
+        Distribution to sample from.
+    n : int
+        Number of samples.
+    xi : float, default=0.5
+        Tail index ξ (> 0). The power-law exponent is γ = 1 + 1/ξ.
+    seed : None, int or numpy.random.SeedSequence, optional
+        Seed of the root ``SeedSequence``.
+    chunk_size : int, default=1048576
+        Number of samples drawn per chunk.
+    out : str, optional
+        Path of a ``.npy`` file to write the samples to. The file is filled
+        through a memory map, and the returned dataset is memory-mapped too.
+    histogram : bool, default=False
+        Whether to return a ``(value, count)`` histogram instead of the
+        samples. Only supported for the discrete ``'zipf'`` distribution.
+    max_workers : int, optional
+        Number of threads. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    TailData
+        Dataset wrapping the generated samples.
+
+    Examples
+    --------
+    >>> data = generate_samples('pareto', 10**7, xi=0.5, seed=42)
+    >>> degrees = generate_samples('zipf', 10**9, xi=0.7, seed=1, histogram=True)
+    """
+    if distribution not in _SAMPLERS:
+        raise ValueError(
+            f"distribution must be one of {sorted(_SAMPLERS)}, got {distribution!r}"
+        )
+    if xi <= 0:
+        raise ValueError("xi must be positive")
+    if histogram and distribution != "zipf":
+        raise ValueError("histogram output is only supported for 'zipf'")
+    if histogram and out is not None:
+        raise ValueError("'out' and 'histogram' cannot be combined")
+    sampler, dtype = _SAMPLERS[distribution]
+
+    starts = range(0, n, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+
+    if histogram:
+        dense = None
+    elif out is not None:
+        dense = np.lib.format.open_memmap(out, mode="w+", dtype=dtype, shape=(n,))
+    else:
+        dense = np.empty(n, dtype=dtype)
+
+    def draw(task):
+        start, chunk_seed = task
+        size = min(chunk_size, n - start)
+        sample = sampler(np.random.default_rng(chunk_seed), size, xi)
+        if dense is None:
+            return _integer_histogram(sample)
+        dense[start : start + size] = sample
+        return None
+
+    values = np.empty(0, dtype=dtype)
+    counts = np.empty(0, dtype=np.int64)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for chunk_histogram in executor.map(draw, zip(starts, seeds)):
+            if chunk_histogram is not None:
+                values, counts = _merge_histograms(values, counts, *chunk_histogram)
+
+    if histogram:
+        return TailData._from_histogram(values.astype(np.float64), counts)
+    if out is not None:
+        dense.flush()
+        del dense
+        return TailData.from_npy(out)
+    return TailData.from_array(dense)
+
+
+def _file_info(path):
+    """Return the size, format and compression of a data file.
+
+    Only the file header is read: the magic bytes of compressed text files
+    and the array header of ``.npy`` files, which also gives the number of
+    values and their dtype.
+    """
+    info = {"path": path, "size": os.path.getsize(path), "compression": None}
+    with open(path, "rb") as file:
+        if path.endswith(".npy"):
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, _, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, _, dtype = np.lib.format.read_array_header_2_0(file)
+            info.update(format="npy", n=int(np.prod(shape)), dtype=str(dtype))
+            return info
+        head = file.read(6)
+    info["format"] = "text"
+    for magic, extension, _ in _COMPRESSION_FORMATS:
+        if path.endswith(extension) or head.startswith(magic):
+            info["compression"] = extension[1:]
+            break
+    return info
+
+
+def _file_signature(path):
+    """Return the size and modification time identifying a file's contents."""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _dataset_name(filename):
+    """Return the dataset name of a catalog file, or None if not a dataset."""
+    if filename.endswith(".npy"):
+        return filename[: -len(".npy")]
+    for _, extension, _ in _COMPRESSION_FORMATS:
+        if filename.endswith(extension):
+            filename = filename[: -len(extension)]
+            break
+    if filename.endswith(".dat"):
+        return filename[: -len(".dat")]
+    return None
+
+
+class DatasetCatalog:
+    """Catalog of datasets stored in one or more directories.
+
+    Datasets are addressed by name (the file name without the ``.dat``,
+    ``.dat.gz``, ``.dat.bz2``, ``.dat.xz`` or ``.npy`` extension). They are
+    loaded on first access on a thread pool and kept in a least-recently-used
+    cache bounded by `max_bytes`. If a name appears in several directories,
+    the first directory wins.
+
+    Parameters
+    ----------
+    directories : str or list of str, optional
+        Directories to scan. Defaults to the package's built-in data directory.
+    max_bytes : int, default=1073741824
+        Upper bound on the memory held by cached datasets (see
+        :attr:`TailData.nbytes`). The most recently used dataset is always
+        kept, even if it alone exceeds the bound.
+    max_workers : int, default=4
+        Number of threads used to load datasets.
+    chunk_size : int, default=1048576
+        Number of bytes parsed at once when streaming text files.
+
+    Examples
+    --------
+    >>> catalog = DatasetCatalog(['/data/degrees'])
+    >>> catalog.prefetch(['as-caida', 'libimseti'])
+    >>> data = catalog['as-caida'].data
+    """
+
+    def __init__(
+        self, directories=None, max_bytes=1 << 30, max_workers=4, chunk_size=1 << 20
+    ):
+        if directories is None:
+            directories = [_PACKAGE_DATA_DIR]
+        elif isinstance(directories, (str, os.PathLike)):
+            directories = [directories]
+        self.directories = [os.fspath(d) for d in directories]
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._pending = {}
+        self._stats = {}
+        self._paths = {}
+        self.refresh()
+
+    def refresh(self):
+        """Rescan the directories for datasets."""
+        paths = {}
+        for directory in self.directories:
+            for filename in sorted(os.listdir(directory)):
+                name = _dataset_name(filename)
+                if name is None:
+                    continue
+                if name in paths:
+                    logger.info(
+                        f"Dataset '{name}' in {directory} is shadowed by {paths[name]}"
+                    )
+                    continue
+                paths[name] = os.path.join(directory, filename)
+        with self._lock:
+            self._paths = paths
+
+    @property
+    def names(self):
+        """list of str: Names of the available datasets."""
+        return sorted(self._paths)
+
+    def path(self, name):
+        """Return the file path of dataset `name`."""
+        try:
+            return self._paths[name]
+        except KeyError:
+            raise KeyError(f"Dataset '{name}' not found in catalog") from None
+
+    def _load(self, name):
+        """Load dataset `name` and insert it into the cache."""
+        try:
+            path = self.path(name)
+            signature = _file_signature(path)
+            if path.endswith(".npy"):
+                dataset = TailData.from_npy(path)
+            else:
+                dataset = TailData(path=path, chunk_size=self.chunk_size)
+            dataset.name = name
+            with self._lock:
+                if dataset._counts is not None:
+                    # cheap on the (value, count) histogram of text files
+                    self._stats[name] = (
+                        signature,
+                        {
+                            "n": dataset.n,
+                            "n_unique": dataset.n_unique,
+                            "max_value": dataset.max_value,
+                        },
+                    )
+                self._cache[name] = dataset
+                self._evict()
+            return dataset
+        finally:
+            with self._lock:
+                self._pending.pop(name, None)
+
+    def _evict(self):
+        """Drop least recently used datasets until the cache fits `max_bytes`."""
+        total = sum(dataset.nbytes for dataset in self._cache.values())
+        while total > self.max_bytes and len(self._cache) > 1:
+            _, dataset = self._cache.popitem(last=False)
+            total -= dataset.nbytes
+
+    def _submit(self, name):
+        """Return a future for dataset `name`, scheduling a load if needed."""
+        self.path(name)
+        with self._lock:
+            if name in self._cache:
+                self._cache.move_to_end(name)
+                future = Future()
+                future.set_result(self._cache[name])
+                return future
+            if name not in self._pending:
+                self._pending[name] = self._executor.submit(self._load, name)
+            return self._pending[name]
+
+    def get(self, name):
+        """Return dataset `name`, loading it if it is not cached.
+
+        Parameters
+        ----------
+        name : str
+            Dataset name.
+
+        Returns
+        -------
+        TailData
+            The dataset.
+
+        Raises
+        ------
+        KeyError
+            If no dataset of that name exists in the catalog.
+        """
+        return self._submit(name).result()
+
+    def prefetch(self, names):
+        """Start loading datasets in the background.
+
+        Parameters
+        ----------
+        names : iterable of str
+            Dataset names.
+
+        Returns
+        -------
+        list of concurrent.futures.Future
+            Futures resolving to the datasets, in the order of `names`.
+        """
+        return [self._submit(name) for name in names]
+
+    def info(self, name):
+        """Return metadata of dataset `name` without loading it.
+
+        The size, format and compression are read from the file and its
+        header. The statistics ``n``, ``n_unique`` and ``max_value`` are
+        computed in one streaming pass over the file (through a memory map
+        for ``.npy`` files) that holds only the distinct values, and are
+        remembered until the file changes. The dataset is neither loaded
+        nor cached, and the cache is left untouched.
+
+        Returns
+        -------
+        dict
+            ``path``, ``size`` in bytes, ``format`` (``"text"`` or
+            ``"npy"``), ``compression`` (None, ``"gz"``, ``"bz2"`` or
+            ``"xz"``), ``n``, ``n_unique`` and ``max_value`` of the dataset,
+            and the ``dtype`` of ``.npy`` files.
+        """
+        path = self.path(name)
+        info = _file_info(path)
+        signature = _file_signature(path)
+        with self._lock:
+            signed_stats = self._stats.get(name)
+        if signed_stats is None or signed_stats[0] != signature:
+            if info["format"] == "npy":
+                blocks = _iter_npy_blocks(path)
+            else:
+                blocks = _iter_data_blocks(path, self.chunk_size)
+            signed_stats = (signature, _summary_stats(blocks))
+            with self._lock:
+                self._stats[name] = signed_stats
+        info.update(signed_stats[1])
+        return info
+
+    def is_cached(self, name):
+        """Return whether dataset `name` is currently in the cache."""
+        with self._lock:
+            return name in self._cache
+
+    def close(self):
+        """Shut down the loader thread pool."""
+        self._executor.shutdown(wait=True)
+
+    def __getitem__(self, name):
+        return self.get(name)
+
+    def __contains__(self, name):
+        return name in self._paths
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        """Return a string representation of the DatasetCatalog object."""
+        return (
+            f"DatasetCatalog(directories={self.directories}, "
+            f"datasets={len(self)}, cached={len(self._cache)})"
+        )
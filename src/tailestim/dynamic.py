@@ -0,0 +1,268 @@
+"""Incremental degree distribution of dynamic graphs."""
+
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from .estimators.base import BaseTailEstimator
+from .estimators.hill import HillEstimator
+from .estimators.result import TailEstimatorResult
+from .estimators.tail_methods import moments_xi
+
+
+class DegreeTracker:
+    """Degree distribution of a graph under edge insertions and deletions.
+
+    Edge events update the per-node degrees and the ``(degree, count)``
+    histogram in place, at a cost proportional to the number of events.
+    The sorted degree sequence is never materialized for the Hill, moments
+    and Pickands estimates: order statistics and the sums of the logs of
+    the k largest degrees are read from the cumulative sums of the
+    histogram, which are rebuilt lazily in O(number of distinct degrees)
+    after a change. Nodes are integer ids; nodes of degree 0 do not enter
+    the distribution.
+
+    Parameters
+    ----------
+    degrees : np.ndarray, optional
+        Initial degree of every node, indexed by node id.
+
+    Examples
+    --------
+    >>> tracker = DegreeTracker()
+    >>> tracker.add_edges(edges)
+    >>> tracker.select_k_star()
+    >>> tracker.remove_edges(removed)
+    >>> tracker.hill()
+    """
+
+    def __init__(self, degrees: Optional[np.ndarray] = None):
+        self.degrees = np.zeros(0, dtype=np.int64)
+        self.counts = np.zeros(1, dtype=np.int64)
+        self.k_star = None
+        self._cache = None
+        if degrees is not None:
+            degrees = np.asarray(degrees, dtype=np.int64)
+            if np.any(degrees < 0):
+                raise ValueError("Degrees must be non-negative.")
+            self.degrees = degrees.copy()
+            self.counts = np.bincount(degrees, minlength=1).astype(np.int64)
+
+    def update(
+        self,
+        inserted: Optional[np.ndarray] = None,
+        deleted: Optional[np.ndarray] = None,
+    ) -> None:
+        """Apply a batch of edge insertions and deletions.
+
+        Parameters
+        ----------
+        inserted : np.ndarray, optional
+            Inserted edges as an array of shape (m, 2) of node ids.
+        deleted : np.ndarray, optional
+            Deleted edges as an array of shape (m, 2) of node ids.
+        """
+        endpoints = []
+        signs = []
+        for edges, sign in ((inserted, 1), (deleted, -1)):
+            if edges is not None:
+                nodes = np.asarray(edges, dtype=np.int64).ravel()
+                endpoints.append(nodes)
+                signs.append(np.full(len(nodes), sign, dtype=np.int64))
+        if not endpoints or not sum(len(nodes) for nodes in endpoints):
+            return
+        endpoints = np.concatenate(endpoints)
+        if np.any(endpoints < 0):
+            raise ValueError("Node ids must be non-negative.")
+        nodes, inverse = np.unique(endpoints, return_inverse=True)
+        delta = np.zeros(len(nodes), dtype=np.int64)
+        np.add.at(delta, inverse, np.concatenate(signs))
+
+        if nodes[-1] >= len(self.degrees):
+            size = max(int(nodes[-1]) + 1, 2 * len(self.degrees))
+            self.counts[0] += size - len(self.degrees)
+            self.degrees = np.concatenate(
+                (self.degrees, np.zeros(size - len(self.degrees), dtype=np.int64))
+            )
+        old = self.degrees[nodes]
+        new = old + delta
+        if np.any(new < 0):
+            raise ValueError("Deleted edges are not present in the graph.")
+        self.degrees[nodes] = new
+        if new.max() >= len(self.counts):
+            size = max(int(new.max()) + 1, 2 * len(self.counts))
+            self.counts = np.concatenate(
+                (self.counts, np.zeros(size - len(self.counts), dtype=np.int64))
+            )
+        np.subtract.at(self.counts, old, 1)
+        np.add.at(self.counts, new, 1)
+        self._cache = None
+
+    def add_edges(self, edges: np.ndarray) -> None:
+        """Insert edges given as an array of shape (m, 2) of node ids."""
+        self.update(inserted=edges)
+
+    def remove_edges(self, edges: np.ndarray) -> None:
+        """Delete edges given as an array of shape (m, 2) of node ids."""
+        self.update(deleted=edges)
+
+    @property
+    def n(self) -> int:
+        """Number of nodes with positive degree."""
+        return int(self.counts[1:].sum())
+
+    def histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Distinct positive degrees in decreasing order and their counts.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Degrees and counts.
+        """
+        return self._tables()[:2]
+
+    def ordered_data(self) -> np.ndarray:
+        """Degree sequence in decreasing order, expanded from the histogram.
+
+        Returns
+        -------
+        np.ndarray
+            Positive degrees in decreasing order.
+        """
+        values, counts = self.histogram()
+        return np.repeat(values.astype(np.float64), counts)
+
+    def _tables(self):
+        """Histogram and cumulative tables in decreasing order of degree."""
+        if self._cache is None:
+            values = np.flatnonzero(self.counts[1:])[::-1] + 1
+            counts = self.counts[values]
+            logs = np.log(values, dtype=np.float64)
+            # cumulative tables with a leading zero: entry j covers the
+            # j largest distinct degrees
+            cum_counts = np.concatenate(([0], np.cumsum(counts)))
+            cum_logs_1 = np.concatenate(([0.0], np.cumsum(counts * logs)))
+            cum_logs_2 = np.concatenate(([0.0], np.cumsum(counts * logs * logs)))
+            self._cache = (values, counts, logs, cum_counts, cum_logs_1, cum_logs_2)
+        return self._cache
+
+    def _order_statistics(self, i):
+        """Index into the histogram of the i-th largest degree (1-based)."""
+        cum_counts = self._tables()[3]
+        return np.searchsorted(cum_counts, i, side="left") - 1
+
+    def _check_k(self, k, k_max):
+        """Order statistics as an integer array, defaulting to k_star."""
+        if k is None:
+            if self.k_star is None:
+                raise ValueError(
+                    "No k_star selected yet. Call select_k_star() or specify k."
+                )
+            k = self.k_star
+        k = np.asarray(k, dtype=np.int64)
+        if np.any((k < 1) | (k > k_max)):
+            raise ValueError(f"Order statistics k must lie in [1, {k_max}].")
+        return k
+
+    def _log_moments(self, k):
+        """1st and 2nd moments of the log-excesses over X_(k+1)."""
+        _, _, logs, cum_counts, cum_logs_1, cum_logs_2 = self._tables()
+        j = self._order_statistics(k)
+        # sums over the k largest degrees: complete bins above the k-th
+        # largest degree plus the part of its bin
+        rest = k - cum_counts[j]
+        sum_1 = cum_logs_1[j] + rest * logs[j]
+        sum_2 = cum_logs_2[j] + rest * logs[j] * logs[j]
+        log_threshold = logs[self._order_statistics(k + 1)]
+        M1 = sum_1 / k - log_threshold
+        M2 = sum_2 / k - 2.0 * log_threshold * sum_1 / k + log_threshold**2
+        return M1, M2
+
+    def hill(
+        self, k: Optional[Union[int, np.ndarray]] = None
+    ) -> Union[float, np.ndarray]:
+        """Hill estimates at the given order statistics.
+
+        Parameters
+        ----------
+        k : int or np.ndarray, optional
+            Order statistics in [1, n - 1]. Defaults to ``k_star``.
+
+        Returns
+        -------
+        float or np.ndarray
+            Hill estimates of the tail index.
+        """
+        k = self._check_k(k, self.n - 1)
+        return self._log_moments(k)[0][()]
+
+    def moments(
+        self, k: Optional[Union[int, np.ndarray]] = None
+    ) -> Union[float, np.ndarray]:
+        """Moments (Dekkers-Einmahl-de Haan) estimates at the given order statistics.
+
+        Parameters
+        ----------
+        k : int or np.ndarray, optional
+            Order statistics in [1, n - 1]. Defaults to ``k_star``.
+
+        Returns
+        -------
+        float or np.ndarray
+            Moments estimates of the tail index.
+        """
+        k = self._check_k(k, self.n - 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return moments_xi(*self._log_moments(k))[()]
+
+    def pickands(
+        self, k: Optional[Union[int, np.ndarray]] = None
+    ) -> Union[float, np.ndarray]:
+        """Pickands estimates at the given order statistics.
+
+        Parameters
+        ----------
+        k : int or np.ndarray, optional
+            Order statistics in [1, floor(n/4)]. Defaults to ``k_star``.
+
+        Returns
+        -------
+        float or np.ndarray
+            Pickands estimates of the tail index. Ties between the
+            integer degrees give infinite or undefined estimates.
+        """
+        k = self._check_k(k, self.n // 4)
+        values = self._tables()[0].astype(np.float64)
+        Z_k, Z_2k, Z_4k = (values[self._order_statistics(i * k)] for i in (1, 2, 4))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return ((1.0 / np.log(2)) * np.log((Z_k - Z_2k) / (Z_2k - Z_4k)))[()]
+
+    def select_k_star(
+        self, estimator: Optional[BaseTailEstimator] = None
+    ) -> TailEstimatorResult:
+        """Select k_star by a full bootstrap fit of the current degrees.
+
+        The ordered degree sequence is expanded from the histogram, so no
+        sort is needed. The selected k_star becomes the default order
+        statistic of ``hill``, ``moments`` and ``pickands`` until the next
+        selection.
+
+        Parameters
+        ----------
+        estimator : BaseTailEstimator, optional
+            Estimator used for the selection. Defaults to a
+            ``HillEstimator`` with double-bootstrap.
+
+        Returns
+        -------
+        TailEstimatorResult
+            Result of the estimator.
+        """
+        if estimator is None:
+            estimator = HillEstimator()
+        estimator._fit_ordered(self.ordered_data())
+        result = estimator.get_result()
+        if not hasattr(result, "k_star_"):
+            raise ValueError("The estimator did not select k_star.")
+        self.k_star = int(result.k_star_)
+        return result
@@ -1,11 +1,14 @@
 """Estimators for tail index estimation."""
 
 from .base import BaseTailEstimator
+from .cost import calibrate
 from .estimator_set import TailEstimatorSet
 from .hill import HillEstimator
 from .kernel import KernelTypeEstimator
 from .moments import MomentsEstimator
 from .pickands import PickandsEstimator
+from .pot import POTEstimator
+from .power_law import PowerLawEstimator, goodness_of_fit
 from .smooth_hill import SmoothHillEstimator
 
 __all__ = [
@@ -13,7 +16,11 @@ __all__ = [
     "HillEstimator",
     "KernelTypeEstimator",
     "MomentsEstimator",
+    "POTEstimator",
     "PickandsEstimator",
+    "PowerLawEstimator",
     "SmoothHillEstimator",
     "TailEstimatorSet",
+    "calibrate",
+    "goodness_of_fit",
 ]
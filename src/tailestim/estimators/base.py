@@ -1,12 +1,22 @@
 """Base class for tail index estimation."""
 
+import copy
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Tuple, Union
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 from numpy.random import BitGenerator, Generator, RandomState, SeedSequence
 
+from .cost import make_plan, sort_phase
 from .result import TailEstimatorResult
+from .tail_methods import PrefixSumCache, merge_descending
+
+
+class _FitStopped(Exception):
+    """Raised in the fitting thread when its consumer stops."""
 
 
 class BaseTailEstimator(ABC):
@@ -23,22 +33,57 @@ class BaseTailEstimator(ABC):
         May not be applicable for all methods.
     base_seed: None | SeedSequence | BitGenerator | Generator | RandomState, default=None
         Base random seed for reproducibility of bootstrap. Only used for methods with bootstrap.
+    two_tailed : bool, default=False
+        Whether to estimate both tails of signed data. The data are sorted
+        once; the upper tail is formed by the positive values and the lower
+        tail by the magnitudes of the negative values, both as views of the
+        same sorted array. Estimators with a bootstrap fit both tails with
+        one random seed drawn from ``base_seed``, so that the thresholds of
+        the two tails are selected from common random numbers.
+        ``get_result`` returns the paired result with ``upper_`` and
+        ``lower_``.
     **kwargs : dict
         Additional parameters specific to each estimation method.
     """
 
+    # fallback argument of the estimating function, whose result, from
+    # the same estimates, stands in under a deadline until the first
+    # block of bootstrap replicates is drawn
+    _deadline_fallback: ClassVar[Any] = None
+
+    # attributes written by a fit, adopted from the fitted copy at once
+    _fit_state: ClassVar[Tuple[str, ...]] = (
+        "ordered_data",
+        "results",
+        "upper_",
+        "lower_",
+        "cuts_",
+        "_prefix_cache",
+    )
+
     def __init__(
         self,
         bootstrap: bool = True,
-        base_seed: Union[
-            None, SeedSequence, BitGenerator, Generator, RandomState
+        base_seed: Optional[
+            Union[SeedSequence, BitGenerator, Generator, RandomState]
         ] = None,
+        two_tailed: bool = False,
         **kwargs,
     ):
         self.bootstrap = bootstrap
         self.base_seed = base_seed
+        self.two_tailed = two_tailed
         self.kwargs = kwargs
+        self.ordered_data = None
         self.results = None
+        self.upper_ = None
+        self.lower_ = None
+        self.cuts_ = None
+        self._progress = None
+        self._interrupt = None
+        self._fallback = None
+        self._prefix_cache = None
+        self._warm_start = None
 
     @abstractmethod
     def _estimate(self, ordered_data: np.ndarray) -> Tuple:
@@ -56,19 +101,468 @@ class BaseTailEstimator(ABC):
         """
         pass
 
-    def fit(self, data: np.ndarray) -> None:
+    def fit(self, data: np.ndarray, deadline: Optional[float] = None) -> None:
         """Fit the estimator to the data.
 
         Parameters
         ----------
         data : np.ndarray
             Input data array (e.g., degree sequence). The data will automatically be sorted in decreasing order.
+        deadline : float, optional
+            Time budget of the fit in seconds. The double-bootstrap then
+            draws as many blocks of ``adaptive_block`` replicates as fit in
+            the budget, and the result of the replicates drawn so far is
+            kept when it runs out. If no block is drawn in time, the Hill
+            and moments estimators fall back to a closed-form threshold
+            and the kernel-type estimator to its estimates without
+            bootstrap, both selected from the estimates before any
+            resampling. What was cut is recorded in ``cuts_``. The sort
+            and the passes over the data needed by any result are always
+            completed; the bootstrap stops at the deadline, at the latest
+            after the resample in progress, without being waited for.
+
+        Notes
+        -----
+        The fit runs on a private copy of the estimator, whose results are
+        adopted at the end in one step, so fits of an estimator shared
+        between threads do not mix their states. To get the result of
+        each of concurrent fits, use ``estimate`` instead.
         """
+        self._adopt(self._fitted(data, deadline))
+
+    def estimate(
+        self, data: np.ndarray, deadline: Optional[float] = None
+    ) -> TailEstimatorResult:
+        """Fit a copy of the estimator and return its result.
+
+        The estimator itself is not modified, so one instance can serve
+        concurrent calls from several threads. For reproducible results
+        across threads, ``base_seed`` should be an int or a SeedSequence
+        rather than a shared Generator.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            Input data array (e.g., degree sequence). The data will automatically be sorted in decreasing order.
+        deadline : float, optional
+            Time budget of the fit in seconds (see ``fit``).
+
+        Returns
+        -------
+        TailEstimatorResult
+            Result of the fit, whose ``estimator`` is the fitted copy.
+
+        Examples
+        --------
+        >>> hill = HillEstimator(base_seed=0)
+        >>> with ThreadPoolExecutor() as executor:
+        ...     results = list(executor.map(hill.estimate, datasets))
+        """
+        return self._fitted(data, deadline).get_result()
+
+    def _fitted(
+        self, data: np.ndarray, deadline: Optional[float] = None
+    ) -> "BaseTailEstimator":
+        """Fit a copy of the estimator to the data.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            Input data array.
+        deadline : float, optional
+            Time budget of the fit in seconds.
+
+        Returns
+        -------
+        BaseTailEstimator
+            The fitted copy.
+        """
+        end = None if deadline is None else time.monotonic() + deadline
+        fitted = copy.copy(self)
+        fitted._progress = None
+        fitted._prefix_cache = None
+        if self.two_tailed:
+            fitted._fit_two_tailed(data, end)
+            return fitted
         ordered_data = np.sort(data)[
             ::-1
         ]  # Each estimating functions require the data to be in decreasing order
+        if end is None:
+            # keep the prefix sums of the fit for a later update
+            fitted._prefix_cache = PrefixSumCache()
+            fitted._fit_ordered(ordered_data)
+        else:
+            fitted._fit_until(ordered_data, end)
+        return fitted
+
+    def _adopt(self, fitted: "BaseTailEstimator") -> None:
+        """Take over the state of a fitted copy of the estimator."""
+        self.__dict__.update({name: fitted.__dict__[name] for name in self._fit_state})
+
+    def update(self, new_data: np.ndarray, warm_start: bool = False) -> None:
+        """Refit the estimator after appending new observations to its data.
+
+        The sorted new values are merged into the stored ordered data in
+        O(n + m), without sorting the data again. The Hill and moments
+        estimators keep the log prefix sums of their estimates between
+        fits and updates, and recompute them only from the first order
+        statistic changed by the new values on (from its block, with a
+        ``prefix_block_size``). The result is that of ``fit`` on the
+        concatenated data.
+
+        Parameters
+        ----------
+        new_data : np.ndarray
+            New observations, in any order.
+        warm_start : bool, default=False
+            Whether to start the double-bootstrap of the Hill, moments and
+            kernel-type estimators from the AMSE minima of the previous
+            fit. The replicates are then drawn in blocks of
+            ``adaptive_block``, and drawing stops after the first block if
+            both minima moved by at most ``adaptive_tol`` and the averaged
+            AMSE is resolved to that tolerance (see ``adaptive``), so the
+            result is no longer that of ``fit``.
+
+        Raises
+        ------
+        ValueError
+            If the estimator is not fitted yet or is two-tailed.
+
+        Examples
+        --------
+        >>> hill = HillEstimator(base_seed=0)
+        >>> hill.fit(data)
+        >>> hill.update(new_data, warm_start=True)
+        """
+        if self.two_tailed:
+            raise ValueError("update() is not supported for two-tailed estimators.")
+        if self.ordered_data is None:
+            raise ValueError("Model not fitted yet. Call fit() first.")
+        ordered_data, first_changed = merge_descending(self.ordered_data, new_data)
+        fitted = copy.copy(self)
+        fitted._progress = None
+        fitted._prefix_cache = (
+            PrefixSumCache()
+            if self._prefix_cache is None
+            else self._prefix_cache.changed(first_changed)
+        )
+        if warm_start:
+            fitted._warm_start = self._amse_minima()
+        fitted._fit_ordered(ordered_data)
+        self._adopt(fitted)
+
+    def _amse_minima(self) -> Optional[Tuple[float, float]]:
+        """Fractions of order statistics of the AMSE minima of the last fit.
+
+        Returns
+        -------
+        Tuple[float, float] or None
+            Minima of the 1st and 2nd bootstrap levels, or None if the
+            estimator has no double-bootstrap.
+        """
+        return None
+
+    def fit_iter(self, data: np.ndarray) -> Iterator[TailEstimatorResult]:
+        """Fit the estimator progressively, yielding intermediate results.
+
+        For the double-bootstrap of the Hill, moments and kernel-type
+        estimators, a snapshot is yielded after every block of
+        ``adaptive_block`` replicates per bootstrap level, with the running
+        AMSE curves, ``k1``, ``k2`` and ``k_star`` of the replicates drawn
+        so far. The last snapshot is the result of ``fit`` with the same
+        parameters. Other estimators yield their result once.
+
+        The fit runs on a background thread that stays at most one block
+        ahead of the consumer. The consumer can stop at any point: the
+        estimator then keeps the latest snapshot as its result.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            Input data array (e.g., degree sequence). The data will automatically be sorted in decreasing order.
+
+        Yields
+        ------
+        TailEstimatorResult
+            Result of the replicates drawn so far.
+
+        Examples
+        --------
+        >>> hill = HillEstimator(r_bootstrap=1000, base_seed=0)
+        >>> for result in hill.fit_iter(data):
+        ...     if result.k_star_ == last_k_star:
+        ...         break
+        ...     last_k_star = result.k_star_
+        """
+        if self.two_tailed:
+            self.fit(data)
+            yield self.get_result()
+            return
+        ordered_data = np.sort(data)[::-1]
+        fitted = copy.copy(self)
+        fitted._prefix_cache = None
+        states, stop, worker = fitted._start_worker(ordered_data)
+        fitted.ordered_data = ordered_data
+        fitted.cuts_ = None
+        try:
+            while True:
+                kind, results = states.get()
+                if kind == "error":
+                    raise results
+                fitted.results = results
+                self._adopt(fitted)
+                yield self.get_result()
+                if kind == "final":
+                    return
+        finally:
+            stop.set()
+            worker.join()
+
+    def _start_worker(self, ordered_data):
+        """Run the fit on a background thread that reports its states.
+
+        States are ``(kind, results)`` tuples put on a queue of size one:
+        the result of the ``_fallback`` argument before any resampling
+        ("fallback"), the intermediate results of the double-bootstrap
+        after every block of replicates ("partial"), the final results
+        ("final") or a raised exception ("error"). Once the stop event is
+        set, the thread ends before its next resample instead of blocking
+        on the queue.
+
+        Parameters
+        ----------
+        ordered_data : np.ndarray
+            Data array in decreasing order.
+
+        Returns
+        -------
+        Tuple
+            The queue of states, the stop event and the thread.
+        """
+        states = queue.Queue(maxsize=1)
+        stop = threading.Event()
+
+        def put(state):
+            while not stop.is_set():
+                try:
+                    states.put(state, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+            raise _FitStopped
+
+        def progress(results):
+            # the fallback is the only state without replicates
+            put(("partial" if results[-1] else "fallback", results))
+
+        def interrupt():
+            if stop.is_set():
+                raise _FitStopped
+
+        def estimate():
+            try:
+                put(("final", self._estimate(ordered_data)))
+            except _FitStopped:
+                pass
+            except BaseException as exc:
+                try:
+                    put(("error", exc))
+                except _FitStopped:
+                    pass
+
+        self._progress = progress
+        self._interrupt = interrupt
+        worker = threading.Thread(target=estimate, daemon=True)
+        worker.start()
+        return states, stop, worker
+
+    def _fit_until(self, ordered_data: np.ndarray, end: float) -> None:
+        """Fit data in decreasing order, keeping the latest state at a deadline.
+
+        The fitting thread first reports the result of the
+        ``_deadline_fallback`` argument, from the estimates needed by any
+        result, which is waited for even past the deadline. The thread is
+        then stopped at the deadline before its next resample, and not
+        joined.
+
+        Parameters
+        ----------
+        ordered_data : np.ndarray
+            Data array in decreasing order.
+        end : float
+            Deadline as a ``time.monotonic()`` value.
+        """
+        if not self.bootstrap or self._deadline_fallback is None:
+            # nothing to cut: the estimates are needed by any result
+            self._fit_ordered(ordered_data)
+            self.cuts_ = []
+            return
+        self._fallback = self._deadline_fallback
+        states, stop, _worker = self._start_worker(ordered_data)
+        self.ordered_data = ordered_data
+        kind, results = None, None
+        try:
+            while kind != "final":
+                try:
+                    state = states.get(
+                        timeout=None
+                        if kind is None
+                        else max(0.0, end - time.monotonic())
+                    )
+                except queue.Empty:
+                    break
+                if state[0] == "error":
+                    raise state[1]
+                kind, results = state
+        finally:
+            stop.set()
+            self._progress = self._interrupt = self._fallback = None
+        self.results = results
+        if kind == "fallback":
+            self.cuts_ = ["bootstrap"]
+        elif kind == "partial":
+            # a complete first round is cut in the false minimum retries
+            complete = results[-1] >= self.r_bootstrap
+            self.cuts_ = ["retries" if complete else "replicates"]
+        else:
+            self.cuts_ = []
+
+    def _fit_ordered(self, ordered_data: np.ndarray) -> None:
+        """Fit the estimator to data that is already in decreasing order.
+
+        Parameters
+        ----------
+        ordered_data : np.ndarray
+            Data array in decreasing order. It is stored without a copy.
+        """
+        self.ordered_data = ordered_data
+        self.cuts_ = None
         self.results = self._estimate(ordered_data)
 
+    def _fit_two_tailed(self, data: np.ndarray, end: Optional[float] = None) -> None:
+        """Fit the upper and the lower tail of signed data from a single sort.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            Input data array with positive and negative values.
+        end : float, optional
+            Deadline as a ``time.monotonic()`` value, split evenly between
+            the tails that remain to be fitted.
+        """
+        magnitudes = np.sort(data)
+        n_negative = np.searchsorted(magnitudes, 0, side="left")
+        n_nonpositive = np.searchsorted(magnitudes, 0, side="right")
+        # |x| decreases over the negative values and increases over the
+        # positive ones, so both tails are decreasing views
+        np.abs(magnitudes, out=magnitudes)
+        tails = (magnitudes[n_nonpositive:][::-1], magnitudes[:n_negative])
+        if min(len(tail) for tail in tails) < 2:
+            raise ValueError(
+                "Two-tailed estimation requires at least two positive and two negative values."
+            )
+
+        # common random numbers: both tails resample from the same seed
+        seed = self.base_seed
+        if not isinstance(seed, (int, np.integer, SeedSequence)):
+            seed = int(np.random.default_rng(seed).integers(0, 2**63))
+
+        fitted = []
+        for i, tail in enumerate(tails):
+            estimator = copy.copy(self)
+            estimator.two_tailed = False
+            estimator.base_seed = seed
+            if end is None:
+                estimator._fit_ordered(tail)
+            else:
+                now = time.monotonic()
+                estimator._fit_until(tail, now + (end - now) / (len(tails) - i))
+            fitted.append(estimator)
+        self.upper_, self.lower_ = fitted
+        self.results = (self.upper_.results, self.lower_.results)
+
+    def plan(
+        self, n: int, coefficients: Optional[Dict[str, float]] = None
+    ) -> TailEstimatorResult:
+        """Predict the cost of a fit to n values without running it.
+
+        The fit is broken into phases (the sort, the estimates for all
+        order statistics, every bootstrap level, ...) whose work is counted
+        in units of a few kinds of operations and priced by coefficients
+        measured with ``calibrate``. In adaptive mode, ``r_bootstrap``
+        replicates are planned, the upper bound; the resampling retries
+        after a false AMSE minimum are not planned.
+
+        Parameters
+        ----------
+        n : int
+            Number of values of the data.
+        coefficients : dict, optional
+            Seconds per unit of work of every kind of operation. Defaults
+            to the coefficients of the last ``calibrate``.
+
+        Returns
+        -------
+        TailEstimatorResult
+            With the total work ``cost_``, the predicted run time
+            ``seconds_``, the peak memory ``memory_`` in bytes and the
+            breakdown ``phases_`` with the cost, seconds and working memory
+            of every phase.
+
+        Examples
+        --------
+        >>> plan = HillEstimator(r_bootstrap=1000).plan(10**6)
+        >>> plan.seconds_, plan.memory_
+        >>> plan.phases_.bootstrap_1
+        """
+        if self.two_tailed:
+            # one sort, then the phases of each tail of about n / 2 values
+            phases = [sort_phase(n)]
+            for name, size in (("upper", n - n // 2), ("lower", n // 2)):
+                phases += [
+                    (f"{name}_{phase[0]}", *phase[1:])
+                    for phase in self._phases(size)[1:]
+                ]
+        else:
+            phases = self._phases(n)
+        return make_plan(phases, n, coefficients, estimator=self)
+
+    def _phases(self, n: int) -> List[Tuple]:
+        """Phases of a fit to n values, starting with the sort.
+
+        Parameters
+        ----------
+        n : int
+            Number of values of the data.
+
+        Returns
+        -------
+        List[Tuple]
+            Name, work per kind of operation, working and retained bytes of
+            every phase (see ``cost.make_plan``).
+        """
+        return [sort_phase(n)]
+
+    def _two_tailed_result(self) -> TailEstimatorResult:
+        """Get the paired result of a two-tailed fit.
+
+        Returns
+        -------
+        TailEstimatorResult
+            With the results of the upper tail ``upper_`` and of the lower
+            tail ``lower_``, the latter in terms of the magnitudes of the
+            negative values.
+        """
+        if self.results is None:
+            raise ValueError("Model not fitted yet. Call fit() first.")
+        return TailEstimatorResult(
+            {
+                "estimator": self,
+                "upper_": self.upper_.get_result(),
+                "lower_": self.lower_.get_result(),
+            }
+        )
+
     @abstractmethod
     def get_params(self) -> Dict[str, Any]:
         """Get the parameters of the estimator.
@@ -3,14 +3,20 @@ import time
 
 import numpy as np
 
+from .cost import estimates_phase, make_plan, sort_phase
 from .hill import HillEstimator
 from .kernel import KernelTypeEstimator
 from .moments import MomentsEstimator
 from .pickands import PickandsEstimator
+from .pot import POTEstimator
+from .power_law import PowerLawEstimator
 from .smooth_hill import SmoothHillEstimator
 from .tail_methods import add_uniform_noise, get_ccdf, get_distribution
 
-logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+# bootstrap replicates per level between two checks of a deadline
+DEADLINE_BLOCK = 10
 
 
 def fit_estimators(
@@ -28,6 +34,7 @@ def fit_estimators(
     verbose=False,
     p_noise=1,
     base_seed=None,
+    deadline=None,
 ):
     """
     Fit various tail estimators to the data at once.
@@ -64,29 +71,48 @@ def fit_estimators(
         Parameter controlling noise amplitude.
     base_seed : int, optional
         Base random seed for reproducibility of bootstrap. Only used for methods with bootstrap.
+    deadline : float, optional
+        Time budget in seconds. The time left when the bootstrap estimators
+        are reached is shared evenly between the Hill, moments and
+        kernel-type fits, in this order, and time saved by one of them
+        carries over to the next (see ``BaseTailEstimator.fit``). The
+        kernel-type estimator runs without bootstrap if no time is left,
+        and the optional POT and power-law fits are skipped once the
+        deadline has passed.
 
     Returns
     -------
     dict
         A dictionary containing all estimation results including PDF, CCDF, and results from
-        different estimators (Pickands, Hill, smooth Hill, moments, kernel-type).
+        different estimators (Pickands, Hill, smooth Hill, moments, kernel-type,
+        power-law with KS-optimal xmin, peaks-over-threshold GPD). With a
+        deadline, ``results["cuts"]`` maps the estimators to the work cut
+        by it.
     """
     results = {}
+    end = None if deadline is None else time.monotonic() + deadline
+    cuts = {}
+
+    def budget(n_fits):
+        """Share of the time left for each of the n_fits remaining fits."""
+        if end is None:
+            return None
+        return max(0.0, (end - time.monotonic()) / n_fits)
 
     # calculate log-binned PDF
-    logging.debug("Calculating PDF...")
+    logger.debug("Calculating PDF...")
     t1 = time.time()
     x_pdf, y_pdf = get_distribution(ordered_data, number_of_bins=number_of_bins)
     t2 = time.time()
-    logging.debug("Elapsed time(PDF):", t2 - t1)
+    logger.debug("Elapsed time(PDF): %s", t2 - t1)
     results["pdf"] = {"x": x_pdf, "y": y_pdf}
 
     # calculate CCDF
-    logging.debug("Calculating CCDF...")
+    logger.debug("Calculating CCDF...")
     t1 = time.time()
     x_ccdf, y_ccdf = get_ccdf(ordered_data)
     t2 = time.time()
-    logging.debug("Elapsed time:", t2 - t1)
+    logger.debug("Elapsed time: %s", t2 - t1)
     results["ccdf"] = {"x": x_ccdf, "y": y_ccdf}
 
     # add noise if needed
@@ -100,29 +126,42 @@ def fit_estimators(
         results["discrete_ordered_data"] = discrete_ordered_data
 
     # perform Pickands estimation
-    logging.debug("Calculating Pickands...")
+    logger.debug("Calculating Pickands...")
     t1 = time.time()
     pickands = PickandsEstimator()
     pickands.fit(ordered_data)
     pickands_result = pickands.get_result()
     k_p_arr, xi_p_arr = pickands_result.k_arr_, pickands_result.xi_arr_
     t2 = time.time()
-    logging.debug("Elapsed time (Pickands):", t2 - t1)
+    logger.debug("Elapsed time (Pickands): %s", t2 - t1)
     results["pickands"] = {"k_arr_": k_p_arr, "xi_arr_": xi_p_arr}
 
+    # perform peaks-over-threshold GPD estimation
+    if end is None or time.monotonic() < end:
+        logger.debug("Calculating POT...")
+        t1 = time.time()
+        pot = POTEstimator()
+        pot.fit(ordered_data)
+        pot_result = pot.get_result()
+        t2 = time.time()
+        logger.debug("Elapsed time (POT): %s", t2 - t1)
+        results["pot"] = {"k_arr_": pot_result.k_arr_, "xi_arr_": pot_result.xi_arr_}
+    else:
+        cuts["pot"] = ["skipped"]
+
     # perform smooth Hill estimation
-    logging.debug("Calculating smooth Hill...")
+    logger.debug("Calculating smooth Hill...")
     t1 = time.time()
     smooth_hill = SmoothHillEstimator(r_smooth=r_smooth)
     smooth_hill.fit(ordered_data)
     smooth_hill_result = smooth_hill.get_result()
     k_sh_arr, xi_sh_arr = smooth_hill_result.k_arr_, smooth_hill_result.xi_arr_
     t2 = time.time()
-    logging.debug("Elapsed time (smooth Hill):", t2 - t1)
+    logger.debug("Elapsed time (smooth Hill): %s", t2 - t1)
     results["smooth_hill"] = {"k_arr_": k_sh_arr, "xi_arr_": xi_sh_arr}
 
     # perform adjusted Hill estimation
-    logging.debug("Calculating adjusted Hill...")
+    logger.debug("Calculating adjusted Hill...")
     t1 = time.time()
     hill = HillEstimator(
         bootstrap=bootstrap_flag,
@@ -132,8 +171,10 @@ def fit_estimators(
         eps_stop=eps_stop,
         verbose=verbose,
         base_seed=base_seed,
+        adaptive_block=50 if end is None else DEADLINE_BLOCK,
     )
-    hill.fit(ordered_data)
+    hill.fit(ordered_data, deadline=budget(3))
+    cuts["hill"] = hill.cuts_
     hill_result = hill.get_result()
     k_h_arr = hill_result.k_arr_
     xi_h_arr = hill_result.xi_arr_
@@ -175,11 +216,34 @@ def fit_estimators(
 
     t2 = time.time()
     if verbose:
-        logging.debug("Elapsed time (Hill):", t2 - t1)
+        logger.debug("Elapsed time (Hill): %s", t2 - t1)
+
+    # perform power-law fit with KS-optimal xmin, on the integer values
+    # if noise was added to them
+    if end is None or time.monotonic() < end:
+        if verbose:
+            logger.debug("Calculating power-law xmin scan...")
+        t1 = time.time()
+        power_law = PowerLawEstimator(discrete=noise_flag)
+        power_law.fit(discrete_ordered_data if noise_flag else ordered_data)
+        power_law_result = power_law.get_result()
+        results["power_law"] = {
+            "k_arr_": power_law_result.k_arr_,
+            "xi_arr_": power_law_result.xi_arr_,
+            "k_star_": power_law_result.k_star_,
+            "xi_star_": power_law_result.xi_star_,
+            "xmin_": power_law_result.xmin_,
+            "ks_distance_": power_law_result.ks_distance_,
+        }
+        t2 = time.time()
+        if verbose:
+            logger.debug("Elapsed time (power-law): %s", t2 - t1)
+    else:
+        cuts["power_law"] = ["skipped"]
 
     # perform moments estimation
     if verbose:
-        logging.debug("Calculating moments...")
+        logger.debug("Calculating moments...")
     t1 = time.time()
     moments = MomentsEstimator(
         bootstrap=bootstrap_flag,
@@ -189,8 +253,10 @@ def fit_estimators(
         eps_stop=eps_stop,
         verbose=verbose,
         base_seed=base_seed,
+        adaptive_block=50 if end is None else DEADLINE_BLOCK,
     )
-    moments.fit(ordered_data)
+    moments.fit(ordered_data, deadline=budget(2))
+    cuts["moments"] = moments.cuts_
     moments_result = moments.get_result()
     k_m_arr = moments_result.k_arr_
     xi_m_arr = moments_result.xi_arr_
@@ -232,24 +298,29 @@ def fit_estimators(
 
     t2 = time.time()
     if verbose:
-        logging.debug("Elapsed time (moments):", t2 - t1)
+        logger.debug("Elapsed time (moments): %s", t2 - t1)
 
     # perform kernel-type estimation
     if verbose:
-        logging.debug("Calculating kernel-type...")
+        logger.debug("Calculating kernel-type...")
     t1 = time.time()
+    kernel_budget = budget(1)
     kernel = KernelTypeEstimator(
         hsteps=hsteps,
         alpha=alpha,
-        bootstrap=bootstrap_flag,
+        bootstrap=bootstrap_flag and kernel_budget != 0,
         t_bootstrap=t_bootstrap,
         r_bootstrap=r_bootstrap,
         diagn_plots=diagn_plots,
         eps_stop=eps_stop,
         verbose=verbose,
         base_seed=base_seed,
+        adaptive_block=50 if end is None else DEADLINE_BLOCK,
     )
-    kernel.fit(ordered_data)
+    kernel.fit(ordered_data, deadline=kernel_budget)
+    cuts["kernel"] = kernel.cuts_
+    if bootstrap_flag and kernel_budget == 0:
+        cuts["kernel"] = ["bootstrap"]
     kernel_result = kernel.get_result()
     k_k_arr = kernel_result.k_arr_
     xi_k_arr = kernel_result.xi_arr_
@@ -296,6 +367,76 @@ def fit_estimators(
 
     t2 = time.time()
     if verbose:
-        logging.debug("Elapsed time (kernel-type):", t2 - t1)
+        logger.debug("Elapsed time (kernel-type): %s", t2 - t1)
 
+    if end is not None:
+        results["cuts"] = cuts
     return results
+
+
+def plan_estimators(
+    n,
+    number_of_bins=30,
+    r_smooth=2,
+    alpha=0.6,
+    hsteps=200,
+    bootstrap_flag=True,
+    t_bootstrap=0.5,
+    r_bootstrap=500,
+    eps_stop=1.0,
+    noise_flag=True,
+    coefficients=None,
+):
+    """
+    Predict the cost of ``fit_estimators`` on n values without running it.
+
+    Parameters
+    ----------
+    n : int
+        Number of values of the data.
+    coefficients : dict, optional
+        Seconds per unit of work of every kind of operation (see
+        ``cost.calibrate``).
+
+    Other parameters are those of ``fit_estimators``.
+
+    Returns
+    -------
+    TailEstimatorResult
+        With the total work ``cost_``, the predicted run time ``seconds_``
+        and the peak memory ``memory_`` in bytes of the whole set, and the
+        breakdown ``phases_`` with the phases of every estimator prefixed
+        by its name. ``estimators_`` maps the names to the plans of the
+        estimators on their own.
+    """
+    bootstrap = {
+        "bootstrap": bootstrap_flag,
+        "t_bootstrap": t_bootstrap,
+        "r_bootstrap": r_bootstrap,
+        "eps_stop": eps_stop,
+    }
+    estimators = {
+        "pickands": PickandsEstimator(),
+        "pot": POTEstimator(),
+        "smooth_hill": SmoothHillEstimator(r_smooth=r_smooth),
+        "hill": HillEstimator(**bootstrap),
+        "power_law": PowerLawEstimator(discrete=noise_flag),
+        "moments": MomentsEstimator(**bootstrap),
+        "kernel": KernelTypeEstimator(hsteps=hsteps, alpha=alpha, **bootstrap),
+    }
+
+    # PDF and CCDF, then the noise and the sorts of the noisy and the
+    # integer data; every estimator sorts its own copy again in fit()
+    phases = [estimates_phase(n, "distribution", n_arrays=0, name="distribution")]
+    if noise_flag:
+        phases += [
+            sort_phase(n, name="discrete_sort"),
+            estimates_phase(n, "noise", n_arrays=1, name="noise"),
+        ]
+    phases.append(sort_phase(n, name="sort"))
+    for name, estimator in estimators.items():
+        phases += [(f"{name}_{phase[0]}", *phase[1:]) for phase in estimator._phases(n)]
+    plans = {
+        name: estimator.plan(n, coefficients) for name, estimator in estimators.items()
+    }
+    return make_plan(phases, n, coefficients, estimators_=plans)
@@ -0,0 +1,355 @@
+"""Cost model and dry-run planner of the estimator fits.
+
+The cost of a fit is broken into phases: the sort, the estimates for all
+order statistics, every bootstrap level and so on. Each phase counts its
+work in units of a few kinds of operations (one comparison of a sort, one
+value of one prefix sum, one value drawn with replacement, ...), priced in
+seconds per unit by coefficients that ``calibrate`` measures on the local
+machine. The memory of a phase is its working set on top of the arrays
+retained by the previous phases.
+"""
+
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .result import TailEstimatorResult
+from .tail_methods import (
+    add_uniform_noise,
+    bootstrap_sample_sizes,
+    get_ccdf,
+    get_distribution,
+    get_kernel_cumsums,
+    log_power_cumsums,
+    pickands_estimator,
+    pot_estimator,
+    power_law_estimator,
+    smooth_hill_estimator,
+)
+
+# Seconds per unit of work of every kind of operation, on one core. The
+# defaults were measured on a recent x86-64 machine; calibrate() replaces
+# them with measurements of the local machine.
+COST_COEFFICIENTS = {
+    # per comparison of a sort, n*log2(n) per sort of n values
+    "sort": 3.5e-10,
+    # per value drawn with replacement from the data
+    "resample": 1.3e-8,
+    # per value and power of the log power prefix sums and moments
+    "prefix_sum": 1.0e-8,
+    # per value and exponent of the kernel-type prefix sums
+    "kernel_sum": 1.4e-8,
+    # per value drawn or counted for a multinomial weight vector
+    "weights": 6.0e-9,
+    # per value of the Pickands estimates
+    "pickands": 2.4e-8,
+    # per value of the smooth Hill estimates
+    "smooth_hill": 6.6e-7,
+    # per value of the POT fit over the default threshold grid
+    "pot": 1.7e-6,
+    # per value of the power-law xmin scan
+    "power_law": 4.3e-6,
+    # per value of the log-binned PDF and the CCDF
+    "distribution": 1.0e-7,
+    # per value of the uniform noise of integer data
+    "noise": 8.5e-9,
+}
+
+# bytes per value of the float64 arrays
+FLOAT_BYTES = 8
+
+
+def sort_phase(n: int, name: str = "sort") -> Tuple:
+    """Phase of a sort of n values into a new array.
+
+    Parameters
+    ----------
+    n : int
+        Number of values.
+    name : str, default="sort"
+        Name of the phase.
+
+    Returns
+    -------
+    Tuple
+        Name, work per kind, working and retained bytes of the phase.
+    """
+    return (
+        name,
+        {"sort": n * math.log2(max(n, 2))},
+        FLOAT_BYTES * n,
+        FLOAT_BYTES * n,
+    )
+
+
+def estimates_phase(
+    n: int, kind: str, n_terms: int = 1, n_arrays: int = 2, name: str = "estimates"
+) -> Tuple:
+    """Phase of a pass computing estimates for all order statistics.
+
+    Parameters
+    ----------
+    n : int
+        Number of values.
+    kind : str
+        Kind of operation of the pass.
+    n_terms : int, default=1
+        Number of prefix sums or units of work per value.
+    n_arrays : int, default=2
+        Number of arrays of n values kept in the results.
+    name : str, default="estimates"
+        Name of the phase.
+
+    Returns
+    -------
+    Tuple
+        Name, work per kind, working and retained bytes of the phase.
+    """
+    return (
+        name,
+        {kind: n * n_terms},
+        FLOAT_BYTES * n * (n_terms + n_arrays),
+        FLOAT_BYTES * n * n_arrays,
+    )
+
+
+def bootstrap_phase(
+    name: str,
+    sample_size: int,
+    n: int,
+    r_bootstrap: int,
+    n_terms: int,
+    kind: str = "prefix_sum",
+    antithetic: bool = False,
+    control_variate: bool = False,
+    weighted_bootstrap: Optional[str] = None,
+    batch_size: Optional[int] = None,
+) -> Tuple:
+    """Phase of one bootstrap level.
+
+    Parameters
+    ----------
+    name : str
+        Name of the phase.
+    sample_size : int
+        Size m of the bootstrap resamples.
+    n : int
+        Size of the data.
+    r_bootstrap : int
+        Number of replicates (the upper bound in adaptive mode).
+    n_terms : int
+        Number of prefix sums of the AMSE statistic of a resample.
+    kind : str, default="prefix_sum"
+        Kind of the prefix sums of the statistic.
+    antithetic : bool, default=False
+        Whether resamples are drawn in antithetic pairs, which share a sort.
+    control_variate : bool, default=False
+        Whether the control variate is computed for every resample.
+    weighted_bootstrap : str, optional
+        Kind of weights of the sort-free weighted bootstrap.
+    batch_size : int, optional
+        Number of weighted replicates evaluated at once.
+
+    Returns
+    -------
+    Tuple
+        Name, work per kind, working and retained bytes of the phase.
+    """
+    if weighted_bootstrap is not None:
+        batch_size = batch_size or max(1, (1 << 20) // n)
+        work = {
+            "weights": r_bootstrap * (sample_size + n),
+            kind: r_bootstrap * n * n_terms,
+        }
+        working = FLOAT_BYTES * min(batch_size, r_bootstrap) * n * (n_terms + 2)
+        return name, work, working, 2 * FLOAT_BYTES * n
+    n_sorts = (r_bootstrap + 1) // 2 if antithetic else r_bootstrap
+    work = {
+        "resample": r_bootstrap * sample_size,
+        "sort": n_sorts * sample_size * math.log2(max(sample_size, 2)),
+        kind: r_bootstrap * sample_size * n_terms,
+    }
+    # resample, logs and the prefix sums, moments and AMSE of one replicate
+    working = FLOAT_BYTES * sample_size * (4 + 3 * n_terms)
+    # running sums and sums of squares of the AMSE curve
+    retained = 2 * FLOAT_BYTES * sample_size
+    if control_variate:
+        work["prefix_sum"] = work.get("prefix_sum", 0) + r_bootstrap * sample_size
+        working += 2 * FLOAT_BYTES * sample_size
+        retained += 3 * FLOAT_BYTES * sample_size
+    return name, work, working, retained
+
+
+def threshold_phases(
+    estimator: Any, n: int, curve_terms: int, amse_terms: int, kind: str = "prefix_sum"
+) -> List[Tuple]:
+    """Phases of the threshold selection of a bootstrap estimator.
+
+    Parameters
+    ----------
+    estimator : BaseTailEstimator
+        Hill, moments or kernel-type estimator.
+    n : int
+        Size of the data.
+    curve_terms : int
+        Number of prefix sums of the estimates for all order statistics.
+    amse_terms : int
+        Number of prefix sums of the double-bootstrap AMSE statistic.
+    kind : str, default="prefix_sum"
+        Kind of the prefix sums.
+
+    Returns
+    -------
+    List[Tuple]
+        Phases of the bootstrap levels, of the closed-form criterion, or
+        none without bootstrap.
+    """
+    if not estimator.bootstrap:
+        return []
+    method = getattr(estimator, "threshold_method", "double_bootstrap")
+    if method not in ("double_bootstrap", "single_bootstrap"):
+        return [("threshold", {kind: curve_terms * n}, 3 * FLOAT_BYTES * n, 0)]
+    n1, n2 = bootstrap_sample_sizes(n, estimator.t_bootstrap)
+    options = {
+        "kind": kind,
+        "antithetic": estimator.antithetic,
+        "control_variate": estimator.control_variate,
+        "weighted_bootstrap": getattr(estimator, "weighted_bootstrap", None),
+        "batch_size": getattr(estimator, "batch_size", None),
+    }
+    r_bootstrap = estimator.r_bootstrap
+    if method == "single_bootstrap":
+        return [
+            bootstrap_phase("bootstrap", n1, n, r_bootstrap, curve_terms, **options)
+        ]
+    return [
+        bootstrap_phase("bootstrap_1", n1, n, r_bootstrap, amse_terms, **options),
+        bootstrap_phase("bootstrap_2", n2, n, r_bootstrap, amse_terms, **options),
+    ]
+
+
+def make_plan(
+    phases: List[Tuple],
+    n: int,
+    coefficients: Optional[Dict[str, float]] = None,
+    **info: Any,
+) -> TailEstimatorResult:
+    """Price the phases of a fit.
+
+    Parameters
+    ----------
+    phases : List[Tuple]
+        Name, work per kind, working and retained bytes of every phase,
+        in the order in which they run.
+    n : int
+        Size of the data, whose input array is counted in the memory.
+    coefficients : dict, optional
+        Seconds per unit of work of every kind. Defaults to
+        ``COST_COEFFICIENTS``.
+    **info : dict
+        Additional entries of the result, e.g. the estimator.
+
+    Returns
+    -------
+    TailEstimatorResult
+        With the total work ``cost_`` in units of operations, the predicted
+        run time ``seconds_``, the peak memory ``memory_`` in bytes and the
+        breakdown ``phases_`` with the cost, seconds and working memory of
+        every phase.
+    """
+    coefficients = COST_COEFFICIENTS if coefficients is None else coefficients
+    retained = peak = FLOAT_BYTES * n
+    breakdown = {}
+    for name, work, working, kept in phases:
+        peak = max(peak, retained + working)
+        retained += kept
+        breakdown[name] = {
+            "cost_": float(sum(work.values())),
+            "seconds_": float(
+                sum(units * coefficients[kind] for kind, units in work.items())
+            ),
+            "memory_": int(working),
+        }
+    return TailEstimatorResult(
+        {
+            **info,
+            "n_": n,
+            "cost_": sum(phase["cost_"] for phase in breakdown.values()),
+            "seconds_": sum(phase["seconds_"] for phase in breakdown.values()),
+            "memory_": int(peak),
+            "phases_": breakdown,
+        }
+    )
+
+
+def calibrate(
+    n: int = 1 << 16, repeats: int = 3, update: bool = True
+) -> Dict[str, float]:
+    """Measure the cost coefficients on the local machine.
+
+    Every kind of operation is timed on a sample of n Pareto values, and
+    the best of the repeats is divided by its units of work.
+
+    Parameters
+    ----------
+    n : int, default=65536
+        Size of the calibration sample.
+    repeats : int, default=3
+        Number of timings of every operation.
+    update : bool, default=True
+        Whether to install the measured coefficients as
+        ``COST_COEFFICIENTS`` for subsequent plans.
+
+    Returns
+    -------
+    dict
+        Seconds per unit of work of every kind.
+
+    Examples
+    --------
+    >>> calibrate()
+    >>> HillEstimator().plan(10**6).seconds_
+    """
+    rng = np.random.default_rng(0)
+    data = rng.pareto(1.5, n) + 1.0
+    ordered_data = np.sort(data)[::-1]
+    counts = np.floor(ordered_data)
+
+    def weights():
+        indices = rng.integers(0, n, n)
+        return np.bincount(indices, minlength=n)
+
+    log_n = math.log2(n)
+    operations = {
+        "sort": (lambda: np.sort(data), n * log_n),
+        "resample": (lambda: rng.choice(ordered_data, n, replace=True), n),
+        "prefix_sum": (lambda: log_power_cumsums(ordered_data, 3), 3 * n),
+        "kernel_sum": (
+            lambda: get_kernel_cumsums(ordered_data, (1, 3, 5, 0.6, 2.6, 4.6)),
+            6 * n,
+        ),
+        "weights": (weights, 2 * n),
+        "pickands": (lambda: pickands_estimator(ordered_data), n),
+        "smooth_hill": (lambda: smooth_hill_estimator(ordered_data), n),
+        "pot": (lambda: pot_estimator(ordered_data), n),
+        "power_law": (lambda: power_law_estimator(ordered_data), n),
+        "distribution": (
+            lambda: (get_distribution(counts), get_ccdf(counts)),
+            n,
+        ),
+        "noise": (lambda: add_uniform_noise(counts, base_seed=0), n),
+    }
+    coefficients = {}
+    with np.errstate(all="ignore"):
+        for kind, (operation, units) in operations.items():
+            best = math.inf
+            for _ in range(repeats):
+                start = time.perf_counter()
+                operation()
+                best = min(best, time.perf_counter() - start)
+            coefficients[kind] = best / units
+    if update:
+        COST_COEFFICIENTS.update(coefficients)
+    return coefficients
@@ -1,11 +1,13 @@
+import time
 from typing import Any, Dict, Optional, Tuple, Union
 
 import numpy as np
 from matplotlib import pyplot as plt
 from numpy.random import BitGenerator, Generator, RandomState, SeedSequence
 
-from .bulk_fit import fit_estimators
+from .bulk_fit import fit_estimators, plan_estimators
 from .plot.plot_methods import make_plots
+from .result import TailEstimatorResult
 
 
 class TailEstimatorSet:
@@ -84,8 +86,8 @@ class TailEstimatorSet:
         p_noise: int = 1,
         savedata: bool = False,
         auto_plot: bool = False,
-        base_seed: Union[
-            None, SeedSequence, BitGenerator, Generator, RandomState
+        base_seed: Optional[
+            Union[SeedSequence, BitGenerator, Generator, RandomState]
         ] = None,
     ):
         # Store parameters
@@ -124,13 +126,19 @@ class TailEstimatorSet:
         if auto_plot and data is not None:
             self.plot()
 
-    def fit(self, data: np.ndarray) -> "TailEstimatorSet":
+    def fit(
+        self, data: np.ndarray, deadline: Optional[float] = None
+    ) -> "TailEstimatorSet":
         """Fit the estimators to the data.
 
         Parameters
         ----------
         data : np.ndarray
             The data to fit the estimators to.
+        deadline : float, optional
+            Time budget in seconds, shared between the bootstrap
+            estimators (see ``fit_estimators``). The work cut by it is
+            recorded in ``results["cuts"]``.
 
         Returns
         -------
@@ -142,7 +150,11 @@ class TailEstimatorSet:
 
         # Store the data
         self.data = data_array
+        start = time.monotonic()
         self.ordered_data = np.sort(data_array)[::-1]
+        if deadline is not None:
+            # the sort counts against the time budget
+            deadline = max(0.0, deadline - (time.monotonic() - start))
 
         # Fit the estimators
         self.results = fit_estimators(
@@ -160,6 +172,7 @@ class TailEstimatorSet:
             noise_flag=self.noise_flag,
             p_noise=self.p_noise,
             base_seed=self.base_seed,
+            deadline=deadline,
         )
 
         # Reset figure and axes
@@ -168,6 +181,41 @@ class TailEstimatorSet:
 
         return self
 
+    def plan(
+        self, n: int, coefficients: Optional[Dict[str, float]] = None
+    ) -> TailEstimatorResult:
+        """Predict the cost of fitting the estimators to n values.
+
+        Parameters
+        ----------
+        n : int
+            Number of values of the data.
+        coefficients : dict, optional
+            Seconds per unit of work of every kind of operation. Defaults
+            to the coefficients of the last ``calibrate``.
+
+        Returns
+        -------
+        TailEstimatorResult
+            With the total work ``cost_``, the predicted run time
+            ``seconds_``, the peak memory ``memory_`` in bytes, the
+            breakdown ``phases_`` and the plans of the estimators
+            ``estimators_`` (see ``plan_estimators``).
+        """
+        return plan_estimators(
+            n,
+            number_of_bins=self.number_of_bins,
+            r_smooth=self.r_smooth,
+            alpha=self.alpha,
+            hsteps=self.hsteps,
+            bootstrap_flag=self.bootstrap_flag,
+            t_bootstrap=self.t_bootstrap,
+            r_bootstrap=self.r_bootstrap,
+            eps_stop=self.eps_stop,
+            noise_flag=self.noise_flag,
+            coefficients=coefficients,
+        )
+
     def plot(self) -> Tuple[plt.Figure, np.ndarray]:
         """Create and return the plots.
 
@@ -0,0 +1,163 @@
+"""Functional interface of the tail index estimators.
+
+Every function fits a fresh estimator with the given parameters and
+returns its result, without state shared between calls, so the functions
+can run concurrently in threads. NumPy releases the GIL in the sorts, logs
+and prefix sums that dominate the fits.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from .hill import HillEstimator
+from .kernel import KernelTypeEstimator
+from .moments import MomentsEstimator
+from .pickands import PickandsEstimator
+from .pot import POTEstimator
+from .power_law import PowerLawEstimator
+from .result import TailEstimatorResult
+from .smooth_hill import SmoothHillEstimator
+
+
+def hill(
+    data: np.ndarray, deadline: Optional[float] = None, **params
+) -> TailEstimatorResult:
+    """Fit the Hill estimator to the data.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Input data array (e.g., degree sequence).
+    deadline : float, optional
+        Time budget of the fit in seconds (see ``BaseTailEstimator.fit``).
+    **params : dict
+        Parameters of ``HillEstimator``.
+
+    Returns
+    -------
+    TailEstimatorResult
+        Result of the fit (see ``HillEstimator.get_result``).
+
+    Examples
+    --------
+    >>> with ThreadPoolExecutor() as executor:
+    ...     results = list(executor.map(lambda data: hill(data, base_seed=0), datasets))
+    """
+    return HillEstimator(**params).estimate(data, deadline=deadline)
+
+
+def moments(
+    data: np.ndarray, deadline: Optional[float] = None, **params
+) -> TailEstimatorResult:
+    """Fit the moments estimator to the data.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Input data array (e.g., degree sequence).
+    deadline : float, optional
+        Time budget of the fit in seconds (see ``BaseTailEstimator.fit``).
+    **params : dict
+        Parameters of ``MomentsEstimator``.
+
+    Returns
+    -------
+    TailEstimatorResult
+        Result of the fit (see ``MomentsEstimator.get_result``).
+    """
+    return MomentsEstimator(**params).estimate(data, deadline=deadline)
+
+
+def kernel_type(
+    data: np.ndarray, deadline: Optional[float] = None, **params
+) -> TailEstimatorResult:
+    """Fit the kernel-type estimator to the data.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Input data array (e.g., degree sequence).
+    deadline : float, optional
+        Time budget of the fit in seconds (see ``BaseTailEstimator.fit``).
+    **params : dict
+        Parameters of ``KernelTypeEstimator``.
+
+    Returns
+    -------
+    TailEstimatorResult
+        Result of the fit (see ``KernelTypeEstimator.get_result``).
+    """
+    return KernelTypeEstimator(**params).estimate(data, deadline=deadline)
+
+
+def pickands(data: np.ndarray, **params) -> TailEstimatorResult:
+    """Fit the Pickands estimator to the data.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Input data array (e.g., degree sequence).
+    **params : dict
+        Parameters of ``PickandsEstimator``.
+
+    Returns
+    -------
+    TailEstimatorResult
+        Result of the fit (see ``PickandsEstimator.get_result``).
+    """
+    return PickandsEstimator(**params).estimate(data)
+
+
+def smooth_hill(data: np.ndarray, **params) -> TailEstimatorResult:
+    """Fit the smooth Hill estimator to the data.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Input data array (e.g., degree sequence).
+    **params : dict
+        Parameters of ``SmoothHillEstimator``.
+
+    Returns
+    -------
+    TailEstimatorResult
+        Result of the fit (see ``SmoothHillEstimator.get_result``).
+    """
+    return SmoothHillEstimator(**params).estimate(data)
+
+
+def pot(data: np.ndarray, **params) -> TailEstimatorResult:
+    """Fit the peaks-over-threshold GPD estimator to the data.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Input data array (e.g., degree sequence).
+    **params : dict
+        Parameters of ``POTEstimator``.
+
+    Returns
+    -------
+    TailEstimatorResult
+        Result of the fit (see ``POTEstimator.get_result``).
+    """
+    return POTEstimator(**params).estimate(data)
+
+
+def power_law(data: np.ndarray, **params) -> TailEstimatorResult:
+    """Fit the power-law tail with KS-optimal xmin to the data.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Input data array (e.g., degree sequence).
+    **params : dict
+        Parameters of ``PowerLawEstimator``.
+
+    Returns
+    -------
+    TailEstimatorResult
+        Result of the fit (see ``PowerLawEstimator.get_result``).
+    """
+    return PowerLawEstimator(**params).estimate(data)
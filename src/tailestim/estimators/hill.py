@@ -1,11 +1,12 @@
 """Hill estimator implementation for tail index estimation."""
 
-from typing import Any, Dict, Tuple, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from numpy.random import BitGenerator, Generator, RandomState, SeedSequence
 
 from .base import BaseTailEstimator
+from .cost import estimates_phase, threshold_phases
 from .result import TailEstimatorResult
 from .tail_methods import hill_estimator as hill_estimate
 
@@ -39,8 +40,74 @@ class HillEstimator(BaseTailEstimator):
         Maximum number of resampling attempts when the double-bootstrap
         detects a false AMSE minimum (k2 > k1). Raises RuntimeError
         if exceeded.
+    window_shift : float, default=0.005
+        Fraction of the bootstrap sample size by which the AMSE
+        minimization window is shifted on each resampling attempt.
+        Fresh replicates are only drawn once the window cannot move.
+    adaptive : bool, default=False
+        Whether to stop drawing bootstrap replicates early, in blocks of
+        ``adaptive_block``, once the AMSE minima of both bootstrap levels
+        have settled. ``r_bootstrap`` is then the upper bound.
+    adaptive_block : int, default=50
+        Number of replicates added per block in adaptive mode.
+    adaptive_tol : float, default=0.1
+        Tolerance on the relative movement of the AMSE argmin between
+        blocks and on the relative standard error of the averaged AMSE
+        near the minimum in adaptive mode.
+    antithetic : bool, default=False
+        Whether to draw the bootstrap replicates in antithetic pairs, the
+        second resample taking the mirrored order statistics of the first.
+        The number of replicates is rounded up to an even number.
+    control_variate : bool, default=False
+        Whether to correct the averaged AMSE with a control variate of
+        exactly known bootstrap expectation (a Hill-type mean excess over
+        fixed full-sample thresholds).
+    weighted_bootstrap : {None, "multinomial", "bayesian"}, default=None
+        Sort-free weighted bootstrap for the threshold search. Instead of
+        drawing and sorting resamples, every replicate is a weight vector
+        over the sorted data (resample counts for "multinomial", Dirichlet
+        weights for "bayesian"), and the AMSE curves are computed from
+        weighted cumulative sums of precomputed log tables, batched across
+        replicates. None draws and sorts resamples.
+    batch_size : int, optional
+        Number of weighted replicates evaluated at once. Defaults to a
+        batch of about 2**20 weights.
+    rng_mode : {"legacy", "fast"}, default="legacy"
+        Random streams of the bootstrap replicates. "legacy" seeds a new
+        generator for every replicate from the base generator, as earlier
+        versions did: for a given ``base_seed``, the results are those of
+        earlier versions unless a false AMSE minimum is detected, whose
+        retries now shift the minimization window (see ``window_shift``) and
+        keep the replicates drawn. "fast" draws the replicates of every
+        bootstrap level from its own generator, spawned from the SeedSequence
+        of ``base_seed``, without a generator construction per replicate.
+    prefix_block_size : int, optional
+        Number of elements per block of blocked, thread-parallel prefix
+        sums of the full-sample estimates, which round more accurately on
+        large data but differ from the plain NumPy cumulative sums used by
+        default in the last digits. With a block size, ``update``
+        recomputes the prefix sums only from the block of the first order
+        statistic changed by the new values on.
+    threshold_method : str, default="double_bootstrap"
+        Threshold selection used when ``bootstrap`` is True. Besides the
+        double-bootstrap, "single_bootstrap" runs only one m-out-of-n
+        bootstrap level (Hall-style, against a pilot estimate at n^(2/3)
+        order statistics, assuming a second order parameter of -1), at
+        about half the cost, and it reports no 2nd bootstrap level. The
+        closed-form selections without resampling are
+        computed in O(n) from the estimates curve: "stability"
+        (minimum rolling variance of the estimates over k), "guillou_hall"
+        (largest k whose Guillou-Hall bias diagnostic stays below 1.25)
+        and "min_ks" (minimum Kolmogorov-Smirnov distance of the fitted
+        tail). Their criterion is reported in place of the 1st bootstrap
+        AMSE, with no 2nd bootstrap level.
+    two_tailed : bool, default=False
+        Whether to fit the upper and the lower tail of signed data, with
+        one bootstrap seed for both thresholds (see ``BaseTailEstimator``).
     """
 
+    _deadline_fallback: ClassVar[str] = "guillou_hall"
+
     def __init__(
         self,
         bootstrap: bool = True,
@@ -49,19 +116,44 @@ class HillEstimator(BaseTailEstimator):
         eps_stop: float = 0.99,
         verbose: bool = False,
         diagn_plots: bool = False,
-        base_seed: Union[
-            None, SeedSequence, BitGenerator, Generator, RandomState
+        base_seed: Optional[
+            Union[SeedSequence, BitGenerator, Generator, RandomState]
         ] = None,
         max_resample: int = 50,
+        window_shift: float = 0.005,
+        adaptive: bool = False,
+        adaptive_block: int = 50,
+        adaptive_tol: float = 0.1,
+        antithetic: bool = False,
+        control_variate: bool = False,
+        weighted_bootstrap: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        rng_mode: str = "legacy",
+        prefix_block_size: Optional[int] = None,
+        threshold_method: str = "double_bootstrap",
+        two_tailed: bool = False,
         **kwargs,
     ):
-        super().__init__(bootstrap=bootstrap, base_seed=base_seed, **kwargs)
+        super().__init__(
+            bootstrap=bootstrap, base_seed=base_seed, two_tailed=two_tailed, **kwargs
+        )
         self.t_bootstrap = t_bootstrap
         self.r_bootstrap = r_bootstrap
         self.eps_stop = eps_stop
         self.verbose = verbose
         self.diagn_plots = diagn_plots
         self.max_resample = max_resample
+        self.window_shift = window_shift
+        self.adaptive = adaptive
+        self.adaptive_block = adaptive_block
+        self.adaptive_tol = adaptive_tol
+        self.antithetic = antithetic
+        self.control_variate = control_variate
+        self.weighted_bootstrap = weighted_bootstrap
+        self.batch_size = batch_size
+        self.rng_mode = rng_mode
+        self.prefix_block_size = prefix_block_size
+        self.threshold_method = threshold_method
 
     def _estimate(self, ordered_data: np.ndarray) -> Tuple:
         """Estimate the tail index using the Hill estimator.
@@ -86,8 +178,56 @@ class HillEstimator(BaseTailEstimator):
             eps_stop=self.eps_stop,
             base_seed=self.base_seed,
             max_resample=self.max_resample,
+            window_shift=self.window_shift,
+            adaptive=self.adaptive,
+            adaptive_block=self.adaptive_block,
+            adaptive_tol=self.adaptive_tol,
+            antithetic=self.antithetic,
+            control_variate=self.control_variate,
+            weighted_bootstrap=self.weighted_bootstrap,
+            batch_size=self.batch_size,
+            rng_mode=self.rng_mode,
+            prefix_block_size=self.prefix_block_size,
+            threshold_method=self.threshold_method,
+            warm_start=self._warm_start,
+            prefix_cache=self._prefix_cache,
+            progress=self._progress,
+            fallback=self._fallback,
+            interrupt=self._interrupt,
         )
 
+    def _phases(self, n: int) -> List[Tuple]:
+        """Phases of a fit to n values: the sort, the Hill estimates and the threshold selection.
+
+        Parameters
+        ----------
+        n : int
+            Number of values of the data.
+
+        Returns
+        -------
+        List[Tuple]
+            Phases of the fit (see ``BaseTailEstimator._phases``).
+        """
+        return [
+            *super()._phases(n),
+            estimates_phase(n, "prefix_sum"),
+            *threshold_phases(self, n, curve_terms=1, amse_terms=2),
+        ]
+
+    def _amse_minima(self) -> Optional[Tuple[float, float]]:
+        """Fractions of order statistics of the AMSE minima of the last fit.
+
+        Returns
+        -------
+        Tuple[float, float] or None
+            Minima of the 1st and 2nd bootstrap levels, or None without
+            a double-bootstrap result.
+        """
+        if self.results is None or self.results[10] is None:
+            return None
+        return self.results[6], self.results[10]
+
     def get_params(self) -> Dict[str, Any]:
         """Get the parameters of the estimator.
 
@@ -105,6 +245,18 @@ class HillEstimator(BaseTailEstimator):
             "verbose": self.verbose,
             "diagn_plots": self.diagn_plots,
             "max_resample": self.max_resample,
+            "window_shift": self.window_shift,
+            "adaptive": self.adaptive,
+            "adaptive_block": self.adaptive_block,
+            "adaptive_tol": self.adaptive_tol,
+            "antithetic": self.antithetic,
+            "control_variate": self.control_variate,
+            "weighted_bootstrap": self.weighted_bootstrap,
+            "batch_size": self.batch_size,
+            "rng_mode": self.rng_mode,
+            "prefix_block_size": self.prefix_block_size,
+            "threshold_method": self.threshold_method,
+            "two_tailed": self.two_tailed,
             **self.kwargs,
         }
 
@@ -127,12 +279,17 @@ class HillEstimator(BaseTailEstimator):
             Optimal order statistic (k*).
         bootstrap_results_ : dict
             Bootstrap results.
+        cuts_ : list
+            Work cut by the deadline of the fit ("bootstrap", "replicates"
+            or "retries"), only present for a fit with a deadline.
 
         Returns
         -------
         TailEstimatorResult
         """
 
+        if self.two_tailed:
+            return self._two_tailed_result()
         if self.results is None:
             raise ValueError("Model not fitted yet. Call fit() first.")
 
@@ -149,6 +306,7 @@ class HillEstimator(BaseTailEstimator):
             n2_amse,
             k2,
             max_index2,
+            n_replicates,
         ) = self.results
 
         res = {
@@ -165,6 +323,7 @@ class HillEstimator(BaseTailEstimator):
                     "xi_star_": xi_star,
                     "gamma_": gamma,
                     "bootstrap_results_": {
+                        "n_replicates_": n_replicates,
                         "first_bootstrap_": {
                             "x_arr_": x1_arr,
                             "amse_": n1_amse,
@@ -181,4 +340,7 @@ class HillEstimator(BaseTailEstimator):
                 }
             )
 
+        if self.cuts_ is not None:
+            res["cuts_"] = self.cuts_
+
         return TailEstimatorResult(res)
@@ -1,11 +1,12 @@
 """Kernel-type estimator implementation for tail index estimation."""
 
-from typing import Any, Dict, Tuple, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from numpy.random import BitGenerator, Generator, RandomState, SeedSequence
 
 from .base import BaseTailEstimator
+from .cost import estimates_phase, threshold_phases
 from .result import TailEstimatorResult
 from .tail_methods import kernel_type_estimator as kernel_estimate
 
@@ -41,8 +42,45 @@ class KernelTypeEstimator(BaseTailEstimator):
         Flag to switch on/off generation of AMSE diagnostic plots.
     base_seed: None | SeedSequence | BitGenerator | Generator | RandomState, default=None
         Base random seed for reproducibility of bootstrap.
+    adaptive : bool, default=False
+        Whether to stop drawing bootstrap replicates early, in blocks of
+        ``adaptive_block``, once the AMSE minima of both bootstrap levels
+        have settled. ``r_bootstrap`` is then the upper bound.
+    adaptive_block : int, default=50
+        Number of replicates added per block in adaptive mode.
+    adaptive_tol : float, default=0.1
+        Tolerance on the relative movement of the AMSE argmin between
+        blocks and on the relative standard error of the averaged AMSE
+        near the minimum in adaptive mode.
+    antithetic : bool, default=False
+        Whether to draw the bootstrap replicates in antithetic pairs, the
+        second resample taking the mirrored order statistics of the first.
+        The number of replicates is rounded up to an even number.
+    control_variate : bool, default=False
+        Whether to correct the averaged AMSE with a control variate of
+        exactly known bootstrap expectation (a Hill-type mean excess over
+        fixed full-sample thresholds).
+    rng_mode : {"legacy", "fast"}, default="legacy"
+        Random streams of the bootstrap replicates. "legacy" seeds a new
+        generator for every replicate from the base generator, as earlier
+        versions did: for a given ``base_seed``, the results are those of
+        earlier versions unless a false AMSE minimum is detected, whose
+        retries now keep the replicates drawn. "fast" draws the replicates of
+        every bootstrap level from its own generator, spawned from the
+        SeedSequence of ``base_seed``, without a generator construction per
+        replicate.
+    prefix_block_size : int, optional
+        Number of elements per block of blocked, thread-parallel prefix
+        sums of the full-sample estimates, which round more accurately on
+        large data but differ from the plain NumPy cumulative sums used by
+        default in the last digits.
+    two_tailed : bool, default=False
+        Whether to estimate both tails of signed data, selecting both
+        bandwidths with the same bootstrap seed (see ``BaseTailEstimator``).
     """
 
+    _deadline_fallback: ClassVar[bool] = True
+
     def __init__(
         self,
         bootstrap: bool = True,
@@ -53,12 +91,22 @@ class KernelTypeEstimator(BaseTailEstimator):
         eps_stop: float = 0.99,
         verbose: bool = False,
         diagn_plots: bool = False,
-        base_seed: Union[
-            None, SeedSequence, BitGenerator, Generator, RandomState
+        base_seed: Optional[
+            Union[SeedSequence, BitGenerator, Generator, RandomState]
         ] = None,
+        adaptive: bool = False,
+        adaptive_block: int = 50,
+        adaptive_tol: float = 0.1,
+        antithetic: bool = False,
+        control_variate: bool = False,
+        rng_mode: str = "legacy",
+        prefix_block_size: Optional[int] = None,
+        two_tailed: bool = False,
         **kwargs,
     ):
-        super().__init__(bootstrap=bootstrap, base_seed=base_seed, **kwargs)
+        super().__init__(
+            bootstrap=bootstrap, base_seed=base_seed, two_tailed=two_tailed, **kwargs
+        )
         self.hsteps = hsteps
         self.alpha = alpha
         self.t_bootstrap = t_bootstrap
@@ -66,6 +114,13 @@ class KernelTypeEstimator(BaseTailEstimator):
         self.eps_stop = eps_stop
         self.verbose = verbose
         self.diagn_plots = diagn_plots
+        self.adaptive = adaptive
+        self.adaptive_block = adaptive_block
+        self.adaptive_tol = adaptive_tol
+        self.antithetic = antithetic
+        self.control_variate = control_variate
+        self.rng_mode = rng_mode
+        self.prefix_block_size = prefix_block_size
 
     def _estimate(self, ordered_data: np.ndarray) -> Tuple:
         """Estimate tail index using kernel-type estimator.
@@ -91,8 +146,53 @@ class KernelTypeEstimator(BaseTailEstimator):
             diagn_plots=self.diagn_plots,
             eps_stop=self.eps_stop,
             base_seed=self.base_seed,
+            adaptive=self.adaptive,
+            adaptive_block=self.adaptive_block,
+            adaptive_tol=self.adaptive_tol,
+            antithetic=self.antithetic,
+            control_variate=self.control_variate,
+            rng_mode=self.rng_mode,
+            prefix_block_size=self.prefix_block_size,
+            warm_start=self._warm_start,
+            progress=self._progress,
+            fallback=self._fallback,
+            interrupt=self._interrupt,
         )
 
+    def _phases(self, n: int) -> List[Tuple]:
+        """Phases of a fit to n values: the sort, the biweight estimates and the double-bootstrap.
+
+        Parameters
+        ----------
+        n : int
+            Number of values of the data.
+
+        Returns
+        -------
+        List[Tuple]
+            Phases of the fit (see ``BaseTailEstimator._phases``).
+        """
+        # the estimates are kept on the bandwidth grid only; the AMSE of a
+        # resample takes the 6 biweight and the 8 triweight prefix sums
+        return [
+            *super()._phases(n),
+            estimates_phase(n, "kernel_sum", n_terms=6, n_arrays=0),
+            *threshold_phases(self, n, 6, 14, kind="kernel_sum"),
+        ]
+
+    def _amse_minima(self) -> Optional[Tuple[float, float]]:
+        """Fractions of order statistics of the AMSE minima of the last fit.
+
+        Returns
+        -------
+        Tuple[float, float] or None
+            Minima of the 1st and 2nd bootstrap levels, or None without
+            a double-bootstrap result.
+        """
+        if self.results is None or self.results[10] is None:
+            return None
+        return self.results[6], self.results[10]
+
     def get_params(self) -> Dict[str, Any]:
         """Get the parameters of the estimator.
 
@@ -111,6 +211,14 @@ class KernelTypeEstimator(BaseTailEstimator):
             "diagn_plots": self.diagn_plots,
             "alpha": self.alpha,
             "hsteps": self.hsteps,
+            "adaptive": self.adaptive,
+            "adaptive_block": self.adaptive_block,
+            "adaptive_tol": self.adaptive_tol,
+            "antithetic": self.antithetic,
+            "control_variate": self.control_variate,
+            "rng_mode": self.rng_mode,
+            "prefix_block_size": self.prefix_block_size,
+            "two_tailed": self.two_tailed,
             **self.kwargs,
         }
 
@@ -133,11 +241,16 @@ class KernelTypeEstimator(BaseTailEstimator):
             Optimal order statistic (k*).
         bootstrap_results_ : dict
             Bootstrap results.
+        cuts_ : list
+            Work cut by the deadline of the fit ("bootstrap", "replicates"
+            or "retries"), only present for a fit with a deadline.
 
         Returns
         -------
         TailEstimatorResult
         """
+        if self.two_tailed:
+            return self._two_tailed_result()
         if self.results is None:
             raise ValueError("Model not fitted yet. Call fit() first.")
 
@@ -154,6 +267,7 @@ class KernelTypeEstimator(BaseTailEstimator):
             n2_amse,
             h2,
             max_index2,
+            n_replicates,
         ) = self.results
 
         res = {
@@ -170,6 +284,7 @@ class KernelTypeEstimator(BaseTailEstimator):
                     "xi_star_": xi_star,
                     "gamma_": gamma,
                     "bootstrap_results_": {
+                        "n_replicates_": n_replicates,
                         "first_bootstrap_": {
                             "x_arr_": x1_arr,
                             "amse_": n1_amse,
@@ -186,4 +301,7 @@ class KernelTypeEstimator(BaseTailEstimator):
                 }
             )
 
+        if self.cuts_ is not None:
+            res["cuts_"] = self.cuts_
+
         return TailEstimatorResult(res)
@@ -1,10 +1,11 @@
 """Pickands estimator implementation for tail index estimation."""
 
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 
 from .base import BaseTailEstimator
+from .cost import estimates_phase
 from .result import TailEstimatorResult
 from .tail_methods import pickands_estimator as pickands_estimate
 
@@ -18,14 +19,17 @@ class PickandsEstimator(BaseTailEstimator):
 
     Parameters
     ----------
+    two_tailed : bool, default=False
+        Whether to estimate both tails of signed data from a single sort,
+        without resampling (see ``BaseTailEstimator``).
     **kwargs : dict
         Additional parameters (not used by this estimator).
 
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, two_tailed: bool = False, **kwargs):
         # Pickands estimator doesn't use bootstrap
-        super().__init__(bootstrap=False, **kwargs)
+        super().__init__(bootstrap=False, two_tailed=two_tailed, **kwargs)
 
     def _estimate(self, ordered_data: np.ndarray) -> Tuple:
         """Estimate the tail index using the Pickands estimator.
@@ -42,6 +46,21 @@ class PickandsEstimator(BaseTailEstimator):
         """
         return pickands_estimate(ordered_data)
 
+    def _phases(self, n: int) -> List[Tuple]:
+        """Phases of a fit to n values: the sort, the Pickands estimates.
+
+        Parameters
+        ----------
+        n : int
+            Number of values of the data.
+
+        Returns
+        -------
+        List[Tuple]
+            Phases of the fit (see ``BaseTailEstimator._phases``).
+        """
+        return [*super()._phases(n), estimates_phase(n, "pickands", n_arrays=2)]
+
     def get_params(self) -> Dict[str, Any]:
         """Get the parameters of the estimator.
 
@@ -50,7 +69,7 @@ class PickandsEstimator(BaseTailEstimator):
         dict
             Dictionary containing the parameters of the estimator.
         """
-        return {**self.kwargs}
+        return {"two_tailed": self.two_tailed, **self.kwargs}
 
     def get_result(self) -> TailEstimatorResult:
         """Get the estimated parameters.
@@ -68,6 +87,8 @@ class PickandsEstimator(BaseTailEstimator):
         -------
         TailEstimatorResult
         """
+        if self.two_tailed:
+            return self._two_tailed_result()
         if self.results is None:
             raise ValueError("Model not fitted yet. Call fit() first.")
 
@@ -65,6 +65,10 @@ def make_plots(
     # Pickands results
     k_p_arr, xi_p_arr = results["pickands"]["k_arr_"], results["pickands"]["xi_arr_"]
 
+    # POT results (log-spaced grid of order statistics)
+    if "pot" in results:
+        k_pot_arr, xi_pot_arr = results["pot"]["k_arr_"], results["pot"]["xi_arr_"]
+
     # Smooth Hill results
     k_sh_arr, xi_sh_arr = (
         results["smooth_hill"]["k_arr_"],
@@ -526,6 +530,22 @@ def make_plots(
             + str(np.round([xi_k_arr[k_k1_star]][0], decimals=3))
             + r"$",
         )
+    # plot POT
+    if "pot" in results:
+        indices_to_plot_pot = np.where(
+            (k_pot_arr <= max_k)
+            & (k_pot_arr >= min_k)
+            & (xi_pot_arr <= 3)
+            & (xi_pot_arr >= -3)
+        )
+        axes[2, 0].plot(
+            k_pot_arr[indices_to_plot_pot],
+            xi_pot_arr[indices_to_plot_pot],
+            color="#80b1d3",
+            alpha=0.8,
+            label="POT (GPD)",
+            zorder=10,
+        )
     axes[2, 0].legend(loc="best")
     # for clarity purposes, display only xi region between -1 and 1
     axes[2, 0].set_ylim((-0.5, 1.5))
@@ -589,6 +609,16 @@ def make_plots(
             + str(np.round([xi_k_arr[k_k1_star]][0], decimals=3))
             + r"$",
         )
+    # plot POT
+    if "pot" in results:
+        axes[2, 1].plot(
+            k_pot_arr[indices_to_plot_pot],
+            xi_pot_arr[indices_to_plot_pot],
+            color="#80b1d3",
+            alpha=0.8,
+            label="POT (GPD)",
+            zorder=10,
+        )
     # for clarity purposes, display only xi region between -1 and 1
     axes[2, 1].set_ylim((-0.5, 1.5))
     axes[2, 1].legend(loc="best")
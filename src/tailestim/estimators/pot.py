@@ -0,0 +1,137 @@
+"""Peaks-over-threshold GPD estimator implementation for tail index estimation."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .base import BaseTailEstimator
+from .cost import estimates_phase
+from .result import TailEstimatorResult
+from .tail_methods import pot_estimator as pot_estimate
+
+
+class POTEstimator(BaseTailEstimator):
+    """Peaks-over-threshold estimator for tail index estimation.
+
+    This class fits the generalized Pareto distribution (GPD) by maximum
+    likelihood to the exceedances over the thresholds X_(k+1), for a
+    logarithmically spaced grid of k. The profile likelihood is maximized
+    by Newton iterations for all thresholds at once, seeded from the
+    moments estimates. It does not use bootstrap procedures.
+
+    Parameters
+    ----------
+    n_grid : int, default=100
+        Number of logarithmically spaced order statistics k.
+    max_iter : int, default=50
+        Maximum number of Newton iterations.
+    tol : float, default=1e-10
+        Relative tolerance on the profile parameter xi/sigma.
+    prefix_block_size : int, optional
+        Number of elements per block of blocked, thread-parallel prefix
+        sums of the moments estimates seeding the fits, which round more
+        accurately on large data. By default plain NumPy cumulative sums
+        are used.
+    **kwargs : dict
+        Additional parameters (not used by this estimator).
+
+    """
+
+    def __init__(
+        self,
+        n_grid: int = 100,
+        max_iter: int = 50,
+        tol: float = 1e-10,
+        prefix_block_size: Optional[int] = None,
+        **kwargs,
+    ):
+        # POT estimator doesn't use bootstrap
+        super().__init__(bootstrap=False, **kwargs)
+        self.n_grid = n_grid
+        self.max_iter = max_iter
+        self.tol = tol
+        self.prefix_block_size = prefix_block_size
+
+    def _estimate(self, ordered_data: np.ndarray) -> Tuple:
+        """Fit the GPD for the grid of thresholds.
+
+        Parameters
+        ----------
+        ordered_data : np.ndarray
+            Data array in decreasing order.
+
+        Returns
+        -------
+        Tuple
+            Contains estimation results from pot_estimator.
+        """
+        return pot_estimate(
+            ordered_data,
+            n_grid=self.n_grid,
+            max_iter=self.max_iter,
+            tol=self.tol,
+            prefix_block_size=self.prefix_block_size,
+        )
+
+    def _phases(self, n: int) -> List[Tuple]:
+        """Phases of a fit to n values: the sort, the GPD fits.
+
+        Parameters
+        ----------
+        n : int
+            Number of values of the data.
+
+        Returns
+        -------
+        List[Tuple]
+            Phases of the fit (see ``BaseTailEstimator._phases``).
+        """
+        return [*super()._phases(n), estimates_phase(n, "pot", n_arrays=0)]
+
+    def get_params(self) -> Dict[str, Any]:
+        """Get the parameters of the estimator.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the parameters of the estimator.
+        """
+        return {
+            "n_grid": self.n_grid,
+            "max_iter": self.max_iter,
+            "tol": self.tol,
+            "prefix_block_size": self.prefix_block_size,
+            **self.kwargs,
+        }
+
+    def get_result(self) -> TailEstimatorResult:
+        """Get the estimated parameters.
+
+        Attributes
+        ----------
+        estimator : BaseTailEstimator
+            The estimator instance used for estimation.
+        k_arr_ : np.ndarray
+            Array of order statistics.
+        xi_arr_ : np.ndarray
+            Array of tail index estimates (GPD shapes).
+        sigma_arr_ : np.ndarray
+            Array of GPD scale estimates.
+
+        Returns
+        -------
+        TailEstimatorResult
+        """
+        if self.results is None:
+            raise ValueError("Model not fitted yet. Call fit() first.")
+
+        k_arr, xi_arr, sigma_arr = self.results
+
+        res = {
+            "estimator": self,
+            "k_arr_": k_arr,
+            "xi_arr_": xi_arr,
+            "sigma_arr_": sigma_arr,
+        }
+
+        return TailEstimatorResult(res)
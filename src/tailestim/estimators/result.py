@@ -1,7 +1,9 @@
-from typing import Any, ClassVar, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional, Tuple, Union
 
 import numpy as np
 
+from .tail_methods import tail_quantile, tail_sf
+
 
 class TailEstimatorResult:
     """
@@ -23,6 +25,8 @@ class TailEstimatorResult:
         Optimal order statistic (k*).
     bootstrap_results_ : dict
         Bootstrap results.
+    n_replicates_ : int
+        Number of bootstrap replicates drawn per bootstrap level.
     k_min_ : float
         Minimum AMSE fraction.
     amse_ : np.ndarray
@@ -31,6 +35,26 @@ class TailEstimatorResult:
         Maximum index.
     x_arr_ : np.ndarray
         Fraction of order statistics.
+    sigma_arr_ : np.ndarray
+        GPD scale estimates.
+    xmin_ : float
+        Optimal xmin of a power-law fit.
+    ks_distance_ : float
+        Kolmogorov-Smirnov distance at the optimal xmin.
+    xmin_arr_ : np.ndarray
+        Candidate xmin values.
+    ks_arr_ : np.ndarray
+        Kolmogorov-Smirnov distances of the candidate xmin values.
+    p_value_ : float
+        Goodness-of-fit p-value.
+    ks_sims_ : np.ndarray
+        Kolmogorov-Smirnov distances of the simulated datasets.
+    n_sims_ : int
+        Number of simulated datasets.
+    upper_ : TailEstimatorResult
+        Result of the upper tail of a two-tailed fit.
+    lower_ : TailEstimatorResult
+        Result of the lower tail of a two-tailed fit.
     """
 
     # Mapping of keys to human-readable labels
@@ -40,8 +64,19 @@ class TailEstimatorResult:
         "gamma_": "Power law exponent (γ)",
         "k_arr_": "Order statistics",
         "xi_arr_": "Tail index estimates",
+        "sigma_arr_": "GPD scale estimates",
         "k_star_": "Optimal order statistic (k*)",
+        "xmin_": "Optimal xmin",
+        "ks_distance_": "KS distance",
+        "xmin_arr_": "Candidate xmin values",
+        "ks_arr_": "KS distances",
+        "p_value_": "Goodness-of-fit p-value",
+        "ks_sims_": "Simulated KS distances",
+        "n_sims_": "Number of simulations",
+        "upper_": "Upper tail",
+        "lower_": "Lower tail",
         "bootstrap_results_": "Bootstrap Results",
+        "n_replicates_": "Bootstrap replicates used",
         "first_bootstrap_": "First Bootstrap",
         "second_bootstrap_": "Second Bootstrap",
         "k_min_": "Minimum AMSE fraction",
@@ -114,3 +149,86 @@ class TailEstimatorResult:
         Return a string representation of the TailEstimatorResult.
         """
         return f"TailEstimatorResult(estimator={self.estimator.__class__.__name__})"
+
+    def _tail_parameters(
+        self, k: Optional[Union[int, np.ndarray]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """Sorted data, thresholds k, tail indices and GPD scales of a fit."""
+        ordered_data = getattr(getattr(self, "estimator", None), "ordered_data", None)
+        if ordered_data is None:
+            raise ValueError("The result does not hold the data of a fitted estimator.")
+        sigma_arr = getattr(self, "sigma_arr_", None)
+        if k is None:
+            if not hasattr(self, "k_star_"):
+                raise ValueError(
+                    "The estimator has no optimal threshold; specify the order statistic k."
+                )
+            k = np.asarray(self.k_star_)
+            xi = np.asarray(self.xi_star_)
+            scale = None
+        else:
+            k = np.asarray(k)
+            k_arr = self.k_arr_
+            index = np.minimum(np.searchsorted(k_arr, k), len(k_arr) - 1)
+            if np.any(k_arr[index] != k):
+                raise ValueError("Order statistics k must be values of k_arr_.")
+            xi = self.xi_arr_[index]
+            scale = None if sigma_arr is None else sigma_arr[index]
+        k = k.astype(np.int64)
+        if np.any((k < 1) | (k >= len(ordered_data))):
+            raise ValueError("Order statistics k must lie in [1, n - 1].")
+        return ordered_data, k, xi, scale
+
+    def quantile(
+        self, q: Union[float, np.ndarray], k: Optional[Union[int, np.ndarray]] = None
+    ) -> Union[float, np.ndarray]:
+        """
+        Extreme quantiles from the fitted tail.
+
+        Above the threshold X_(k+1), the Weissman estimator
+        X_(k+1) * (k / (n * (1 - q)))**xi is used (or the GPD quantile for
+        peaks-over-threshold fits); below it, the empirical quantile. The
+        sorted data stored with the fit are reused.
+
+        Parameters
+        ----------
+        q : float or np.ndarray
+            Quantile level(s) in [0, 1], e.g. 0.9999.
+        k : int or np.ndarray, optional
+            Order statistic(s) of the threshold, values of ``k_arr_``.
+            Defaults to the optimal ``k_star_`` and ``xi_star_``.
+
+        Returns
+        -------
+        float or np.ndarray
+            Quantiles with shape ``k.shape + q.shape``.
+        """
+        ordered_data, k, xi, scale = self._tail_parameters(k)
+        return tail_quantile(ordered_data, k, xi, q, scale)[()]
+
+    def sf(
+        self, x: Union[float, np.ndarray], k: Optional[Union[int, np.ndarray]] = None
+    ) -> Union[float, np.ndarray]:
+        """
+        Exceedance probabilities P(X > x) from the fitted tail.
+
+        Above the threshold X_(k+1), the Weissman estimate
+        k / n * (x / X_(k+1))**(-1 / xi) is used (or the GPD survival
+        function for peaks-over-threshold fits); below it, the empirical
+        survival function. The sorted data stored with the fit are reused.
+
+        Parameters
+        ----------
+        x : float or np.ndarray
+            Query value(s).
+        k : int or np.ndarray, optional
+            Order statistic(s) of the threshold, values of ``k_arr_``.
+            Defaults to the optimal ``k_star_`` and ``xi_star_``.
+
+        Returns
+        -------
+        float or np.ndarray
+            Exceedance probabilities with shape ``k.shape + x.shape``.
+        """
+        ordered_data, k, xi, scale = self._tail_parameters(k)
+        return tail_sf(ordered_data, k, xi, x, scale)[()]
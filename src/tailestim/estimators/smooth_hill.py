@@ -1,10 +1,11 @@
 """Smooth Hill estimator implementation for tail index estimation."""
 
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
 from .base import BaseTailEstimator
+from .cost import estimates_phase
 from .result import TailEstimatorResult
 from .tail_methods import smooth_hill_estimator as smooth_hill_estimate
 
@@ -20,15 +21,22 @@ class SmoothHillEstimator(BaseTailEstimator):
     r_smooth : int, default=2
         Integer parameter controlling the width of smoothing window.
         Typically small value such as 2 or 3.
+    prefix_block_size : int, optional
+        Number of elements per block of blocked, thread-parallel prefix
+        sums of the Hill estimates, which round more accurately on large
+        data. By default plain NumPy cumulative sums are used.
     **kwargs : dict
         Additional parameters (not used by this estimator).
 
     """
 
-    def __init__(self, r_smooth: int = 2, **kwargs):
+    def __init__(
+        self, r_smooth: int = 2, prefix_block_size: Optional[int] = None, **kwargs
+    ):
         # Smooth Hill estimator doesn't use bootstrap
         super().__init__(bootstrap=False, **kwargs)
         self.r_smooth = r_smooth
+        self.prefix_block_size = prefix_block_size
 
     def _estimate(self, ordered_data: np.ndarray) -> Tuple:
         """Estimate the tail index using the Smooth Hill method.
@@ -43,7 +51,26 @@ class SmoothHillEstimator(BaseTailEstimator):
         Tuple
             Contains estimation results from smooth_hill_estimator.
         """
-        return smooth_hill_estimate(ordered_data, r_smooth=self.r_smooth)
+        return smooth_hill_estimate(
+            ordered_data,
+            r_smooth=self.r_smooth,
+            prefix_block_size=self.prefix_block_size,
+        )
+
+    def _phases(self, n: int) -> List[Tuple]:
+        """Phases of a fit to n values: the sort, the smooth Hill estimates.
+
+        Parameters
+        ----------
+        n : int
+            Number of values of the data.
+
+        Returns
+        -------
+        List[Tuple]
+            Phases of the fit (see ``BaseTailEstimator._phases``).
+        """
+        return [*super()._phases(n), estimates_phase(n, "smooth_hill", n_arrays=2)]
 
     def get_params(self) -> Dict[str, Any]:
         """Get the parameters of the estimator.
@@ -53,7 +80,11 @@ class SmoothHillEstimator(BaseTailEstimator):
         dict
             Dictionary containing the parameters of the estimator.
         """
-        return {"r_smooth": self.r_smooth, **self.kwargs}
+        return {
+            "r_smooth": self.r_smooth,
+            "prefix_block_size": self.prefix_block_size,
+            **self.kwargs,
+        }
 
     def get_result(self) -> TailEstimatorResult:
         """Get the estimated parameters.
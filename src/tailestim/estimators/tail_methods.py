@@ -1,9 +1,13 @@
+import copy
 import logging
-import sys
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
+from numpy.random import SeedSequence
 
-logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
 
 
 def add_uniform_noise(data_sequence, p=1, base_seed=None):
@@ -21,7 +25,7 @@ def add_uniform_noise(data_sequence, p=1, base_seed=None):
         numpy array with noise-added entries.
     """
     if p < 1:
-        logging.error("Parameter p should be greater or equal to 1.")
+        logger.error("Parameter p should be greater or equal to 1.")
         return None
 
     # UPD: adding random seed
@@ -89,10 +93,1519 @@ def get_ccdf(degree_sequence):
     return uniques[::-1], (1.0 - cumprob)[::-1]
 
 
+# =============================================
+# ========== Blocked Prefix Sums ==========
+# =============================================
+
+PREFIX_BLOCK_SIZE = 1 << 18
+PREFIX_SUB_BLOCK = 1024
+
+
+def map_blocks(function, n, block_size=PREFIX_BLOCK_SIZE, n_jobs=None):
+    """
+    Function to apply a function to consecutive blocks of a range of
+    indices, on a thread pool if there is more than one block. NumPy
+    releases the GIL in its array loops, so the blocks run in parallel.
+
+    Args:
+        function:   function mapping (start, stop) to a result.
+        n:          length of the index range.
+        block_size: number of indices per block.
+        n_jobs:     number of threads (default is the number of CPUs).
+
+    Returns:
+        list of the results of the blocks in order.
+    """
+    bounds = [(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(bounds))
+    if n_jobs <= 1:
+        return [function(start, stop) for start, stop in bounds]
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(lambda bound: function(*bound), bounds))
+
+
+def _two_level_cumsum(values, out, sub_block=PREFIX_SUB_BLOCK):
+    """
+    Cumulative sums along the rows of a 2D array, computed within
+    sub-blocks and offset by the cumulative (pairwise) sums of the
+    sub-block totals, so that rounding errors grow with
+    sub_block + n / sub_block instead of n.
+
+    Args:
+        values:    2D array of summands.
+        out:       2D array (or view) of the same shape receiving the
+                   cumulative sums.
+        sub_block: number of elements per sub-block.
+
+    Returns:
+        numpy array of the totals of the rows.
+    """
+    n_terms, n = values.shape
+    full = n - n % sub_block
+    offsets = np.zeros(n_terms)
+    if full:
+        shape = (n_terms, full // sub_block, sub_block)
+        body = values[:, :full].reshape(shape)
+        cumsums = out[:, :full].reshape(shape)
+        np.cumsum(body, axis=2, out=cumsums)
+        totals = body.sum(axis=2)
+        sub_offsets = np.cumsum(totals, axis=1)
+        cumsums[:, 1:, :] += sub_offsets[:, :-1, None]
+        offsets = sub_offsets[:, -1]
+    if full < n:
+        np.cumsum(values[:, full:], axis=1, out=out[:, full:])
+        out[:, full:] += offsets[:, None]
+        offsets = offsets + values[:, full:].sum(axis=1)
+    return offsets
+
+
+def blocked_cumsums(
+    n, summands, block_size=PREFIX_BLOCK_SIZE, n_jobs=None, sub_block=PREFIX_SUB_BLOCK
+):
+    """
+    Function to compute cumulative sums of several sequences of length n
+    blockwise on a thread pool. The summands are generated per block and
+    cumulated within the block with a two-level (sub-block) scheme; the
+    carries between blocks, the exactly rounded sums (math.fsum) of the
+    preceding block totals, are added in a second parallel pass.
+
+    Args:
+        n:          length of the sequences.
+        summands:   function mapping (start, stop) to a 2D array of
+                    shape (number of sequences, stop - start).
+        block_size: number of elements per block.
+        n_jobs:     number of threads (default is the number of CPUs).
+        sub_block:  number of elements per sub-block.
+
+    Returns:
+        2D array of cumulative sums of shape (number of sequences, n).
+    """
+    return _blocked_cumsums(n, summands, block_size, n_jobs, sub_block)[0]
+
+
+def _blocked_cumsums(n, summands, block_size, n_jobs, sub_block, kept=None):
+    """
+    Blocked cumulative sums (see blocked_cumsums) and the totals of the
+    blocks, reusing the leading blocks of a previous computation.
+
+    Args:
+        n, summands, block_size, n_jobs, sub_block: see blocked_cumsums.
+        kept: tuple of the cumulative sums and the block totals of a
+              previous computation with the same block size, restricted
+              to leading full blocks whose summands are unchanged, or None.
+
+    Returns:
+        out:    2D array of cumulative sums of shape (number of sequences, n).
+        totals: 2D array of the totals of the blocks, one row per block.
+    """
+    n_terms = len(summands(0, 0))
+    out = np.empty((n_terms, n))
+    kept_totals = []
+    if kept is not None:
+        kept_sums, kept_totals = kept
+        out[:, : len(kept_totals) * block_size] = kept_sums
+        kept_totals = list(kept_totals)
+    first = len(kept_totals) * block_size
+
+    def cumulate(start, stop):
+        start, stop = first + start, first + stop
+        return _two_level_cumsum(summands(start, stop), out[:, start:stop], sub_block)
+
+    totals = np.array(
+        kept_totals
+        + map_blocks(cumulate, n - first, block_size=block_size, n_jobs=n_jobs)
+    )
+    carries = [
+        [math.fsum(totals[:block, term]) for term in range(n_terms)]
+        for block in range(len(totals))
+    ]
+
+    def add_carry(start, stop):
+        start, stop = first + start, first + stop
+        out[:, start:stop] += np.array(carries[start // block_size])[:, None]
+
+    map_blocks(add_carry, n - first, block_size=block_size, n_jobs=n_jobs)
+    return out, totals
+
+
+def log_power_cumsums(ordered_data, n_powers, block_size=None, n_jobs=None, cache=None):
+    """
+    Function to compute the logs of an ordered data sequence and the
+    cumulative sums of their powers, over all but the last element.
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+        n_powers:     highest power of the logs.
+        block_size:   None for plain NumPy passes, or the number of elements
+                      per block of the thread-parallel, compensated
+                      computation (see blocked_cumsums).
+        n_jobs:       number of threads (default is the number of CPUs).
+        cache:        PrefixSumCache of a previous computation on data
+                      sharing a prefix with ordered_data, updated in
+                      place, or None.
+
+    Returns:
+        logs:    numpy array of the logs of the data.
+        cumsums: list of numpy arrays of the cumulative sums of logs**p
+                 over ordered_data[:-1], for p = 1, ..., n_powers.
+    """
+    n = len(ordered_data)
+    logs = np.empty(n)
+    kept, n_logs = None, 0
+    if cache is not None:
+        kept, n_logs = cache.reusable(n_powers, block_size)
+        if n_logs:
+            logs[:n_logs] = cache.logs[:n_logs]
+
+    if block_size is None:
+        np.log(ordered_data[n_logs:], out=logs[n_logs:], dtype=np.float64)
+        cumsums = np.empty((n_powers, max(n - 1, 0)))
+        n_kept = 0 if kept is None else kept.shape[1]
+        for p in range(n_powers):
+            values = logs[max(n_kept - 1, 0) : n - 1] ** (p + 1)
+            if n_kept:
+                # continue the sequential sums of np.cumsum from the last
+                # kept one, which rounds exactly as the sums from scratch
+                cumsums[p, :n_kept] = kept[p]
+                values[0] = kept[p, -1]
+                cumsums[p, n_kept:] = np.cumsum(values)[1:]
+            else:
+                np.cumsum(values, out=cumsums[p])
+        if cache is not None:
+            cache.store(logs, cumsums, None, None)
+        return logs, list(cumsums)
+
+    def log_block(start, stop):
+        start, stop = n_logs + start, n_logs + stop
+        np.log(ordered_data[start:stop], out=logs[start:stop], dtype=np.float64)
+
+    map_blocks(log_block, n - n_logs, block_size=block_size, n_jobs=n_jobs)
+
+    def powers(start, stop):
+        values = np.empty((n_powers, stop - start))
+        values[0] = logs[start:stop]
+        for p in range(1, n_powers):
+            np.multiply(values[p - 1], values[0], out=values[p])
+        return values
+
+    cumsums, totals = _blocked_cumsums(
+        n - 1, powers, block_size, n_jobs, PREFIX_SUB_BLOCK, kept=kept
+    )
+    if cache is not None:
+        cache.store(logs, cumsums, totals, block_size)
+    return logs, list(cumsums)
+
+
+class PrefixSumCache:
+    """
+    Logs and cumulative sums of the log powers of an ordered data
+    sequence, kept between the fits of growing data.
+
+    When new values are merged into the data (see merge_descending), only
+    the values from the first changed position on differ. The logs before
+    it are reused. Without a block size, the prefix sums before it are
+    kept and the sums after it continue from the last kept one; with a
+    block size, the prefix sums of the blocks that end before it, with
+    their carries, are reused and the other blocks are recomputed. The
+    results are identical to a computation from scratch with the same
+    block size.
+    """
+
+    def __init__(self):
+        self.logs = None
+        self.cumsums = None
+        self.totals = None
+        self.block_size = None
+        self.n_valid = 0
+
+    def changed(self, first_changed):
+        """
+        Cache for the data after a change at the first_changed-th value,
+        sharing the arrays of this one.
+        """
+        cache = copy.copy(self)
+        cache.n_valid = min(self.n_valid, first_changed)
+        return cache
+
+    def reusable(self, n_powers, block_size):
+        """
+        Reusable parts for a computation with n_powers and block_size.
+
+        Returns:
+            kept:   without a block_size, the array of the leading
+                    cumulative sums; with one, tuple of the cumulative sums
+                    and totals of the leading full blocks; or None.
+            n_logs: number of leading logs to reuse.
+        """
+        if self.logs is None:
+            return None, 0
+        n_logs = self.n_valid
+        n_sums = min(n_logs, self.cumsums.shape[1])
+        if block_size != self.block_size or n_powers > len(self.cumsums):
+            n_sums = 0
+        if block_size is None:
+            return (self.cumsums[:n_powers, :n_sums] if n_sums else None), n_logs
+        n_blocks = n_sums // block_size
+        if not n_blocks:
+            return None, n_logs
+        kept = (
+            self.cumsums[:n_powers, : n_blocks * block_size],
+            self.totals[:n_blocks, :n_powers],
+        )
+        return kept, n_logs
+
+    def store(self, logs, cumsums, totals, block_size):
+        """Keep the results of a computation on the current data."""
+        if (
+            self.cumsums is not None
+            and block_size == self.block_size
+            and len(cumsums) < len(self.cumsums)
+        ):
+            # keep the cache of the higher powers
+            return
+        self.logs, self.cumsums, self.totals = logs, cumsums, totals
+        self.block_size = block_size
+        self.n_valid = len(logs)
+
+
+def merge_descending(ordered_data, new_data):
+    """
+    Function to merge new values into data in decreasing order. The new
+    values are sorted and inserted in one O(n + m) pass.
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+        new_data:     numpy array of the new values, in any order.
+
+    Returns:
+        merged:        numpy array of all values in decreasing order, with
+                       the dtype of the concatenated data.
+        first_changed: index of the first value of merged that may differ
+                       from ordered_data.
+    """
+    new_data = np.asarray(new_data).ravel()
+    dtype = np.result_type(ordered_data, new_data)
+    new_data = np.sort(new_data.astype(dtype, copy=False))
+    n = len(ordered_data)
+    # merged in increasing order and returned as a reversed view, like the
+    # data sorted by fit, so that the elementwise passes round alike
+    increasing = ordered_data[::-1].astype(dtype, copy=False)
+    positions = np.searchsorted(increasing, new_data, side="right")
+    merged = np.insert(increasing, positions, new_data)[::-1]
+    return merged, n - int(positions[-1]) if len(positions) else n
+
+
+# =====================================================
+# ========== Double-bootstrap threshold search ==========
+# =====================================================
+
+
+class BootstrapLevel:
+    """
+    Running average of a bootstrap statistic over resamples of a fixed size.
+
+    Replicates are added to the accumulated sums, so the averaged AMSE
+    curve can be re-evaluated (e.g. over a different minimization window)
+    or extended with more replicates without redoing completed work.
+
+    Two optional variance reduction schemes are available. With antithetic
+    resampling, replicates are drawn in pairs where the second resample
+    takes the mirrored order statistics (index i -> n-1-i) of the first.
+    With a control variate, a second curve with exactly known bootstrap
+    expectation is computed for every resample (see exceedance_control),
+    and the averaged AMSE is corrected by the regression of the AMSE
+    contributions on it.
+
+    Args:
+        ordered_data: numpy array from which resamples are drawn.
+                      Decreasing ordering is required.
+        sample_size:  size of each bootstrap resample.
+        statistic:    function mapping a resample in decreasing order
+                      to an array of AMSE contributions.
+        x_arr:        array of fractions of order statistics associated
+                      with the AMSE curve.
+        eps_stop:     parameter controlling range of AMSE minimization.
+                      Defined as the fraction of order statistics to consider
+                      during the AMSE minimization step.
+        antithetic:   flag to switch on/off antithetic resampling pairs.
+        control:      tuple of a function mapping a resample in decreasing
+                      order to the control curve and the array of its
+                      expected values, or None.
+        rng_mode:     "legacy" to draw every resample from a generator
+                      seeded by the generator passed to add_replicates,
+                      or "fast" to draw all resamples from it directly
+                      (see replicate_rng).
+        interrupt:    function called before every resample, which raises
+                      to abandon the drawing, or None.
+    """
+
+    def __init__(
+        self,
+        ordered_data,
+        sample_size,
+        statistic,
+        x_arr,
+        eps_stop,
+        antithetic=False,
+        control=None,
+        rng_mode="legacy",
+        interrupt=None,
+    ):
+        self.ordered_data = ordered_data
+        self.sample_size = sample_size
+        self.statistic = statistic
+        self.x_arr = x_arr
+        self.max_index = (np.abs(x_arr - eps_stop)).argmin()
+        if rng_mode not in ("legacy", "fast"):
+            raise ValueError(
+                f"Unknown random stream mode {rng_mode!r}. Use 'legacy' or 'fast'."
+            )
+        self.antithetic = antithetic
+        self.control = control
+        self.rng_mode = rng_mode
+        self.interrupt = interrupt
+        self.sums = None
+        self.sq_sums = None
+        self.pair_sq_sums = None
+        self.n_replicates = 0
+        self.n_drawn = 0
+
+    def add_replicates(self, r_bootstrap, base_rng):
+        """
+        Draw r_bootstrap resamples and add their statistic to the sums.
+
+        Args:
+            r_bootstrap: number of resamples to draw. In antithetic mode
+                         it is rounded up to an even number.
+            base_rng:    numpy Generator from which the per-resample
+                         seeds are drawn, or the resamples in fast mode.
+        """
+        if self.antithetic:
+            n = len(self.ordered_data)
+            for _i in range((r_bootstrap + 1) // 2):
+                if self.interrupt is not None:
+                    self.interrupt()
+                cur_rng = self.replicate_rng(base_rng)
+                indices = np.sort(cur_rng.integers(0, n, self.sample_size))
+                # the mirrored indices are sorted by reversing the array
+                first = self._accumulate(self.ordered_data[indices])
+                second = self._accumulate(self.ordered_data[n - 1 - indices[::-1]])
+                self._accumulate_pair(first, second)
+            return
+        for _i in range(r_bootstrap):
+            if self.interrupt is not None:
+                self.interrupt()
+            cur_rng = self.replicate_rng(base_rng)
+            sample = cur_rng.choice(self.ordered_data, self.sample_size, replace=True)
+            sample[::-1].sort()
+            self._accumulate(sample)
+
+    def replicate_rng(self, base_rng):
+        """
+        Generator of one resample (a pair in antithetic mode, a batch for
+        weighted levels).
+
+        In legacy mode a new generator is seeded from base_rng for every
+        resample, which draws the resamples of earlier versions for a
+        given base_seed but costs a generator construction per resample.
+        In fast mode resamples are drawn from base_rng directly.
+        """
+        if self.rng_mode == "fast":
+            return base_rng
+        return np.random.default_rng(base_rng.integers(0, 1_000_000))
+
+    def _accumulate(self, sample):
+        current = self.statistic(sample)
+        control = None
+        if self.control is not None:
+            control = self.control[0](sample)
+        if self.sums is None:
+            self.sums = np.zeros(len(current))
+            self.sq_sums = np.zeros(len(current))
+            if self.control is not None:
+                self.control_sums = np.zeros(len(control))
+                self.control_sq_sums = np.zeros(len(control))
+                self.cross_sums = np.zeros(len(control))
+        self.sums += current
+        self.sq_sums += current * current
+        if self.control is not None:
+            self.control_sums += control
+            self.control_sq_sums += control * control
+            self.cross_sums += current * control
+        self.n_replicates += 1
+        self.n_drawn += 1
+        return current, control
+
+    def _accumulate_pair(self, first, second):
+        """
+        Add the second moments of the mean of an antithetic pair, the
+        independent unit of the Monte Carlo standard error.
+        """
+        pair = 0.5 * (first[0] + second[0])
+        if self.pair_sq_sums is None:
+            self.pair_sq_sums = np.zeros(len(pair))
+            if self.control is not None:
+                self.pair_control_sq_sums = np.zeros(len(pair))
+                self.pair_cross_sums = np.zeros(len(pair))
+        self.pair_sq_sums += pair * pair
+        if self.control is not None:
+            pair_control = 0.5 * (first[1] + second[1])
+            self.pair_control_sq_sums += pair_control * pair_control
+            self.pair_cross_sums += pair * pair_control
+
+    def aligned_block(self, size):
+        """
+        Round a block size up so that drawing replicates in blocks of it
+        consumes the same seeds as drawing them at once (pairs in
+        antithetic mode).
+        """
+        return size + size % 2 if self.antithetic else size
+
+    def skip_replicates(self, r_bootstrap, base_rng):
+        """
+        Advance base_rng past the seeds add_replicates would draw for
+        r_bootstrap replicates, without drawing the replicates.
+        """
+        n_seeds = (r_bootstrap + 1) // 2 if self.antithetic else r_bootstrap
+        for _i in range(n_seeds):
+            base_rng.integers(0, 1_000_000)
+
+    def _control_fit(self, pairs=False):
+        """
+        Control variate coefficients and explained variance per index, of
+        the replicates or, if pairs, of the means of antithetic pairs.
+        """
+        mean = self.sums / self.n_replicates
+        control_mean = self.control_sums / self.n_replicates
+        if pairs:
+            n = self.n_replicates // 2
+            control_sq_sums, cross_sums = (
+                self.pair_control_sq_sums,
+                self.pair_cross_sums,
+            )
+        else:
+            n = self.n_replicates
+            control_sq_sums, cross_sums = self.control_sq_sums, self.cross_sums
+        control_var = control_sq_sums / n - control_mean * control_mean
+        cov = cross_sums / n - mean * control_mean
+        with np.errstate(divide="ignore", invalid="ignore"):
+            beta = np.where(control_var > 0, cov / control_var, 0.0)
+        beta = np.nan_to_num(beta, nan=0.0, posinf=0.0, neginf=0.0)
+        return beta, control_mean, beta * cov
+
+    @property
+    def amse(self):
+        """Averaged AMSE curve over all replicates drawn so far."""
+        amse = self.sums / self.n_replicates
+        if self.control is not None and self.n_replicates > 1:
+            beta, control_mean, _ = self._control_fit()
+            amse = amse - beta * (control_mean - self.control[1])
+        return amse
+
+    @property
+    def standard_error(self):
+        """
+        Monte Carlo standard error of the averaged AMSE curve. The members
+        of an antithetic pair are dependent, so in antithetic mode it is
+        estimated from the n/2 pair means.
+        """
+        pairs = self.antithetic
+        n = self.n_replicates // 2 if pairs else self.n_replicates
+        if n < 2:
+            return np.full(len(self.sums), np.inf)
+        mean = self.sums / self.n_replicates
+        sq_sums = self.pair_sq_sums if pairs else self.sq_sums
+        var = sq_sums / n - mean * mean
+        if self.control is not None:
+            var = var - self._control_fit(pairs)[2]
+        var = np.maximum(var, 0.0) * n / (n - 1)
+        return np.sqrt(var / n)
+
+    def relative_error(self, index, min_index=0, width=0.05):
+        """
+        Relative standard error of the averaged AMSE around a minimum.
+
+        Args:
+            index:     index of the AMSE minimum.
+            min_index: left boundary of the minimization window.
+            width:     half-width of the neighbourhood of the minimum,
+                       as a fraction of the minimization window.
+
+        Returns:
+            ratio of the mean standard error to the mean AMSE over the
+            neighbourhood of index.
+        """
+        half = max(1, int(width * (self.max_index - min_index)))
+        window = slice(max(min_index, index - half), index + half + 1)
+        amse = np.nanmean(self.amse[window])
+        if not amse > 0:
+            return np.inf
+        return np.nanmean(self.standard_error[window]) / amse
+
+    def order_statistic(self, index):
+        """Number of order statistics of a resample at an AMSE curve index."""
+        return index + 1
+
+    def window_start(self, min_index):
+        """
+        Index of the AMSE curve at which a minimization window starts
+        whose left boundary is min_index order statistics of a resample,
+        counted from 0.
+        """
+        return min_index
+
+    def argmin(self, min_index=0):
+        """
+        Index of the AMSE minimum within [min_index, max_index).
+
+        Args:
+            min_index: left boundary of the minimization window.
+
+        Returns:
+            index into the AMSE curve of its minimum inside the window.
+        """
+        return np.nanargmin(self.amse[min_index : self.max_index]) + min_index
+
+
+class WeightedBootstrapLevel(BootstrapLevel):
+    """
+    Sort-free weighted bootstrap level.
+
+    Instead of drawing and sorting resamples, every replicate is a weight
+    vector over the (fixed) order of the data, and the statistic is
+    evaluated from weighted cumulative sums of precomputed log power
+    tables, batched across replicates (see get_weighted_moments_estimates).
+    The AMSE curve is indexed by the order statistics of the data; index
+    j corresponds to (j+1)*m/n order statistics of a resample of size m.
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+        sample_size:  bootstrap sample size m.
+        statistic:    function mapping the weighted moments arrays to
+                      an array of AMSE contributions.
+        n_moments:    number of weighted moments passed to statistic.
+        x_arr:        array of fractions of order statistics of the data.
+        eps_stop:     parameter controlling range of AMSE minimization.
+                      Defined as the fraction of order statistics to consider
+                      during the AMSE minimization step.
+        weights:      "multinomial" for resample counts of m draws with
+                      replacement (the classical bootstrap in distribution)
+                      or "bayesian" for Dirichlet weights with concentration
+                      m/n per value, scaled to a total of m.
+        batch_size:   number of replicates evaluated at once. Defaults to
+                      a batch of about 2**20 weights.
+        rng_mode:     "legacy" or "fast" (see BootstrapLevel).
+        interrupt:    function called before every batch, which raises to
+                      abandon the drawing, or None.
+    """
+
+    def __init__(
+        self,
+        ordered_data,
+        sample_size,
+        statistic,
+        n_moments,
+        x_arr,
+        eps_stop,
+        weights="multinomial",
+        batch_size=None,
+        rng_mode="legacy",
+        interrupt=None,
+    ):
+        if weights not in ("multinomial", "bayesian"):
+            raise ValueError(
+                f"Unknown bootstrap weights {weights!r}. "
+                "Use 'multinomial' or 'bayesian'."
+            )
+        super().__init__(
+            ordered_data,
+            sample_size,
+            statistic,
+            x_arr,
+            eps_stop,
+            rng_mode=rng_mode,
+            interrupt=interrupt,
+        )
+        logs = np.log(ordered_data, dtype=np.float64)
+        self.log_powers = [logs**p for p in range(1, n_moments + 1)]
+        self.weights = weights
+        n = len(ordered_data)
+        self.batch_size = batch_size or max(1, (1 << 20) // n)
+
+    def draw_weights(self, size, rng):
+        """
+        Draw a batch of weight vectors.
+
+        Args:
+            size: number of weight vectors.
+            rng:  numpy Generator used for drawing.
+
+        Returns:
+            2D numpy array with one weight vector per row.
+        """
+        n, m = len(self.ordered_data), self.sample_size
+        if self.weights == "multinomial":
+            indices = rng.integers(0, n, (size, m))
+            indices += n * np.arange(size)[:, None]
+            return np.bincount(indices.ravel(), minlength=size * n).reshape(size, n)
+        weights = rng.standard_gamma(m / float(n), (size, n))
+        weights *= m / weights.sum(axis=1, keepdims=True)
+        return weights
+
+    def add_replicates(self, r_bootstrap, base_rng):
+        """
+        Draw r_bootstrap weight vectors and add their statistic to the sums.
+
+        Args:
+            r_bootstrap: number of replicates to draw.
+            base_rng:    numpy Generator from which the per-batch
+                         seeds are drawn, or the weights in fast mode.
+        """
+        done = 0
+        while done < r_bootstrap:
+            if self.interrupt is not None:
+                self.interrupt()
+            size = min(self.batch_size, r_bootstrap - done)
+            weights = self.draw_weights(size, self.replicate_rng(base_rng))
+            moments = get_weighted_moments_estimates(self.log_powers, weights)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                current = self.statistic(*moments)
+            if self.sums is None:
+                self.sums = np.zeros(current.shape[1])
+                self.sq_sums = np.zeros(current.shape[1])
+            self.sums += current.sum(axis=0)
+            self.sq_sums += (current * current).sum(axis=0)
+            self.n_replicates += size
+            self.n_drawn += size
+            done += size
+
+    def aligned_block(self, size):
+        """Round a block size up to whole batches (see BootstrapLevel)."""
+        return -(-size // self.batch_size) * self.batch_size
+
+    def skip_replicates(self, r_bootstrap, base_rng):
+        """Advance base_rng past the per-batch seeds of r_bootstrap replicates."""
+        for _i in range(-(-r_bootstrap // self.batch_size)):
+            base_rng.integers(0, 1_000_000)
+
+    def order_statistic(self, index):
+        """Number of order statistics of a resample at an AMSE curve index."""
+        k = int(np.round((index + 1) * self.sample_size / len(self.ordered_data)))
+        return max(k, 1)
+
+    def window_start(self, min_index):
+        """
+        Index of the AMSE curve at which a minimization window starts
+        whose left boundary is min_index order statistics of a resample
+        (see BootstrapLevel). The window starts at no less than 2 expected
+        order statistics: the first curve indices carry a fraction of one
+        resample value, and with Bayesian weights a tiny, non-zero weight
+        whose curves are dominated by a single value.
+        """
+        k = max(min_index + 1, 2)
+        return int(np.ceil(k * len(self.ordered_data) / self.sample_size)) - 1
+
+
+def bootstrap_sample_sizes(n, t_bootstrap=0.5):
+    """
+    Sample sizes of the two bootstrap levels for a dataset of size n.
+
+    Args:
+        n:           size of the dataset.
+        t_bootstrap: parameter controlling the size of the 2nd
+                     bootstrap. Defined from n2 = n*(t_bootstrap).
+
+    Returns:
+        n1: size of the 1st bootstrap resamples.
+        n2: size of the 2nd bootstrap resamples.
+    """
+    eps_bootstrap = 0.5 * (1 + np.log(int(t_bootstrap * n)) / np.log(n))
+    n1 = int(n**eps_bootstrap)
+    n2 = int(n1 * n1 / float(n))
+    return n1, n2
+
+
+def bootstrap_rngs(base_seed, n_levels, rng_mode="legacy"):
+    """
+    Random generators of the bootstrap levels.
+
+    In legacy mode, all levels share one generator seeded with base_seed,
+    from which the per-resample seeds are drawn level after level, as in
+    earlier versions. In fast mode, every level draws its resamples
+    directly from its own generator, seeded by a child of the
+    SeedSequence of base_seed. The stream of the i-th level does not
+    depend on n_levels, so a single bootstrap draws the resamples of the
+    1st level of a double-bootstrap with the same seed.
+
+    Args:
+        base_seed: base random seed (None, int, SeedSequence, BitGenerator
+                   or Generator).
+        n_levels:  number of bootstrap levels.
+        rng_mode:  "legacy" or "fast" (see BootstrapLevel).
+
+    Returns:
+        list of n_levels numpy Generators.
+    """
+    if rng_mode != "fast":
+        return n_levels * [np.random.default_rng(seed=base_seed)]
+    if isinstance(base_seed, SeedSequence):
+        # spawn from a copy, so that every fit gets the same children
+        seed_seq = SeedSequence(
+            base_seed.entropy,
+            spawn_key=base_seed.spawn_key,
+            pool_size=base_seed.pool_size,
+        )
+    elif base_seed is None or isinstance(base_seed, (int, np.integer)):
+        seed_seq = SeedSequence(base_seed)
+    else:
+        # generators provide the entropy of the root
+        seed_seq = SeedSequence(np.random.default_rng(base_seed).integers(0, 2**63, 4))
+    return [np.random.default_rng(child) for child in seed_seq.spawn(n_levels)]
+
+
+def _bootstrap_level(
+    ordered_data,
+    sample_size,
+    statistic,
+    x_grid,
+    eps_stop,
+    antithetic=False,
+    control=None,
+    weights=None,
+    weighted_statistic=None,
+    batch_size=None,
+    rng_mode="legacy",
+    interrupt=None,
+):
+    """
+    Create the bootstrap level of one sample size for the bootstrap drivers.
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+        sample_size:  bootstrap sample size.
+        statistic, x_grid, eps_stop, antithetic, control, weights,
+        weighted_statistic, batch_size, rng_mode, interrupt: see
+        double_bootstrap.
+
+    Returns:
+        BootstrapLevel, or WeightedBootstrapLevel if weights is set.
+    """
+    if weights is not None:
+        if antithetic or control is not None:
+            raise ValueError(
+                "The weighted bootstrap cannot be combined with antithetic "
+                "resampling or a control variate."
+            )
+        return WeightedBootstrapLevel(
+            ordered_data,
+            sample_size,
+            *weighted_statistic,
+            x_grid(len(ordered_data)),
+            eps_stop,
+            weights=weights,
+            batch_size=batch_size,
+            rng_mode=rng_mode,
+            interrupt=interrupt,
+        )
+    x_arr = x_grid(sample_size)
+    return BootstrapLevel(
+        ordered_data,
+        sample_size,
+        statistic,
+        x_arr,
+        eps_stop,
+        antithetic=antithetic,
+        control=None if control is None else control(x_arr),
+        rng_mode=rng_mode,
+        interrupt=interrupt,
+    )
+
+
+def _add_adaptive_replicates(
+    levels, min_indices, r_max, rngs, block, tol, progress=None, previous=None
+):
+    """
+    Add replicates to all levels in blocks until the AMSE minima settle.
+
+    Args:
+        levels:      list of BootstrapLevel objects, extended in place.
+        min_indices: left boundaries of the minimization windows.
+        r_max:       maximum number of replicates per level.
+        rngs:        numpy Generators of the levels (see bootstrap_rngs).
+        block:       number of replicates added per level per block.
+        tol:         tolerance on the relative argmin movement and on the
+                     relative standard error of the AMSE near the minimum.
+        progress:    function called with (level1, index1, level2, index2)
+                     after every block, or None.
+        previous:    indices of the AMSE minima expected before the first
+                     block, e.g. from a previous fit, or None.
+    """
+    while levels[0].n_replicates < r_max:
+        size = min(block, r_max - levels[0].n_replicates)
+        for level, rng in zip(levels, rngs):
+            level.add_replicates(size, rng)
+        indices = [level.argmin(m) for level, m in zip(levels, min_indices)]
+        if progress is not None:
+            progress(levels[0], indices[0], levels[1], indices[1])
+        if previous is not None and all(
+            abs(index - prev) <= tol * (index + 1)
+            and level.relative_error(index, m) <= tol
+            for level, index, prev, m in zip(levels, indices, previous, min_indices)
+        ):
+            break
+        previous = indices
+
+
+def double_bootstrap(
+    ordered_data,
+    statistic,
+    x_grid,
+    t_bootstrap=0.5,
+    r_bootstrap=500,
+    eps_stop=1.0,
+    base_seed=None,
+    min_index=0,
+    check_false_minimum=True,
+    max_resample=50,
+    window_shift=0.005,
+    adaptive=False,
+    adaptive_block=50,
+    adaptive_tol=0.1,
+    antithetic=False,
+    control=None,
+    weights=None,
+    weighted_statistic=None,
+    batch_size=None,
+    rng_mode="legacy",
+    warm_start=None,
+    label="",
+    progress=None,
+    interrupt=None,
+):
+    """
+    Function to run the two bootstrap levels shared by the double-bootstrap
+    procedures, including the handling of false AMSE minima.
+
+    A false minimum is detected when the 2nd bootstrap's AMSE minimum lies
+    to the right of the 1st bootstrap's one (k2 > k1). On each retry, the
+    left boundary of both minimization windows is moved right by
+    window_shift times the respective bootstrap sample size, and the
+    minima are re-located on the AMSE curves accumulated so far. The shift
+    is applied while a minimum sits within one shift of the left edge of
+    its window. Otherwise r_bootstrap more replicates are added to the
+    running averages of both levels; the grids of the levels never move,
+    so the replicates already drawn stay in the averages. If the false
+    minimum survives the added replicates, it lies in the expected AMSE
+    curves, and the next retry moves the 1st level's window past its
+    minimum. Windows that cannot be shifted any further (or whose shift
+    rounds to zero) leave only the added replicates.
+
+    In adaptive mode replicates are added to both levels in blocks of
+    adaptive_block, and drawing stops as soon as, for both levels, the
+    AMSE argmin moved by at most adaptive_tol (relative) since the previous
+    block and the relative standard error of the averaged AMSE around the
+    minimum is at most adaptive_tol. r_bootstrap is the upper bound, and
+    replicates added on retries number as many as the first round.
+
+    If a progress function is given, it is called with the current state
+    (level1, index1, level2, index2) after every block of adaptive_block
+    replicates per level while the first round is drawn. Outside adaptive
+    mode, the blocks are drawn from the seed streams each level would use
+    when drawn at once, so the final state does not depend on progress.
+
+    Args:
+        ordered_data:  numpy array for which double-bootstrap
+                       is performed. Decreasing ordering is required.
+        statistic:     function mapping a resample in decreasing order
+                       to an array of AMSE contributions.
+        x_grid:        function mapping a bootstrap sample size to the
+                       array of fractions of order statistics of the
+                       AMSE curve.
+        t_bootstrap:   parameter controlling the size of the 2nd
+                       bootstrap. Defined from n2 = n*(t_bootstrap).
+        r_bootstrap:   number of bootstrap resamplings for the 1st and 2nd
+                       bootstraps.
+        eps_stop:      parameter controlling range of AMSE minimization.
+                       Defined as the fraction of order statistics to consider
+                       during the AMSE minimization step.
+        base_seed:     base random seed for reproducibility of bootstrap
+                       (default is None).
+        min_index:     initial left boundary of the minimization windows.
+        check_false_minimum: flag to switch on/off the k2 > k1 check.
+        max_resample:  maximum number of retries when a false minimum is
+                       detected. Raises RuntimeError if exceeded.
+        window_shift:  fraction of the bootstrap sample size by which the
+                       minimization window is shifted on each retry.
+                       Set to 0 to draw fresh replicates on every retry.
+        adaptive:      flag to switch on/off adaptive early stopping.
+        adaptive_block: number of replicates added per level per block
+                       in adaptive mode.
+        adaptive_tol:  tolerance on the relative argmin movement and on
+                       the relative standard error of the AMSE near the
+                       minimum in adaptive mode.
+        antithetic:    flag to switch on/off antithetic resampling pairs
+                       (see BootstrapLevel).
+        control:       function mapping the x_arr of a bootstrap level to
+                       its control variate (see BootstrapLevel), or None
+                       to switch off the control variate.
+        weights:       None to draw and sort resamples, or the kind of
+                       weights of the sort-free weighted bootstrap
+                       ("multinomial" or "bayesian", see
+                       WeightedBootstrapLevel).
+        weighted_statistic: tuple of the function mapping weighted moments
+                       arrays to AMSE contributions and the number of
+                       moments it needs. Required if weights is set.
+        batch_size:    number of weighted replicates evaluated at once.
+        rng_mode:      "legacy" to seed a new generator for every resample
+                       from one generator shared by the levels, which
+                       draws the resamples of earlier versions, or
+                       "fast" to draw the resamples of every level from
+                       its own generator (see bootstrap_rngs).
+        warm_start:    fractions (x1, x2) of the AMSE minima of a previous
+                       fit to a subset of the data, or None. The replicates
+                       are then drawn adaptively, and drawing may stop
+                       after the first block if both minima are within
+                       adaptive_tol of the previous ones, which suits
+                       refits after appending a few observations.
+        label:         name of the estimator used in log messages.
+        progress:      function receiving intermediate states, or None.
+        interrupt:     function called before every resample (see
+                       BootstrapLevel), which raises to abandon the
+                       double-bootstrap, or None.
+
+    Returns:
+        level1:  BootstrapLevel of the 1st bootstrap (sample size n1).
+        index1:  index of the AMSE minimum of the 1st bootstrap.
+        level2:  BootstrapLevel of the 2nd bootstrap (sample size n2).
+        index2:  index of the AMSE minimum of the 2nd bootstrap.
+    """
+    n = len(ordered_data)
+    n1, n2 = bootstrap_sample_sizes(n, t_bootstrap)
+
+    # Accept random seed for reproducibility. Default seed is None.
+    rngs = bootstrap_rngs(base_seed, 2, rng_mode)
+
+    levels = [
+        _bootstrap_level(
+            ordered_data,
+            sample_size,
+            statistic,
+            x_grid,
+            eps_stop,
+            antithetic=antithetic,
+            control=control,
+            weights=weights,
+            weighted_statistic=weighted_statistic,
+            batch_size=batch_size,
+            rng_mode=rng_mode,
+            interrupt=interrupt,
+        )
+        for sample_size in (n1, n2)
+    ]
+    min_indices = [level.window_start(min_index) for level in levels]
+    if adaptive or warm_start is not None:
+        _add_adaptive_replicates(
+            levels,
+            min_indices,
+            r_bootstrap,
+            rngs,
+            adaptive_block,
+            adaptive_tol,
+            progress=progress,
+            previous=None
+            if warm_start is None
+            else [
+                int(np.argmin(np.abs(level.x_arr - x)))
+                for level, x in zip(levels, warm_start)
+            ],
+        )
+        r_bootstrap = levels[0].n_replicates
+    elif progress is not None:
+        if rng_mode == "legacy":
+            # the 2nd level draws from a copy of the generator advanced
+            # past the seeds of the 1st one, as if the levels were drawn
+            # in turn
+            rngs = [rngs[0], copy.deepcopy(rngs[0])]
+            levels[0].skip_replicates(r_bootstrap, rngs[1])
+        block = max(level.aligned_block(adaptive_block) for level in levels)
+        done = 0
+        while done < r_bootstrap:
+            size = min(block, r_bootstrap - done)
+            for level, rng in zip(levels, rngs):
+                level.add_replicates(size, rng)
+            done += size
+            index1, index2 = (level.argmin(m) for level, m in zip(levels, min_indices))
+            progress(levels[0], index1, levels[1], index2)
+        if rng_mode == "legacy":
+            rngs = [rngs[1], rngs[1]]
+    else:
+        for level, rng in zip(levels, rngs):
+            level.add_replicates(r_bootstrap, rng)
+
+    resample_count = 0
+    added = False
+    while True:
+        index1, index2 = (level.argmin(m) for level, m in zip(levels, min_indices))
+        k1, k2 = levels[0].order_statistic(index1), levels[1].order_statistic(index2)
+        if not check_false_minimum or k2 <= k1:
+            return levels[0], index1, levels[1], index2
+
+        resample_count += 1
+        logger.warning(
+            "Warning (%s): k2 > k1, AMSE false minimum suspected, resampling... (attempt %d/%d)",
+            label,
+            resample_count,
+            max_resample,
+        )
+        if resample_count >= max_resample:
+            raise RuntimeError(
+                f"{label} double-bootstrap failed to converge after "
+                f"{max_resample} resampling attempts (k2 > k1 persisted). "
+                f"Consider increasing max_resample or adjusting bootstrap parameters."
+            )
+
+        # move left AMSE boundary to avoid numerical issues, which helps if
+        # a minimum sits within one shift of the left edge, or if the false
+        # minimum survived more replicates and so lies in the expected curves
+        shifts = [int(window_shift * len(level.x_arr)) for level in levels]
+        shifted = [m + shift for m, shift in zip(min_indices, shifts)]
+        at_edge = any(
+            index < max(m + shift, m + 1)
+            for index, m, shift in zip((index1, index2), min_indices, shifts)
+        )
+        if added:
+            # the 1st level's minimum persists with more replicates: look
+            # for the next one to its right
+            shifted = [max(shifted[0], index1 + 1), shifted[1]]
+        if (
+            (at_edge or added)
+            and all(shifts)
+            and all(m < level.max_index for m, level in zip(shifted, levels))
+        ):
+            min_indices = shifted
+            added = False
+        else:
+            # extend the running averages, whose grids are unchanged, so no
+            # completed replicate is discarded
+            for level, rng in zip(levels, rngs):
+                level.add_replicates(r_bootstrap, rng)
+            added = True
+
+
+def single_bootstrap(
+    ordered_data,
+    statistic,
+    x_grid,
+    t_bootstrap=0.5,
+    r_bootstrap=500,
+    eps_stop=1.0,
+    base_seed=None,
+    min_index=0,
+    adaptive=False,
+    adaptive_block=50,
+    adaptive_tol=0.1,
+    antithetic=False,
+    control=None,
+    weights=None,
+    weighted_statistic=None,
+    batch_size=None,
+    rng_mode="legacy",
+    interrupt=None,
+):
+    """
+    Function to run the single bootstrap level of the m-out-of-n
+    bootstrap procedures.
+
+    The level has the sample size n1 of the 1st level of double_bootstrap
+    and draws its replicates from the same engine, so with equal seeds its
+    resamples are those of the double-bootstrap's 1st level. There is no
+    2nd level, which halves the cost, and no false minimum check.
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+        statistic, x_grid, t_bootstrap, r_bootstrap, eps_stop, base_seed,
+        min_index, adaptive, adaptive_block, adaptive_tol, antithetic,
+        control, weights, weighted_statistic, batch_size, rng_mode,
+        interrupt:    see double_bootstrap.
+
+    Returns:
+        level: BootstrapLevel of sample size n1.
+        index: index of its AMSE minimum.
+    """
+    n = len(ordered_data)
+    n1, _ = bootstrap_sample_sizes(n, t_bootstrap)
+
+    rngs = bootstrap_rngs(base_seed, 1, rng_mode)
+
+    level = _bootstrap_level(
+        ordered_data,
+        n1,
+        statistic,
+        x_grid,
+        eps_stop,
+        antithetic=antithetic,
+        control=control,
+        weights=weights,
+        weighted_statistic=weighted_statistic,
+        batch_size=batch_size,
+        rng_mode=rng_mode,
+        interrupt=interrupt,
+    )
+    min_index = level.window_start(min_index)
+    if adaptive:
+        _add_adaptive_replicates(
+            [level], [min_index], r_bootstrap, rngs, adaptive_block, adaptive_tol
+        )
+    else:
+        level.add_replicates(r_bootstrap, rngs[0])
+    return level, level.argmin(min_index)
+
+
+def single_bootstrap_threshold(
+    ordered_data,
+    estimates,
+    weighted_estimates,
+    xi_arr,
+    t_bootstrap=0.5,
+    r_bootstrap=500,
+    eps_stop=1.0,
+    verbose=False,
+    diagn_plots=False,
+    base_seed=None,
+    adaptive=False,
+    adaptive_block=50,
+    adaptive_tol=0.1,
+    antithetic=False,
+    control_variate=False,
+    weighted_bootstrap=None,
+    batch_size=None,
+    rng_mode="legacy",
+    k_pilot=None,
+    rho=-1.0,
+    label="",
+    interrupt=None,
+):
+    """
+    Function to perform the single-bootstrap (Hall-style m-out-of-n)
+    threshold selection.
+
+    The bootstrap AMSE of a resample of size n1 is the mean squared
+    deviation of its tail index estimates from a pilot estimate of the
+    full sample, taken at k_pilot = n^(2/3) order statistics by default
+    (a smaller pilot makes the minimum follow the pilot's noise). Its
+    minimum k1 is scaled to the full sample with the
+    rate of the optimal number of order statistics,
+    k_star = k1 * (n/n1)^(2|rho| / (1 + 2|rho|)),
+    for an assumed second order parameter rho.
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+        estimates:    function mapping a resample in decreasing order
+                      to its array of tail index estimates.
+        weighted_estimates: tuple of the function mapping weighted moments
+                      arrays to tail index estimates and the number of
+                      moments it needs (see WeightedBootstrapLevel).
+        xi_arr:       numpy array of tail index estimates of the full
+                      sample for the order statistics 1, ..., n - 1.
+        t_bootstrap, r_bootstrap, eps_stop, verbose, diagn_plots,
+        base_seed, adaptive, adaptive_block, adaptive_tol, antithetic,
+        control_variate, weighted_bootstrap, batch_size, rng_mode: see
+                      hill_dbs.
+        k_pilot:      number of order statistics of the pilot estimate.
+        rho:          assumed second order parameter (default -1).
+        label:        estimator name used in log messages.
+        interrupt:    function called before every resample, which raises
+                      to abandon the bootstrap, or None.
+
+    Returns:
+        Tuple with the same layout as hill_dbs, with None entries for
+        the missing 2nd bootstrap level.
+    """
+
+    n = len(ordered_data)
+    if k_pilot is None:
+        k_pilot = int(n ** (2.0 / 3.0))
+    xi_pilot = xi_arr[min(max(k_pilot, 1), n - 1) - 1]
+
+    def pilot_amse(sample):
+        return (estimates(sample) - xi_pilot) ** 2
+
+    def weighted_pilot_amse(*moments):
+        return (weighted_estimates[0](*moments) - xi_pilot) ** 2
+
+    def tail_control(x_arr):
+        return exceedance_control(ordered_data, x_arr[:-1])
+
+    level, index = single_bootstrap(
+        ordered_data,
+        pilot_amse,
+        linear_grid,
+        t_bootstrap=t_bootstrap,
+        r_bootstrap=r_bootstrap,
+        eps_stop=eps_stop,
+        base_seed=base_seed,
+        min_index=1,
+        adaptive=adaptive,
+        adaptive_block=adaptive_block,
+        adaptive_tol=adaptive_tol,
+        antithetic=antithetic,
+        control=tail_control if control_variate else None,
+        weights=weighted_bootstrap,
+        weighted_statistic=(weighted_pilot_amse, weighted_estimates[1]),
+        batch_size=batch_size,
+        rng_mode=rng_mode,
+        interrupt=interrupt,
+    )
+    n1 = level.sample_size
+    k1 = level.order_statistic(index)
+    exponent = 2.0 * abs(rho) / (1.0 + 2.0 * abs(rho))
+    k_star = int(np.round(k1 * (n / float(n1)) ** exponent))
+    if k_star < 2:
+        k_star = 2
+    if k_star >= n:
+        logger.warning("WARNING: estimated threshold k is larger than the size of data")
+        k_star = n - 1
+    if verbose:
+        logger.info("--- %s single-bootstrap information ---", label)
+        logger.info("Size of the bootstrap sample n1: %d", n1)
+        logger.info("Estimated k1: %d", k1)
+        logger.info("Estimated optimal k: %d", k_star)
+    x_arr, amse = (level.x_arr, level.amse) if diagn_plots else (None, None)
+    return (
+        k_star,
+        x_arr,
+        amse,
+        k1 / float(n1),
+        level.max_index,
+        None,
+        None,
+        None,
+        None,
+        level.n_drawn,
+    )
+
+
+# ===================================================
+# ========== Closed-form Threshold Selection ==========
+# ===================================================
+THRESHOLD_METHODS = (
+    "double_bootstrap",
+    "single_bootstrap",
+    "stability",
+    "guillou_hall",
+    "min_ks",
+)
+
+
+def stability_criterion(xi_arr, window=0.25, min_width=20):
+    """
+    Function to calculate the rolling variance of a tail index
+    estimates curve (Hill plot stability).
+
+    The j-th entry is the variance of the estimates for the order
+    statistics k, ..., k + w - 1 with k = j + 1 and the window width
+    w = max(min_width, window * k), i.e. a window of constant width
+    on the logarithmic k scale of the Hill plot. It is computed in
+    O(n) from cumulative sums of the estimates and their squares.
+
+    Args:
+        xi_arr:    numpy array of tail index estimates for the order
+                   statistics 1, 2, ... (NaN entries are skipped).
+        window:    relative width of the window.
+        min_width: minimal number of order statistics in the window.
+
+    Returns:
+        variance: numpy array of rolling variances, NaN where the
+                  window does not fit into the curve.
+    """
+    finite = np.isfinite(xi_arr)
+    # centre the values and accumulate from the large order statistics,
+    # so that the erratic estimates at small k cannot cancel the sums
+    # of the windows that do not contain them
+    values = np.where(finite, xi_arr - np.median(xi_arr[finite]), 0.0)[::-1]
+    sums = np.concatenate((np.cumsum(values)[::-1], [0.0]))
+    sq_sums = np.concatenate((np.cumsum(values * values)[::-1], [0.0]))
+    counts = np.concatenate((np.cumsum(finite[::-1])[::-1], [0]))
+    k_vector = np.arange(1, len(xi_arr) + 1)
+    width = np.maximum(min_width, (window * k_vector).astype(int))
+    lower = k_vector - 1
+    upper = np.minimum(lower + width, len(xi_arr))
+    count = counts[lower] - counts[upper]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = (sums[lower] - sums[upper]) / count
+        variance = (sq_sums[lower] - sq_sums[upper]) / count - mean * mean
+    variance[(upper - lower < width) | (count < 2)] = np.nan
+    return variance
+
+
+def guillou_hall_criterion(ordered_data):
+    """
+    Function to calculate the Guillou-Hall bias diagnostic of the
+    Hill estimator for all order statistics.
+
+    With the scaled log-spacings U_i = i * (log X_(i) - log X_(i+1)),
+    the statistic T_k = (3/k)^(1/2) * sum_i (k - 2i + 1)/k * U_i / H_k,
+    where H_k is the Hill estimate, is approximately standard normal
+    while the bias of H_k is negligible. The diagnostic Q_k is the
+    root mean square of T over the order statistics k - k/2, ..., k + k/2.
+    All sums are cumulative, so the cost is O(n).
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+
+    Returns:
+        Q: numpy array of the diagnostic for the order statistics
+           1, ..., n - 1.
+    """
+    logs = np.log(ordered_data, dtype=np.float64)
+    i_vector = np.arange(1, len(ordered_data))
+    spacings = i_vector * (logs[:-1] - logs[1:])
+    spacings_cumsum = np.cumsum(spacings)
+    weighted_cumsum = np.cumsum(i_vector * spacings)
+    k_vector = i_vector.astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        T = (
+            np.sqrt(3.0 / k_vector)
+            * ((k_vector + 1.0) * spacings_cumsum - 2.0 * weighted_cumsum)
+            / spacings_cumsum
+        )
+    T = np.where(np.isfinite(T), T, 0.0)
+    T2_cumsum = np.concatenate(([0.0], np.cumsum(T * T)))
+    lower = np.maximum(i_vector - 1 - i_vector // 2, 0)
+    upper = np.minimum(i_vector + i_vector // 2, len(i_vector))
+    return np.sqrt((T2_cumsum[upper] - T2_cumsum[lower]) / (upper - lower))
+
+
+def ks_criterion(ordered_data, xi_arr, scale_arr=None, n_grid=100):
+    """
+    Function to calculate the Kolmogorov-Smirnov distance between
+    the exceedances and the fitted tail on a grid of order statistics.
+
+    For the order statistic k, the k largest values are compared to a
+    Pareto tail with index xi_arr[k-1] above the threshold X_(k+1), or,
+    if scale_arr is given, to a generalized Pareto tail with shape
+    xi_arr[k-1] and scale scale_arr[k-1]. The grid is logarithmically
+    spaced, so the total cost is a small multiple of n.
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+        xi_arr:       numpy array of tail index estimates for the order
+                      statistics 1, ..., n - 1.
+        scale_arr:    optional numpy array of generalized Pareto scales.
+        n_grid:       number of grid points.
+
+    Returns:
+        k_grid:   numpy array of order statistics of the grid.
+        distance: numpy array of KS distances on the grid.
+    """
+    n = len(ordered_data)
+    k_grid = np.unique(np.geomspace(2, n - 1, n_grid).astype(int))
+    distance = np.full(len(k_grid), np.nan)
+    for j, k in enumerate(k_grid):
+        xi = xi_arr[k - 1]
+        if not np.isfinite(xi):
+            continue
+        threshold = ordered_data[k]
+        exceedances = ordered_data[:k].astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            if scale_arr is None:
+                sf = (exceedances / threshold) ** (-1.0 / xi)
+            elif abs(xi) < 1e-12:
+                sf = np.exp(-(exceedances - threshold) / scale_arr[k - 1])
+            else:
+                z = 1.0 + xi * (exceedances - threshold) / scale_arr[k - 1]
+                sf = np.where(z > 0, np.abs(z) ** (-1.0 / xi), 0.0)
+        ecdf = np.arange(1, k + 1) / float(k)
+        distance[j] = max(
+            np.max(np.abs(ecdf - sf)), np.max(np.abs(ecdf - 1.0 / k - sf))
+        )
+    return k_grid, distance
+
+
+def closed_form_threshold(
+    ordered_data,
+    xi_arr,
+    method,
+    scale_arr=None,
+    eps_stop=1.0,
+    verbose=False,
+    diagn_plots=False,
+    label="",
+):
+    """
+    Function to select the optimal number of order statistics
+    without resampling.
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+        xi_arr:       numpy array of tail index estimates for the order
+                      statistics 1, ..., n - 1.
+        method:       "stability" for the minimum of the rolling variance
+                      of xi_arr (see stability_criterion), "guillou_hall"
+                      for the largest order statistic whose bias
+                      diagnostic stays below 1.25 (see
+                      guillou_hall_criterion), or "min_ks" for the minimum
+                      KS distance (see ks_criterion).
+        scale_arr:    optional numpy array of generalized Pareto scales
+                      used by the "min_ks" method.
+        eps_stop:     fraction of order statistics to consider.
+        verbose:      flag controlling verbosity.
+        diagn_plots:  flag to switch on/off returning the criterion.
+        label:        estimator name used in log messages.
+
+    Returns:
+        Tuple with the same layout as hill_dbs: k_star, the fractions of
+        order statistics of the criterion, the criterion, the fraction
+        k_star / n, the index of the eps_stop boundary, four None entries
+        for the missing 2nd bootstrap level and 0 replicates.
+    """
+    n = len(ordered_data)
+    if method == "stability":
+        k_grid = np.arange(1, n)
+        criterion = stability_criterion(xi_arr)
+    elif method == "guillou_hall":
+        k_grid = np.arange(1, n)
+        criterion = guillou_hall_criterion(ordered_data)
+    elif method == "min_ks":
+        k_grid, criterion = ks_criterion(ordered_data, xi_arr, scale_arr)
+    else:
+        raise ValueError(
+            f"Unknown threshold_method {method!r}, expected one of "
+            f"{', '.join(THRESHOLD_METHODS)}."
+        )
+    max_index = max(1, int(np.searchsorted(k_grid, eps_stop * (n - 1), "right")))
+    window = criterion[1:max_index]
+    if method == "guillou_hall":
+        below = np.flatnonzero(window <= 1.25)
+        index = below[-1] + 1 if len(below) else max_index - 1
+    elif np.all(np.isnan(window)):
+        index = max_index - 1
+    else:
+        index = int(np.nanargmin(window)) + 1
+    k_star = max(2, min(int(k_grid[index]), n - 1))
+    if verbose:
+        logger.info("--- %s %s threshold information ---", label, method)
+        logger.info("Estimated optimal k: %d", k_star)
+    x_arr = k_grid / float(n) if diagn_plots else None
+    criterion = criterion if diagn_plots else None
+    return (
+        k_star,
+        x_arr,
+        criterion,
+        k_star / float(n),
+        max_index,
+        None,
+        None,
+        None,
+        None,
+        0,
+    )
+
+
 # ================================================
 # ========== Hill Tail Index Estimation ==========
 # ================================================
-def get_moments_estimates_1(ordered_data):
+def get_moments_estimates_1(ordered_data, block_size=None, n_jobs=None, cache=None):
     """
     Function to calculate first moments array given an ordered data
     sequence. Decreasing ordering is required.
@@ -101,6 +1614,10 @@ def get_moments_estimates_1(ordered_data):
         ordered_data: numpy array of ordered data for which
                       the 1st moment (Hill estimator)
                       is calculated.
+        block_size:   None for plain NumPy passes, or the block size of
+                      the blocked prefix sums (see log_power_cumsums).
+        n_jobs:       number of threads of the blocked prefix sums.
+        cache:        PrefixSumCache of the log prefix sums, or None.
     Returns:
         M1: numpy array of 1st moments (Hill estimator)
             corresponding to all possible order statistics
@@ -108,14 +1625,15 @@ def get_moments_estimates_1(ordered_data):
 
     """
 
-    logs_1 = np.log(ordered_data)
-    logs_1_cumsum = np.cumsum(logs_1[:-1])
+    logs_1, (logs_1_cumsum,) = log_power_cumsums(
+        ordered_data, 1, block_size, n_jobs, cache=cache
+    )
     k_vector = np.arange(1, len(ordered_data))
     M1 = (1.0 / k_vector) * logs_1_cumsum - logs_1[1:]
     return M1
 
 
-def get_moments_estimates_2(ordered_data):
+def get_moments_estimates_2(ordered_data, block_size=None, n_jobs=None, cache=None):
     """
     Function to calculate first and second moments arrays
     given an ordered data sequence.
@@ -125,6 +1643,10 @@ def get_moments_estimates_2(ordered_data):
         ordered_data: numpy array of ordered data for which
                       the 1st (Hill estimator) and 2nd moments
                       are calculated.
+        block_size:   None for plain NumPy passes, or the block size of
+                      the blocked prefix sums (see log_power_cumsums).
+        n_jobs:       number of threads of the blocked prefix sums.
+        cache:        PrefixSumCache of the log prefix sums, or None.
     Returns:
         M1: numpy array of 1st moments (Hill estimator)
             corresponding to all possible order statistics
@@ -133,10 +1655,10 @@ def get_moments_estimates_2(ordered_data):
             possible order statistics of the dataset.
 
     """
-    logs_1 = np.log(ordered_data)
-    logs_2 = (np.log(ordered_data)) ** 2
-    logs_1_cumsum = np.cumsum(logs_1[:-1])
-    logs_2_cumsum = np.cumsum(logs_2[:-1])
+    logs_1, (logs_1_cumsum, logs_2_cumsum) = log_power_cumsums(
+        ordered_data, 2, block_size, n_jobs, cache=cache
+    )
+    logs_2 = logs_1**2
     k_vector = np.arange(1, len(ordered_data))
     M1 = (1.0 / k_vector) * logs_1_cumsum - logs_1[1:]
     M2 = (
@@ -147,7 +1669,7 @@ def get_moments_estimates_2(ordered_data):
     return M1, M2
 
 
-def get_moments_estimates_3(ordered_data):
+def get_moments_estimates_3(ordered_data, block_size=None, n_jobs=None):
     """
     Function to calculate first, second and third moments
     arrays given an ordered data sequence.
@@ -157,6 +1679,9 @@ def get_moments_estimates_3(ordered_data):
         ordered_data: numpy array of ordered data for which
                       the 1st (Hill estimator), 2nd and 3rd moments
                       are calculated.
+        block_size:   None for plain NumPy passes, or the block size of
+                      the blocked prefix sums (see log_power_cumsums).
+        n_jobs:       number of threads of the blocked prefix sums.
     Returns:
         M1: numpy array of 1st moments (Hill estimator)
             corresponding to all possible order statistics
@@ -167,12 +1692,11 @@ def get_moments_estimates_3(ordered_data):
             possible order statistics of the dataset.
 
     """
-    logs_1 = np.log(ordered_data)
-    logs_2 = (np.log(ordered_data)) ** 2
-    logs_3 = (np.log(ordered_data)) ** 3
-    logs_1_cumsum = np.cumsum(logs_1[:-1])
-    logs_2_cumsum = np.cumsum(logs_2[:-1])
-    logs_3_cumsum = np.cumsum(logs_3[:-1])
+    logs_1, (logs_1_cumsum, logs_2_cumsum, logs_3_cumsum) = log_power_cumsums(
+        ordered_data, 3, block_size, n_jobs
+    )
+    logs_2 = logs_1**2
+    logs_3 = logs_1**3
     k_vector = np.arange(1, len(ordered_data))
     M1 = (1.0 / k_vector) * logs_1_cumsum - logs_1[1:]
     M2 = (
@@ -199,6 +1723,121 @@ def get_moments_estimates_3(ordered_data):
     return M1, M2, M3
 
 
+def get_weighted_moments_estimates(log_powers, weights):
+    """
+    Function to calculate weighted moments arrays of an ordered data
+    sequence for a batch of weight vectors.
+
+    The j-th entry uses the j+1 largest values, weighted by the
+    corresponding entries of each weight vector, and the (j+2)-th
+    largest value as threshold. With integer (resample count) weights
+    this equals the moments of the resample at the threshold given by
+    the original order statistics, without resampling or sorting.
+
+    Args:
+        log_powers: list of numpy arrays with the 1st, 2nd, ... powers of
+                    the logarithms of the data. Decreasing ordering
+                    of the data is required.
+        weights:    2D numpy array with one weight vector per row.
+
+    Returns:
+        moments: list of 2D numpy arrays of the 1st (Hill estimator),
+                 2nd, ... weighted moments with one row per weight
+                 vector. Entries without any weight in the tail are nan.
+    """
+    head = weights[:, :-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv_k = 1.0 / np.cumsum(head, axis=1)
+        means = [np.cumsum(head * logs[:-1], axis=1) * inv_k for logs in log_powers]
+    t = log_powers[0][1:]
+    moments = [means[0] - t]
+    if len(means) > 1:
+        moments.append(means[1] - 2.0 * t * means[0] + t * t)
+    if len(means) > 2:
+        moments.append(means[2] - 3.0 * t * means[1] + 3.0 * t * t * means[0] - t**3)
+        M1, M2, M3 = moments
+        # cleaning exceptional cases
+        with np.errstate(divide="ignore", invalid="ignore"):
+            clean = (
+                (M2 <= 0)
+                | (M3 == 0)
+                | (np.abs(1.0 - (M1**2) / M2) < 1e-10)
+                | (np.abs(1.0 - (M1 * M2) / M3) < 1e-10)
+            )
+        for M in moments:
+            M[clean] = np.nan
+    return moments
+
+
+def exceedance_control(ordered_data, fractions):
+    """
+    Control variate for the bootstraps with exactly known expectation.
+
+    For every fraction f of order statistics, the threshold u is the
+    full-sample order statistic at f*n, and the control is the sum of
+    log(X*/u) over the resampled values X* > u divided by f*m, where m is
+    the resample size. This Hill-type mean excess is linear in the resample
+    counts, so its bootstrap expectation follows from the full-sample log
+    prefix sums, while it is strongly correlated with the tail estimates
+    of the resample at the same fraction.
+
+    Args:
+        ordered_data: numpy array from which resamples are drawn.
+                      Decreasing ordering is required.
+        fractions:    array of fractions of order statistics at which
+                      the control is evaluated.
+
+    Returns:
+        function mapping a resample in decreasing order to the control
+        curve, and the array of its bootstrap expectations.
+    """
+    n = len(ordered_data)
+    logs = np.log(ordered_data, dtype=np.float64)
+    log_cumsum = np.concatenate(([0.0], np.cumsum(logs)))
+    positions = np.minimum(np.round(fractions * n).astype(int), n - 1)
+    thresholds = ordered_data[positions]
+    log_thresholds = logs[positions]
+    n_exceed = n - np.searchsorted(ordered_data[::-1], thresholds, side="right")
+    expectation = (log_cumsum[n_exceed] - n_exceed * log_thresholds) / (fractions * n)
+
+    def control(sample):
+        m = len(sample)
+        sample_cumsum = np.concatenate(
+            ([0.0], np.cumsum(np.log(sample, dtype=np.float64)))
+        )
+        m_exceed = m - np.searchsorted(sample[::-1], thresholds, side="right")
+        return (sample_cumsum[m_exceed] - m_exceed * log_thresholds) / (fractions * m)
+
+    return control, expectation
+
+
+def linear_grid(sample_size):
+    """
+    Fractions of order statistics 1/n, ..., 1 of a bootstrap sample.
+    """
+    return np.linspace(1.0 / sample_size, 1.0, sample_size)
+
+
+def hill_amse(sample):
+    """
+    AMSE contributions of the Hill estimator for one bootstrap sample.
+
+    Args:
+        sample: numpy array of resampled data in decreasing order.
+
+    Returns:
+        numpy array of (M2 - 2*M1^2)^2 for all order statistics.
+    """
+    return hill_amse_from_moments(*get_moments_estimates_2(sample))
+
+
+def hill_amse_from_moments(M1, M2):
+    """
+    AMSE contributions of the Hill estimator from its 1st and 2nd moments.
+    """
+    return (M2 - 2.0 * (M1) ** 2) ** 2
+
+
 def hill_dbs(
     ordered_data,
     t_bootstrap=0.5,
@@ -208,6 +1847,18 @@ def hill_dbs(
     diagn_plots=False,
     base_seed=None,
     max_resample=50,
+    window_shift=0.005,
+    adaptive=False,
+    adaptive_block=50,
+    adaptive_tol=0.1,
+    antithetic=False,
+    control_variate=False,
+    weighted_bootstrap=None,
+    batch_size=None,
+    rng_mode="legacy",
+    warm_start=None,
+    progress=None,
+    interrupt=None,
 ):
     """
     Function to perform double-bootstrap procedure for
@@ -229,7 +1880,38 @@ def hill_dbs(
         base_seed:    base random seed for reproducibility of bootstrap (default is None).
         max_resample: maximum number of resampling attempts when AMSE
                       false minimum is detected (k2 > k1). Raises
-                      ConvergenceError if exceeded. Default is 50.
+                      RuntimeError if exceeded. Default is 50.
+        window_shift: fraction of the bootstrap sample size by which the
+                      left AMSE minimization boundary is moved on each
+                      resampling attempt (see double_bootstrap).
+        adaptive:     flag to switch on/off adaptive early stopping of the
+                      bootstrap replicates (see double_bootstrap).
+        adaptive_block: number of replicates added per block in adaptive
+                      mode.
+        adaptive_tol: tolerance on the relative argmin movement and on the
+                      relative standard error of the AMSE near the minimum
+                      in adaptive mode.
+        antithetic:   flag to switch on/off antithetic resampling pairs.
+        control_variate: flag to switch on/off the control variate with
+                      known expectation (see exceedance_control).
+        weighted_bootstrap: None to draw and sort resamples, or the kind
+                      of weights ("multinomial" or "bayesian") of the
+                      sort-free weighted bootstrap (see
+                      WeightedBootstrapLevel).
+        batch_size:   number of weighted replicates evaluated at once.
+        rng_mode:     "legacy" to reproduce the resamples of earlier
+                      versions for a given base_seed, or "fast" to draw
+                      them from one generator per bootstrap level (see
+                      double_bootstrap).
+        warm_start:   fractions (x1, x2) of the AMSE minima of a previous
+                      fit to a subset of the data, or None (see
+                      double_bootstrap).
+        progress:     function called with the results of the current
+                      state after every block of adaptive_block replicates
+                      (see double_bootstrap), with the AMSE curves whatever
+                      diagn_plots, or None.
+        interrupt:    function called before every resample, which raises
+                      to abandon the double-bootstrap, or None.
 
     Returns:
         k_star:     number of order statistics optimal for estimation
@@ -252,133 +1934,102 @@ def hill_dbs(
         max_index2: index of the 2nd bootstrap sample's order statistics
                     array corresponding to the minimization boundary set
                     by eps_stop parameter.
-
+        n_replicates: number of bootstrap replicates drawn per bootstrap
+                    level.
     """
     if verbose:
-        logging.debug("Performing Hill double-bootstrap...")
-    n = len(ordered_data)
-    eps_bootstrap = 0.5 * (1 + np.log(int(t_bootstrap * n)) / np.log(n))
-    n1 = int(n**eps_bootstrap)
-    samples_n1 = np.zeros(n1 - 1)
-    good_counts1 = np.zeros(n1 - 1)
-    k1 = None
-    k2 = None
-    min_index1 = 1
-    min_index2 = 1
-
-    base_rng = np.random.default_rng(
-        seed=base_seed
-    )  # Accept random seed for reproducibility. Default seed is None.
-
-    resample_count = 0
-    while k2 is None:
-        if resample_count >= max_resample:
-            raise RuntimeError(
-                f"Hill double-bootstrap failed to converge after "
-                f"{max_resample} resampling attempts (k2 > k1 persisted). "
-                f"Consider increasing max_resample or adjusting bootstrap parameters."
-            )
-        # first bootstrap with n1 sample size
-        for _i in range(r_bootstrap):
-            bs1_seed = base_rng.integers(0, 1_000_000)
-            bs1_rng = np.random.default_rng(bs1_seed)
-            sample = bs1_rng.choice(ordered_data, n1, replace=True)
-            sample[::-1].sort()
-            M1, M2 = get_moments_estimates_2(sample)
-            current_amse1 = (M2 - 2.0 * (M1) ** 2) ** 2
-            samples_n1 += current_amse1
-            good_counts1[np.where(current_amse1 != np.nan)] += 1
-        averaged_delta = samples_n1 / good_counts1
-
-        max_index1 = (np.abs(np.linspace(1.0 / n1, 1.0, n1) - eps_stop)).argmin()
-        k1 = (
-            np.nanargmin(averaged_delta[min_index1:max_index1]) + 1 + min_index1
-        )  # take care of indexing
-        if diagn_plots:
-            n1_amse = averaged_delta
-            x1_arr = np.linspace(1.0 / n1, 1.0, n1)
-
-        # second bootstrap with n2 sample size
-        n2 = int(n1 * n1 / float(n))
-        samples_n2 = np.zeros(n2 - 1)
-        good_counts2 = np.zeros(n2 - 1)
-
-        for _i in range(r_bootstrap):
-            bs2_seed = base_rng.integers(0, 1_000_000)
-            bs2_rng = np.random.default_rng(bs2_seed)
-            sample = bs2_rng.choice(ordered_data, n2, replace=True)
-            sample[::-1].sort()
-            M1, M2 = get_moments_estimates_2(sample)
-            current_amse2 = (M2 - 2.0 * (M1**2)) ** 2
-            samples_n2 += current_amse2
-            good_counts2[np.where(current_amse2 != np.nan)] += 1
-        max_index2 = (np.abs(np.linspace(1.0 / n2, 1.0, n2) - eps_stop)).argmin()
-        averaged_delta = samples_n2 / good_counts2
-
-        k2 = (
-            np.nanargmin(averaged_delta[min_index2:max_index2]) + 1 + min_index2
-        )  # take care of indexing
-        if diagn_plots:
-            n2_amse = averaged_delta
-            x2_arr = np.linspace(1.0 / n2, 1.0, n2)
-
-        if k2 > k1:
-            resample_count += 1
-            logging.warning(
-                "Warning (Hill): k2 > k1, AMSE false minimum suspected, resampling... (attempt %d/%d)",
-                resample_count,
-                max_resample,
-            )
-            # move left AMSE boundary to avoid numerical issues
-            min_index1 = min_index1 + int(0.005 * n)
-            min_index2 = min_index2 + int(0.005 * n)
-            k2 = None
-
-    """
-    # this constant is provided in the Danielsson's paper
-    # use instead of rho below if needed
-    rho = (np.log(k1)/(2.*np.log(n1) - np.log(k1)))\
-          **(2.*(np.log(n1) - np.log(k1))/(np.log(n1)))
-    """
-
-    # this constant is provided in Qi's paper
-    rho = (1.0 - (2 * (np.log(k1) - np.log(n1)) / (np.log(k1)))) ** (
-        np.log(k1) / np.log(n1) - 1.0
-    )
-
-    k_star = (k1 * k1 / float(k2)) * rho
-    k_star = int(np.round(k_star))
+        logger.debug("Performing Hill double-bootstrap...")
+
+    def tail_control(x_arr):
+        return exceedance_control(ordered_data, x_arr[:-1])
+
+    def dbs_results(level1, index1, level2, index2, final=True):
+        # intermediate states always carry the AMSE curves and are not logged
+        diagn_curves = diagn_plots or not final
+        n1, n2 = level1.sample_size, level2.sample_size
+        k1, k2 = level1.order_statistic(index1), level2.order_statistic(index2)
+        max_index1, max_index2 = level1.max_index, level2.max_index
+        if diagn_curves:
+            n1_amse, x1_arr = level1.amse, level1.x_arr
+            n2_amse, x2_arr = level2.amse, level2.x_arr
+
+        """
+        # this constant is provided in the Danielsson's paper
+        # use instead of rho below if needed
+        rho = (np.log(k1)/(2.*np.log(n1) - np.log(k1)))\
+              **(2.*(np.log(n1) - np.log(k1))/(np.log(n1)))
+        """
+
+        # this constant is provided in Qi's paper
+        rho = (1.0 - (2 * (np.log(k1) - np.log(n1)) / (np.log(k1)))) ** (
+            np.log(k1) / np.log(n1) - 1.0
+        )
 
-    # enforce k_star to pick 2nd value (rare cases of extreme cutoffs)
-    if k_star == 0:
-        k_star = 2
-    if int(k_star) >= len(ordered_data):
-        logging.warning(
-            "WARNING: estimated threshold k is larger than the size of data"
+        k_star = (k1 * k1 / float(k2)) * rho
+        k_star = int(np.round(k_star))
+
+        # enforce k_star to pick 2nd value (rare cases of extreme cutoffs)
+        if k_star == 0:
+            k_star = 2
+        if int(k_star) >= len(ordered_data):
+            if final:
+                logger.warning(
+                    "WARNING: estimated threshold k is larger than the size of data"
+                )
+            k_star = len(ordered_data) - 1
+        if verbose and final:
+            logger.info("--- Hill double-bootstrap information ---")
+            logger.info("Size of the 1st bootstrap sample n1: %d", n1)
+            logger.info("Size of the 2nd bootstrap sample n2: %d", n2)
+            logger.info("Estimated k1: %d", k1)
+            logger.info("Estimated k2: %d", k2)
+            logger.info("Estimated constant rho: %g", rho)
+            logger.info("Estimated optimal k: %d", k_star)
+            logger.info("-----------------------------------------")
+        if not diagn_curves:
+            x1_arr, x2_arr, n1_amse, n2_amse = None, None, None, None
+        return (
+            k_star,
+            x1_arr,
+            n1_amse,
+            k1 / float(n1),
+            max_index1,
+            x2_arr,
+            n2_amse,
+            k2 / float(n2),
+            max_index2,
+            level1.n_drawn,
         )
-        k_star = len(ordered_data) - 1
-    if verbose:
-        logging.info("--- Hill double-bootstrap information ---")
-        logging.info("Size of the 1st bootstrap sample n1:", n1)
-        logging.info("Size of the 2nd bootstrap sample n2:", n2)
-        logging.info("Estimated k1:", k1)
-        logging.info("Estimated k2:", k2)
-        logging.info("Estimated constant rho:", rho)
-        logging.info("Estimated optimal k:", k_star)
-        logging.info("-----------------------------------------")
-    if not diagn_plots:
-        x1_arr, x2_arr, n1_amse, n2_amse = None, None, None, None
-    return (
-        k_star,
-        x1_arr,
-        n1_amse,
-        k1 / float(n1),
-        max_index1,
-        x2_arr,
-        n2_amse,
-        k2 / float(n2),
-        max_index2,
+
+    def report(*state):
+        progress(dbs_results(*state, final=False))
+
+    state = double_bootstrap(
+        ordered_data,
+        hill_amse,
+        linear_grid,
+        t_bootstrap=t_bootstrap,
+        r_bootstrap=r_bootstrap,
+        eps_stop=eps_stop,
+        base_seed=base_seed,
+        min_index=1,
+        max_resample=max_resample,
+        window_shift=window_shift,
+        adaptive=adaptive,
+        adaptive_block=adaptive_block,
+        adaptive_tol=adaptive_tol,
+        antithetic=antithetic,
+        control=tail_control if control_variate else None,
+        weights=weighted_bootstrap,
+        weighted_statistic=(hill_amse_from_moments, 2),
+        batch_size=batch_size,
+        rng_mode=rng_mode,
+        warm_start=warm_start,
+        label="Hill",
+        progress=None if progress is None else report,
+        interrupt=interrupt,
     )
+    return dbs_results(*state)
 
 
 def hill_estimator(
@@ -391,6 +2042,22 @@ def hill_estimator(
     eps_stop=0.99,
     base_seed=None,
     max_resample=50,
+    window_shift=0.005,
+    adaptive=False,
+    adaptive_block=50,
+    adaptive_tol=0.1,
+    antithetic=False,
+    control_variate=False,
+    weighted_bootstrap=None,
+    batch_size=None,
+    rng_mode="legacy",
+    warm_start=None,
+    prefix_cache=None,
+    prefix_block_size=None,
+    threshold_method="double_bootstrap",
+    progress=None,
+    fallback=None,
+    interrupt=None,
 ):
     """
     Function to calculate Hill estimator for a given dataset.
@@ -415,6 +2082,53 @@ def hill_estimator(
         base_seed:    base random seed for reproducibility of bootstrap (default is None).
         max_resample: maximum number of resampling attempts for the double-bootstrap
                       procedure. Raises RuntimeError if exceeded. Default is 50.
+        window_shift: fraction of the bootstrap sample size by which the
+                      AMSE minimization window is shifted on each
+                      resampling attempt.
+        adaptive:     flag to switch on/off adaptive early stopping of the
+                      bootstrap replicates, with r_bootstrap as upper bound.
+        adaptive_block: number of replicates added per block in adaptive
+                      mode.
+        adaptive_tol: tolerance on the relative argmin movement and on the
+                      relative standard error of the AMSE near the minimum
+                      in adaptive mode.
+        antithetic:   flag to switch on/off antithetic resampling pairs
+                      in the double-bootstrap.
+        control_variate: flag to switch on/off the control variate in the
+                      double-bootstrap.
+        weighted_bootstrap: None to draw and sort resamples, or the kind
+                      of weights ("multinomial" or "bayesian") of the
+                      sort-free weighted bootstrap.
+        batch_size:   number of weighted replicates evaluated at once.
+        rng_mode:     "legacy" to reproduce the resamples of earlier
+                      versions for a given base_seed, or "fast" to draw
+                      them from one generator per bootstrap level (see
+                      double_bootstrap).
+        warm_start:   fractions (x1, x2) of the AMSE minima of a previous
+                      fit to a subset of the data, or None (see
+                      double_bootstrap).
+        prefix_cache: PrefixSumCache of the log prefix sums kept between
+                      the fits of growing data, or None.
+        prefix_block_size: None for plain NumPy cumulative sums of the
+                      estimates, or the number of elements per block of
+                      the blocked prefix sums (see blocked_cumsums), which
+                      round more accurately on large data but differ from
+                      the plain sums in the last digits.
+        threshold_method: "double_bootstrap", "single_bootstrap" (see
+                      single_bootstrap_threshold) or one of the closed-form
+                      selections without resampling ("stability",
+                      "guillou_hall" or "min_ks", see
+                      closed_form_threshold), whose criterion is returned
+                      in place of the 1st bootstrap AMSE.
+        progress:     function called with the intermediate results of
+                      the double-bootstrap after every block of
+                      adaptive_block replicates, or None (see
+                      double_bootstrap).
+        fallback:     closed-form threshold_method whose results are passed
+                      to progress, from the same estimates, before any
+                      resampling, or None.
+        interrupt:    function called before every resample, which raises
+                      to abandon the bootstrap, or None.
 
     Returns:
         results: list containing an array of order statistics,
@@ -427,27 +2141,35 @@ def hill_estimator(
                  corresponding to the minimum of AMSE for the 1st bootstrap
                  sample, index of the 1st bootstrap sample's order statistics
                  array corresponding to the minimization boundary set
-                 by eps_stop parameter; and the same characteristics for the
-                 2nd bootstrap sample.
+                 by eps_stop parameter; the same characteristics for the
+                 2nd bootstrap sample; and the number of bootstrap
+                 replicates drawn per bootstrap level.
     """
     k_arr = np.arange(1, len(ordered_data))
-    xi_arr = get_moments_estimates_1(ordered_data)
-    if bootstrap:
-        results = hill_dbs(
+    xi_arr = get_moments_estimates_1(
+        ordered_data, block_size=prefix_block_size, cache=prefix_cache
+    )
+
+    def report(dbs_results):
+        k_star = dbs_results[0]
+        progress([k_arr, xi_arr, k_star, xi_arr[k_star - 1], *dbs_results[1:]])
+
+    def closed_form(method):
+        return closed_form_threshold(
             ordered_data,
-            t_bootstrap=t_bootstrap,
-            r_bootstrap=r_bootstrap,
+            xi_arr,
+            method,
+            eps_stop=eps_stop,
             verbose=verbose,
             diagn_plots=diagn_plots,
-            eps_stop=eps_stop,
-            base_seed=base_seed,
-            max_resample=max_resample,
-        )
-        k_star, x1_arr, n1_amse, k1, max_index1, x2_arr, n2_amse, k2, max_index2 = (
-            results
+            label="Hill",
         )
-        while k_star is None:
-            logging.debug("Resampling...")
+
+    if bootstrap:
+        if fallback is not None and progress is not None:
+            # a result from the same estimates before any resampling
+            report(closed_form(fallback))
+        if threshold_method == "double_bootstrap":
             results = hill_dbs(
                 ordered_data,
                 t_bootstrap=t_bootstrap,
@@ -457,16 +2179,63 @@ def hill_estimator(
                 eps_stop=eps_stop,
                 base_seed=base_seed,
                 max_resample=max_resample,
+                window_shift=window_shift,
+                adaptive=adaptive,
+                adaptive_block=adaptive_block,
+                adaptive_tol=adaptive_tol,
+                antithetic=antithetic,
+                control_variate=control_variate,
+                weighted_bootstrap=weighted_bootstrap,
+                batch_size=batch_size,
+                rng_mode=rng_mode,
+                warm_start=warm_start,
+                progress=None if progress is None else report,
+                interrupt=interrupt,
             )
-            k_star, x1_arr, n1_amse, k1, max_index1, x2_arr, n2_amse, k2, max_index2 = (
-                results
+        elif threshold_method == "single_bootstrap":
+            results = single_bootstrap_threshold(
+                ordered_data,
+                get_moments_estimates_1,
+                (lambda M1: M1, 1),
+                xi_arr,
+                t_bootstrap=t_bootstrap,
+                r_bootstrap=r_bootstrap,
+                eps_stop=eps_stop,
+                verbose=verbose,
+                diagn_plots=diagn_plots,
+                base_seed=base_seed,
+                adaptive=adaptive,
+                adaptive_block=adaptive_block,
+                adaptive_tol=adaptive_tol,
+                antithetic=antithetic,
+                control_variate=control_variate,
+                weighted_bootstrap=weighted_bootstrap,
+                batch_size=batch_size,
+                rng_mode=rng_mode,
+                label="Hill",
+                interrupt=interrupt,
             )
+        else:
+            results = closed_form(threshold_method)
+        (
+            k_star,
+            x1_arr,
+            n1_amse,
+            k1,
+            max_index1,
+            x2_arr,
+            n2_amse,
+            k2,
+            max_index2,
+            n_replicates,
+        ) = results
         xi_star = xi_arr[k_star - 1]
-        logging.info("Adjusted Hill estimated gamma:", 1 + 1.0 / xi_star)
+        logger.info("Adjusted Hill estimated gamma: %g", 1 + 1.0 / xi_star)
     else:
         k_star, xi_star = None, None
         x1_arr, n1_amse, k1, max_index1 = 4 * [None]
         x2_arr, n2_amse, k2, max_index2 = 4 * [None]
+        n_replicates = None
     results = [
         k_arr,
         xi_arr,
@@ -480,11 +2249,12 @@ def hill_estimator(
         n2_amse,
         k2,
         max_index2,
+        n_replicates,
     ]
     return results
 
 
-def smooth_hill_estimator(ordered_data, r_smooth=2):
+def smooth_hill_estimator(ordered_data, r_smooth=2, prefix_block_size=None):
     """
     Function to calculate smooth Hill estimator for a
     given ordered dataset.
@@ -495,13 +2265,18 @@ def smooth_hill_estimator(ordered_data, r_smooth=2):
         r_smooth:     integer parameter controlling the width
                       of smoothing window. Typically small
                       value such as 2 or 3.
+        prefix_block_size: None for plain NumPy cumulative sums of the
+                      estimates, or the number of elements per block of
+                      the blocked prefix sums (see blocked_cumsums), which
+                      round more accurately on large data but differ from
+                      the plain sums in the last digits.
     Returns:
         k_arr:  numpy array of order statistics based on the data provided.
         xi_arr: numpy array of tail index estimates corresponding to
                 the order statistics array k_arr.
     """
     n = len(ordered_data)
-    M1 = get_moments_estimates_1(ordered_data)
+    M1 = get_moments_estimates_1(ordered_data, block_size=prefix_block_size)
     xi_arr = np.zeros(int(np.floor(float(n) / r_smooth)))
     k_arr = np.arange(1, int(np.floor(float(n) / r_smooth)) + 1)
     xi_arr[0] = M1[0]
@@ -595,6 +2370,30 @@ def moments_dbs_prefactor(xi_n, n1, k1):
     return prefactor
 
 
+def moments_amse(sample):
+    """
+    AMSE contributions of the moments estimator for one bootstrap sample.
+
+    Args:
+        sample: numpy array of resampled data in decreasing order.
+
+    Returns:
+        numpy array of squared differences between the 2nd and 3rd
+        moment-based tail index estimates for all order statistics.
+    """
+    return moments_amse_from_moments(*get_moments_estimates_3(sample))
+
+
+def moments_amse_from_moments(M1, M2, M3):
+    """
+    AMSE contributions of the moments estimator from the 1st, 2nd and
+    3rd moments.
+    """
+    xi_2 = M1 + 1.0 - 0.5 * (1.0 - (M1 * M1) / M2) ** (-1.0)
+    xi_3 = np.sqrt(0.5 * M2) + 1.0 - (2.0 / 3.0) * (1.0 / (1.0 - M1 * M2 / M3))
+    return (xi_2 - xi_3) ** 2
+
+
 def moments_dbs(
     ordered_data,
     xi_n,
@@ -604,6 +2403,19 @@ def moments_dbs(
     verbose=False,
     diagn_plots=False,
     base_seed=None,
+    max_resample=50,
+    window_shift=0.005,
+    adaptive=False,
+    adaptive_block=50,
+    adaptive_tol=0.1,
+    antithetic=False,
+    control_variate=False,
+    weighted_bootstrap=None,
+    batch_size=None,
+    rng_mode="legacy",
+    warm_start=None,
+    progress=None,
+    interrupt=None,
 ):
     """
     Function to perform double-bootstrap procedure for
@@ -625,7 +2437,40 @@ def moments_dbs(
         diagn_plots:  flag to switch on/off generation of AMSE diagnostic
                       plots.
         base_seed:    base random seed for reproducibility of bootstrap (default is None).
-
+        max_resample: maximum number of resampling attempts when AMSE
+                      false minimum is detected (k2 > k1). Raises
+                      RuntimeError if exceeded. Default is 50.
+        window_shift: fraction of the bootstrap sample size by which the
+                      left AMSE minimization boundary is moved on each
+                      resampling attempt (see double_bootstrap).
+        adaptive:     flag to switch on/off adaptive early stopping of the
+                      bootstrap replicates (see double_bootstrap).
+        adaptive_block: number of replicates added per block in adaptive
+                      mode.
+        adaptive_tol: tolerance on the relative argmin movement and on the
+                      relative standard error of the AMSE near the minimum
+                      in adaptive mode.
+        antithetic:   flag to switch on/off antithetic resampling pairs.
+        control_variate: flag to switch on/off the control variate with
+                      known expectation (see exceedance_control).
+        weighted_bootstrap: None to draw and sort resamples, or the kind
+                      of weights ("multinomial" or "bayesian") of the
+                      sort-free weighted bootstrap (see
+                      WeightedBootstrapLevel).
+        batch_size:   number of weighted replicates evaluated at once.
+        rng_mode:     "legacy" to reproduce the resamples of earlier
+                      versions for a given base_seed, or "fast" to draw
+                      them from one generator per bootstrap level (see
+                      double_bootstrap).
+        warm_start:   fractions (x1, x2) of the AMSE minima of a previous
+                      fit to a subset of the data, or None (see
+                      double_bootstrap).
+        progress:     function called with the results of the current
+                      state after every block of adaptive_block replicates
+                      (see double_bootstrap), with the AMSE curves whatever
+                      diagn_plots, or None.
+        interrupt:    function called before every resample, which raises
+                      to abandon the double-bootstrap, or None.
 
     Returns:
         k_star:     number of order statistics optimal for estimation
@@ -648,95 +2493,94 @@ def moments_dbs(
         max_index2: index of the 2nd bootstrap sample's order statistics
                     array corresponding to the minimization boundary set
                     by eps_stop parameter.
+        n_replicates: number of bootstrap replicates drawn per bootstrap
+                    level.
     """
     if verbose:
-        logging.debug("Performing moments double-bootstrap...")
-    n = len(ordered_data)
-    eps_bootstrap = 0.5 * (1 + np.log(int(t_bootstrap * n)) / np.log(n))
-
-    base_rng = np.random.default_rng(
-        seed=base_seed
-    )  # Accept random seed for reproducibility. Default seed is None.
-
-    # first bootstrap with n1 sample size
-    n1 = int(n**eps_bootstrap)
-    samples_n1 = np.zeros(n1 - 1)
-    good_counts1 = np.zeros(n1 - 1)
-    for _i in range(r_bootstrap):
-        bs1_seed = base_rng.integers(0, 1_000_000)
-        bs1_rng = np.random.default_rng(bs1_seed)
-        sample = bs1_rng.choice(ordered_data, n1, replace=True)
-        sample[::-1].sort()
-        M1, M2, M3 = get_moments_estimates_3(sample)
-        xi_2 = M1 + 1.0 - 0.5 * (1.0 - (M1 * M1) / M2) ** (-1.0)
-        xi_3 = np.sqrt(0.5 * M2) + 1.0 - (2.0 / 3.0) * (1.0 / (1.0 - M1 * M2 / M3))
-        samples_n1 += (xi_2 - xi_3) ** 2
-        good_counts1[np.where((xi_2 - xi_3) ** 2 != np.nan)] += 1
-    max_index1 = (np.abs(np.linspace(1.0 / n1, 1.0, n1) - eps_stop)).argmin()
-    averaged_delta = samples_n1 / good_counts1
-    k1 = np.nanargmin(averaged_delta[:max_index1]) + 1  # take care of indexing
-    if diagn_plots:
-        n1_amse = averaged_delta
-        x1_arr = np.linspace(1.0 / n1, 1.0, n1)
-
-    # r second bootstrap with n2 sample size
-    n2 = int(n1 * n1 / float(n))
-    samples_n2 = np.zeros(n2 - 1)
-    good_counts2 = np.zeros(n2 - 1)
-    for _i in range(r_bootstrap):
-        bs2_seed = base_rng.integers(0, 1_000_000)
-        bs2_rng = np.random.default_rng(bs2_seed)
-        sample = bs2_rng.choice(ordered_data, n2, replace=True)
-        sample[::-1].sort()
-        M1, M2, M3 = get_moments_estimates_3(sample)
-        xi_2 = M1 + 1.0 - 0.5 * (1.0 - (M1 * M1) / M2) ** (-1.0)
-        xi_3 = np.sqrt(0.5 * M2) + 1.0 - (2.0 / 3.0) * (1.0 / (1.0 - M1 * M2 / M3))
-        samples_n2 += (xi_2 - xi_3) ** 2
-        good_counts2[np.where((xi_2 - xi_3) ** 2 != np.nan)] += 1
-    max_index2 = (np.abs(np.linspace(1.0 / n2, 1.0, n2) - eps_stop)).argmin()
-    averaged_delta = samples_n2 / good_counts2
-    k2 = np.nanargmin(averaged_delta[:max_index2]) + 1  # take care of indexing
-    if diagn_plots:
-        n2_amse = averaged_delta
-        x2_arr = np.linspace(1.0 / n2, 1.0, n2)
-
-    if k2 > k1:
-        logging.warning(
-            "WARNING(moments): estimated k2 is greater than k1! Re-doing bootstrap..."
+        logger.debug("Performing moments double-bootstrap...")
+
+    def tail_control(x_arr):
+        return exceedance_control(ordered_data, x_arr[:-1])
+
+    def dbs_results(level1, index1, level2, index2, final=True):
+        # intermediate states always carry the AMSE curves and are not logged
+        diagn_curves = diagn_plots or not final
+        n1, n2 = level1.sample_size, level2.sample_size
+        k1, k2 = level1.order_statistic(index1), level2.order_statistic(index2)
+        max_index1, max_index2 = level1.max_index, level2.max_index
+        if diagn_curves:
+            n1_amse, x1_arr = level1.amse, level1.x_arr
+            n2_amse, x2_arr = level2.amse, level2.x_arr
+
+        # calculate estimated optimal stopping k
+        prefactor = moments_dbs_prefactor(xi_n, n1, k1)
+        k_star = int((k1 * k1 / float(k2)) * prefactor)
+
+        if int(k_star) >= len(ordered_data):
+            if final:
+                logger.warning(
+                    "WARNING: estimated threshold k is larger than the size of data"
+                )
+            k_star = len(ordered_data) - 1
+        if verbose and final:
+            logger.info("--- Moments double-bootstrap information ---")
+            logger.info("Size of the 1st bootstrap sample n1: %d", n1)
+            logger.info("Size of the 2nd bootstrap sample n2: %d", n2)
+            logger.info("Estimated k1: %d", k1)
+            logger.info("Estimated k2: %d", k2)
+            logger.info("Estimated constant: %g", prefactor)
+            logger.info("Estimated optimal k: %d", k_star)
+            logger.info("--------------------------------------------")
+        if not diagn_curves:
+            x1_arr, x2_arr, n1_amse, n2_amse = None, None, None, None
+        return (
+            k_star,
+            x1_arr,
+            n1_amse,
+            k1 / float(n1),
+            max_index1,
+            x2_arr,
+            n2_amse,
+            k2 / float(n2),
+            max_index2,
+            level1.n_drawn,
         )
-        return 9 * [None]
 
-    # calculate estimated optimal stopping k
-    prefactor = moments_dbs_prefactor(xi_n, n1, k1)
-    k_star = int((k1 * k1 / float(k2)) * prefactor)
-
-    if int(k_star) >= len(ordered_data):
-        logging.warning(
-            "WARNING: estimated threshold k is larger than the size of data"
-        )
-        k_star = len(ordered_data) - 1
-    if verbose:
-        logging.info("--- Moments double-bootstrap information ---")
-        logging.info("Size of the 1st bootstrap sample n1:", n1)
-        logging.info("Size of the 2nd bootstrap sample n2:", n2)
-        logging.info("Estimated k1:", k1)
-        logging.info("Estimated k2:", k2)
-        logging.info("Estimated constant:", prefactor)
-        logging.info("Estimated optimal k:", k_star)
-        logging.info("--------------------------------------------")
-    if not diagn_plots:
-        x1_arr, x2_arr, n1_amse, n2_amse = None, None, None, None
-    return (
-        k_star,
-        x1_arr,
-        n1_amse,
-        k1 / float(n1),
-        max_index1,
-        x2_arr,
-        n2_amse,
-        k2 / float(n2),
-        max_index2,
+    def report(*state):
+        progress(dbs_results(*state, final=False))
+
+    state = double_bootstrap(
+        ordered_data,
+        moments_amse,
+        linear_grid,
+        t_bootstrap=t_bootstrap,
+        r_bootstrap=r_bootstrap,
+        eps_stop=eps_stop,
+        base_seed=base_seed,
+        max_resample=max_resample,
+        window_shift=window_shift,
+        adaptive=adaptive,
+        adaptive_block=adaptive_block,
+        adaptive_tol=adaptive_tol,
+        antithetic=antithetic,
+        control=tail_control if control_variate else None,
+        weights=weighted_bootstrap,
+        weighted_statistic=(moments_amse_from_moments, 3),
+        batch_size=batch_size,
+        rng_mode=rng_mode,
+        warm_start=warm_start,
+        label="moments",
+        progress=None if progress is None else report,
+        interrupt=interrupt,
     )
+    return dbs_results(*state)
+
+
+def moments_xi(M1, M2):
+    """
+    Moments tail index estimates from the 1st and 2nd moments.
+    """
+    return M1 + 1.0 - 0.5 * (1.0 - (M1 * M1) / M2) ** (-1)
 
 
 def moments_estimator(
@@ -748,6 +2592,23 @@ def moments_estimator(
     diagn_plots=False,
     eps_stop=0.99,
     base_seed=None,
+    max_resample=50,
+    window_shift=0.005,
+    adaptive=False,
+    adaptive_block=50,
+    adaptive_tol=0.1,
+    antithetic=False,
+    control_variate=False,
+    weighted_bootstrap=None,
+    batch_size=None,
+    rng_mode="legacy",
+    warm_start=None,
+    prefix_cache=None,
+    prefix_block_size=None,
+    threshold_method="double_bootstrap",
+    progress=None,
+    fallback=None,
+    interrupt=None,
 ):
     """
     Function to calculate moments estimator for a given dataset.
@@ -770,6 +2631,55 @@ def moments_estimator(
         diagn_plots:  flag to switch on/off generation of AMSE diagnostic
                       plots.
         base_seed:    base random seed for reproducibility of bootstrap (default is None).
+        max_resample: maximum number of resampling attempts for the double-bootstrap
+                      procedure. Raises RuntimeError if exceeded. Default is 50.
+        window_shift: fraction of the bootstrap sample size by which the
+                      AMSE minimization window is shifted on each
+                      resampling attempt.
+        adaptive:     flag to switch on/off adaptive early stopping of the
+                      bootstrap replicates, with r_bootstrap as upper bound.
+        adaptive_block: number of replicates added per block in adaptive
+                      mode.
+        adaptive_tol: tolerance on the relative argmin movement and on the
+                      relative standard error of the AMSE near the minimum
+                      in adaptive mode.
+        antithetic:   flag to switch on/off antithetic resampling pairs
+                      in the double-bootstrap.
+        control_variate: flag to switch on/off the control variate in the
+                      double-bootstrap.
+        weighted_bootstrap: None to draw and sort resamples, or the kind
+                      of weights ("multinomial" or "bayesian") of the
+                      sort-free weighted bootstrap.
+        batch_size:   number of weighted replicates evaluated at once.
+        rng_mode:     "legacy" to reproduce the resamples of earlier
+                      versions for a given base_seed, or "fast" to draw
+                      them from one generator per bootstrap level (see
+                      double_bootstrap).
+        warm_start:   fractions (x1, x2) of the AMSE minima of a previous
+                      fit to a subset of the data, or None (see
+                      double_bootstrap).
+        prefix_cache: PrefixSumCache of the log prefix sums kept between
+                      the fits of growing data, or None.
+        prefix_block_size: None for plain NumPy cumulative sums of the
+                      estimates, or the number of elements per block of
+                      the blocked prefix sums (see blocked_cumsums), which
+                      round more accurately on large data but differ from
+                      the plain sums in the last digits.
+        threshold_method: "double_bootstrap", "single_bootstrap" (see
+                      single_bootstrap_threshold) or one of the closed-form
+                      selections without resampling ("stability",
+                      "guillou_hall" or "min_ks", see
+                      closed_form_threshold), whose criterion is returned
+                      in place of the 1st bootstrap AMSE.
+        progress:     function called with the intermediate results of
+                      the double-bootstrap after every block of
+                      adaptive_block replicates, or None (see
+                      double_bootstrap).
+        fallback:     closed-form threshold_method whose results are passed
+                      to progress, from the same estimates, before any
+                      resampling, or None.
+        interrupt:    function called before every resample, which raises
+                      to abandon the bootstrap, or None.
 
     Returns:
         results: list containing an array of order statistics,
@@ -782,27 +2692,41 @@ def moments_estimator(
                  corresponding to the minimum of AMSE for the 1st bootstrap
                  sample, index of the 1st bootstrap sample's order statistics
                  array corresponding to the minimization boundary set
-                 by eps_stop parameter; and the same characteristics for the
-                 2nd bootstrap sample.
+                 by eps_stop parameter; the same characteristics for the
+                 2nd bootstrap sample; and the number of bootstrap
+                 replicates drawn per bootstrap level.
     """
     n = len(ordered_data)
-    M1, M2 = get_moments_estimates_2(ordered_data)
-    xi_arr = M1 + 1.0 - 0.5 * (1.0 - (M1 * M1) / M2) ** (-1)
+    M1, M2 = get_moments_estimates_2(
+        ordered_data, block_size=prefix_block_size, cache=prefix_cache
+    )
+    xi_arr = moments_xi(M1, M2)
     k_arr = np.arange(1, len(ordered_data))
-    if bootstrap:
-        xi_n = xi_arr[int(np.floor(n**0.5)) - 1]
-        results = moments_dbs(
+
+    def report(dbs_results):
+        k_star = dbs_results[0]
+        progress([k_arr, xi_arr, k_star, xi_arr[k_star - 1], *dbs_results[1:]])
+
+    def closed_form(method):
+        # generalized Pareto scale of the moments estimator
+        scale_arr = ordered_data[1:] * M1 * (1.0 - (xi_arr - M1))
+        return closed_form_threshold(
             ordered_data,
-            xi_n,
-            t_bootstrap=t_bootstrap,
-            r_bootstrap=r_bootstrap,
+            xi_arr,
+            method,
+            scale_arr=scale_arr,
+            eps_stop=eps_stop,
             verbose=verbose,
             diagn_plots=diagn_plots,
-            eps_stop=eps_stop,
-            base_seed=base_seed,
+            label="Moments",
         )
-        while results[0] is None:
-            logging.debug("Resampling...")
+
+    if bootstrap:
+        if fallback is not None and progress is not None:
+            # a result from the same estimates before any resampling
+            report(closed_form(fallback))
+        if threshold_method == "double_bootstrap":
+            xi_n = xi_arr[int(np.floor(n**0.5)) - 1]
             results = moments_dbs(
                 ordered_data,
                 xi_n,
@@ -812,19 +2736,67 @@ def moments_estimator(
                 diagn_plots=diagn_plots,
                 eps_stop=eps_stop,
                 base_seed=base_seed,
+                max_resample=max_resample,
+                window_shift=window_shift,
+                adaptive=adaptive,
+                adaptive_block=adaptive_block,
+                adaptive_tol=adaptive_tol,
+                antithetic=antithetic,
+                control_variate=control_variate,
+                weighted_bootstrap=weighted_bootstrap,
+                batch_size=batch_size,
+                rng_mode=rng_mode,
+                warm_start=warm_start,
+                progress=None if progress is None else report,
+                interrupt=interrupt,
             )
-        k_star, x1_arr, n1_amse, k1, max_index1, x2_arr, n2_amse, k2, max_index2 = (
-            results
-        )
+        elif threshold_method == "single_bootstrap":
+            results = single_bootstrap_threshold(
+                ordered_data,
+                lambda sample: moments_xi(*get_moments_estimates_2(sample)),
+                (moments_xi, 2),
+                xi_arr,
+                t_bootstrap=t_bootstrap,
+                r_bootstrap=r_bootstrap,
+                eps_stop=eps_stop,
+                verbose=verbose,
+                diagn_plots=diagn_plots,
+                base_seed=base_seed,
+                adaptive=adaptive,
+                adaptive_block=adaptive_block,
+                adaptive_tol=adaptive_tol,
+                antithetic=antithetic,
+                control_variate=control_variate,
+                weighted_bootstrap=weighted_bootstrap,
+                batch_size=batch_size,
+                rng_mode=rng_mode,
+                label="Moments",
+                interrupt=interrupt,
+            )
+        else:
+            results = closed_form(threshold_method)
+        (
+            k_star,
+            x1_arr,
+            n1_amse,
+            k1,
+            max_index1,
+            x2_arr,
+            n2_amse,
+            k2,
+            max_index2,
+            n_replicates,
+        ) = results
         xi_star = xi_arr[k_star - 1]
         if xi_star <= 0:
-            logging.info("Moments estimated gamma: infinity (xi <= 0).")
+            logger.info("Moments estimated gamma: infinity (xi <= 0).")
         else:
-            logging.info("Moments estimated gamma:", 1 + 1.0 / xi_star)
+            logger.info("Moments estimated gamma: %g", 1 + 1.0 / xi_star)
     else:
         k_star, xi_star = None, None
         x1_arr, n1_amse, k1, max_index1 = 4 * [None]
         x2_arr, n2_amse, k2, max_index2 = 4 * [None]
+        n_replicates = None
     results = [
         k_arr,
         xi_arr,
@@ -838,6 +2810,7 @@ def moments_estimator(
         n2_amse,
         k2,
         max_index2,
+        n_replicates,
     ]
     return results
 
@@ -847,7 +2820,43 @@ def moments_estimator(
 # =======================================================
 
 
-def get_biweight_kernel_estimates(ordered_data, hsteps, alpha):
+def get_kernel_cumsums(ordered_data, exponents, block_size=None, n_jobs=None):
+    """
+    Function to calculate the cumulative sums of the weighted log-spacings
+    (i/n)**a * (log X_(i) - log X_(i+1)) of the kernel-type estimators.
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+        exponents:    exponents a of the weights.
+        block_size:   None for plain NumPy passes, or the block size of
+                      the blocked prefix sums (see blocked_cumsums).
+        n_jobs:       number of threads of the blocked prefix sums.
+
+    Returns:
+        list of numpy arrays of cumulative sums, one per exponent.
+    """
+    n = len(ordered_data)
+    if block_size is None:
+        logs = np.log(ordered_data, dtype=np.float64)
+        differences = logs[:-1] - logs[1:]
+        i_arr = np.arange(1, n) / float(n)
+        return [np.cumsum(i_arr**a * differences) for a in exponents]
+
+    def summands(start, stop):
+        logs = np.log(ordered_data[start : stop + 1], dtype=np.float64)
+        differences = logs[:-1] - logs[1:]
+        i_arr = np.arange(start + 1, stop + 1) / float(n)
+        values = np.empty((len(exponents), stop - start))
+        for row, a in zip(values, exponents):
+            np.multiply(i_arr**a, differences, out=row)
+        return values
+
+    return list(blocked_cumsums(n - 1, summands, block_size, n_jobs))
+
+
+def get_biweight_kernel_estimates(
+    ordered_data, hsteps, alpha, block_size=None, n_jobs=None
+):
     """
     Function to calculate biweight kernel-type estimates for tail index.
     Biweight kernel is defined as:
@@ -861,6 +2870,9 @@ def get_biweight_kernel_estimates(ordered_data, hsteps, alpha):
         alpha:        parameter controlling the amount of "smoothing"
                       for the kernel-type estimator. Should be greater
                       than 0.5.
+        block_size:   None for plain NumPy passes, or the block size of
+                      the blocked prefix sums (see blocked_cumsums).
+        n_jobs:       number of threads of the blocked prefix sums.
 
     Returns:
         h_arr:  numpy array of fractions of order statistics included
@@ -870,20 +2882,9 @@ def get_biweight_kernel_estimates(ordered_data, hsteps, alpha):
                 listed in h_arr array.
     """
     n = len(ordered_data)
-    logs = np.log(ordered_data)
-    differences = logs[:-1] - logs[1:]
-    i_arr = np.arange(1, n) / float(n)
-    i3_arr = i_arr**3
-    i5_arr = i_arr**5
-    i_alpha_arr = i_arr**alpha
-    i_alpha2_arr = i_arr ** (2.0 + alpha)
-    i_alpha4_arr = i_arr ** (4.0 + alpha)
-    t1 = np.cumsum(i_arr * differences)
-    t2 = np.cumsum(i3_arr * differences)
-    t3 = np.cumsum(i5_arr * differences)
-    t4 = np.cumsum(i_alpha_arr * differences)
-    t5 = np.cumsum(i_alpha2_arr * differences)
-    t6 = np.cumsum(i_alpha4_arr * differences)
+    t1, t2, t3, t4, t5, t6 = get_kernel_cumsums(
+        ordered_data, (1, 3, 5, alpha, 2.0 + alpha, 4.0 + alpha), block_size, n_jobs
+    )
     h_arr = np.logspace(np.log10(1.0 / n), np.log10(1.0), hsteps)
     max_i_vector = (np.floor(n * h_arr) - 2.0).astype(int)
     gamma_pos = (
@@ -908,7 +2909,9 @@ def get_biweight_kernel_estimates(ordered_data, hsteps, alpha):
     return h_arr, xi_arr
 
 
-def get_triweight_kernel_estimates(ordered_data, hsteps, alpha):
+def get_triweight_kernel_estimates(
+    ordered_data, hsteps, alpha, block_size=None, n_jobs=None
+):
     """
     Function to calculate triweight kernel-type estimates for tail index.
     Triweight kernel is defined as:
@@ -922,6 +2925,9 @@ def get_triweight_kernel_estimates(ordered_data, hsteps, alpha):
         alpha:        parameter controlling the amount of "smoothing"
                       for the kernel-type estimator. Should be greater
                       than 0.5.
+        block_size:   None for plain NumPy passes, or the block size of
+                      the blocked prefix sums (see blocked_cumsums).
+        n_jobs:       number of threads of the blocked prefix sums.
 
     Returns:
         h_arr:  numpy array of fractions of order statistics included
@@ -931,24 +2937,12 @@ def get_triweight_kernel_estimates(ordered_data, hsteps, alpha):
                 listed in h_arr array.
     """
     n = len(ordered_data)
-    logs = np.log(ordered_data)
-    differences = logs[:-1] - logs[1:]
-    i_arr = np.arange(1, n) / float(n)
-    i3_arr = i_arr**3
-    i5_arr = i_arr**5
-    i7_arr = i_arr**7
-    i_alpha_arr = i_arr**alpha
-    i_alpha2_arr = i_arr ** (2.0 + alpha)
-    i_alpha4_arr = i_arr ** (4.0 + alpha)
-    i_alpha6_arr = i_arr ** (6.0 + alpha)
-    t1 = np.cumsum(i_arr * differences)
-    t2 = np.cumsum(i3_arr * differences)
-    t3 = np.cumsum(i5_arr * differences)
-    t4 = np.cumsum(i7_arr * differences)
-    t5 = np.cumsum(i_alpha_arr * differences)
-    t6 = np.cumsum(i_alpha2_arr * differences)
-    t7 = np.cumsum(i_alpha4_arr * differences)
-    t8 = np.cumsum(i_alpha6_arr * differences)
+    t1, t2, t3, t4, t5, t6, t7, t8 = get_kernel_cumsums(
+        ordered_data,
+        (1, 3, 5, 7, alpha, 2.0 + alpha, 4.0 + alpha, 6.0 + alpha),
+        block_size,
+        n_jobs,
+    )
     h_arr = np.logspace(np.log10(1.0 / n), np.log10(1.0), hsteps)
     max_i_vector = (np.floor(n * h_arr) - 2.0).astype(int)
 
@@ -987,6 +2981,15 @@ def kernel_type_dbs(
     verbose=False,
     diagn_plots=False,
     base_seed=None,
+    adaptive=False,
+    adaptive_block=50,
+    adaptive_tol=0.1,
+    antithetic=False,
+    control_variate=False,
+    rng_mode="legacy",
+    warm_start=None,
+    progress=None,
+    interrupt=None,
 ):
     """
     Function to perform double-bootstrap procedure for
@@ -1011,7 +3014,29 @@ def kernel_type_dbs(
         diagn_plots:  flag to switch on/off generation of AMSE diagnostic
                       plots.
         base_seed:    base random seed for reproducibility of bootstrap (default is None).
-
+        adaptive:     flag to switch on/off adaptive early stopping of the
+                      bootstrap replicates (see double_bootstrap).
+        adaptive_block: number of replicates added per block in adaptive
+                      mode.
+        adaptive_tol: tolerance on the relative argmin movement and on the
+                      relative standard error of the AMSE near the minimum
+                      in adaptive mode.
+        antithetic:   flag to switch on/off antithetic resampling pairs.
+        control_variate: flag to switch on/off the control variate with
+                      known expectation (see exceedance_control).
+        rng_mode:     "legacy" to reproduce the resamples of earlier
+                      versions for a given base_seed, or "fast" to draw
+                      them from one generator per bootstrap level (see
+                      double_bootstrap).
+        warm_start:   fractions (x1, x2) of the AMSE minima of a previous
+                      fit to a subset of the data, or None (see
+                      double_bootstrap).
+        progress:     function called with the results of the current
+                      state after every block of adaptive_block replicates
+                      (see double_bootstrap), with the AMSE curves whatever
+                      diagn_plots, or None.
+        interrupt:    function called before every resample, which raises
+                      to abandon the double-bootstrap, or None.
 
     Returns:
         h_star:       fraction of order statistics optimal for estimation
@@ -1034,100 +3059,114 @@ def kernel_type_dbs(
         max_k_index2: index of the 2nd bootstrap sample's order statistics
                       array corresponding to the minimization boundary set
                       by eps_stop parameter.
+        n_replicates: number of bootstrap replicates drawn per bootstrap
+                      level.
     """
     if verbose:
-        logging.debug("Performing kernel double-bootstrap...")
+        logger.debug("Performing kernel double-bootstrap...")
     n = len(ordered_data)
-    eps_bootstrap = 0.5 * (1 + np.log(int(t_bootstrap * n)) / np.log(n))
-
-    base_rng = np.random.default_rng(
-        seed=base_seed
-    )  # Accept random seed for reproducibility. Default seed is None.
-
-    # first bootstrap with n1 sample size
-    n1 = int(n**eps_bootstrap)
-    samples_n1 = np.zeros(hsteps)
-    good_counts1 = np.zeros(hsteps)
-    for _i in range(r_bootstrap):
-        bs1_seed = base_rng.integers(0, 1_000_000)
-        bs1_rng = np.random.default_rng(bs1_seed)
-        sample = bs1_rng.choice(ordered_data, n1, replace=True)
-        sample[::-1].sort()
-        _, xi2_arr = get_biweight_kernel_estimates(sample, hsteps, alpha)
-        _, xi3_arr = get_triweight_kernel_estimates(sample, hsteps, alpha)
-        samples_n1 += (xi2_arr - xi3_arr) ** 2
-        good_counts1[np.where((xi2_arr - xi3_arr) ** 2 != np.nan)] += 1
-    max_index1 = (
-        np.abs(np.logspace(np.log10(1.0 / n1), np.log10(1.0), hsteps) - eps_stop)
-    ).argmin()
-    x1_arr = np.logspace(np.log10(1.0 / n1), np.log10(1.0), hsteps)
-    averaged_delta = samples_n1 / good_counts1
-    h1 = x1_arr[np.nanargmin(averaged_delta[:max_index1])]
-    if diagn_plots:
-        n1_amse = averaged_delta
-
-    # second bootstrap with n2 sample size
-    n2 = int(n1 * n1 / float(n))
+    n1, n2 = bootstrap_sample_sizes(n, t_bootstrap)
     if n2 < hsteps:
-        sys.exit(
+        raise ValueError(
             "Number of h points is larger than number "
             + "of order statistics! Please either increase "
             + "the size of 2nd bootstrap or decrease number "
             + "of h grid points."
         )
-    samples_n2 = np.zeros(hsteps)
-    good_counts2 = np.zeros(hsteps)
-    for _i in range(r_bootstrap):
-        bs2_seed = base_rng.integers(0, 1_000_000)
-        bs2_rng = np.random.default_rng(bs2_seed)
-        sample = bs2_rng.choice(ordered_data, n2, replace=True)
-        sample[::-1].sort()
+
+    def kernel_amse(sample):
         _, xi2_arr = get_biweight_kernel_estimates(sample, hsteps, alpha)
         _, xi3_arr = get_triweight_kernel_estimates(sample, hsteps, alpha)
-        samples_n2 += (xi2_arr - xi3_arr) ** 2
-        good_counts2[np.where((xi2_arr - xi3_arr) ** 2 != np.nan)] += 1
-    max_index2 = (
-        np.abs(np.logspace(np.log10(1.0 / n2), np.log10(1.0), hsteps) - eps_stop)
-    ).argmin()
-    x2_arr = np.logspace(np.log10(1.0 / n2), np.log10(1.0), hsteps)
-    averaged_delta = samples_n2 / good_counts2
-    h2 = x2_arr[np.nanargmin(averaged_delta[:max_index2])]
-    if diagn_plots:
-        n2_amse = averaged_delta
-
-    A = (
-        143.0
-        * ((np.log(n1) + np.log(h1)) ** 2)
-        / (3 * (np.log(n1) - 13.0 * np.log(h1)) ** 2)
-    ) ** (-np.log(h1) / np.log(n1))
-
-    h_star = (h1 * h1 / float(h2)) * A
-
-    if h_star > 1:
-        logging.warning("WARNING: estimated threshold is larger than the size of data!")
-        logging.warning("WARNING: optimal h is set to 1...")
-        h_star = 1.0
+        return (xi2_arr - xi3_arr) ** 2
+
+    def log_grid(sample_size):
+        return np.logspace(np.log10(1.0 / sample_size), np.log10(1.0), hsteps)
+
+    def tail_control(x_arr):
+        return exceedance_control(ordered_data, x_arr)
+
+    def dbs_results(level1, index1, level2, index2, final=True):
+        # intermediate states always carry the AMSE curves and are not logged
+        diagn_curves = diagn_plots or not final
+        x1_arr, x2_arr = level1.x_arr, level2.x_arr
+        max_index1, max_index2 = level1.max_index, level2.max_index
+        h1, h2 = x1_arr[index1], x2_arr[index2]
+        if diagn_curves:
+            n1_amse, n2_amse = level1.amse, level2.amse
+
+        A = (
+            143.0
+            * ((np.log(n1) + np.log(h1)) ** 2)
+            / (3 * (np.log(n1) - 13.0 * np.log(h1)) ** 2)
+        ) ** (-np.log(h1) / np.log(n1))
+
+        h_star = (h1 * h1 / float(h2)) * A
+
+        if h_star > 1:
+            if final:
+                logger.warning(
+                    "WARNING: estimated threshold is larger than the size of data!"
+                )
+                logger.warning("WARNING: optimal h is set to 1...")
+            h_star = 1.0
+
+        if verbose and final:
+            logger.info("--- Kernel-type double-bootstrap information ---")
+            logger.info("Size of the 1st bootstrap sample n1: %d", n1)
+            logger.info("Size of the 2nd bootstrap sample n2: %d", n2)
+            logger.info("Estimated h1: %g", h1)
+            logger.info("Estimated h2: %g", h2)
+            logger.info("Estimated constant A: %g", A)
+            logger.info("Estimated optimal h: %g", h_star)
+            logger.info("------------------------------------------------")
+        if not diagn_curves:
+            x1_arr, x2_arr, n1_amse, n2_amse = None, None, None, None
+        if x1_arr is not None:
+            max_k_index1 = x1_arr[max_index1]
+        else:
+            max_k_index1 = None
+        if x2_arr is not None:
+            max_k_index2 = x2_arr[max_index2]
+        else:
+            max_k_index2 = None
+        return (
+            h_star,
+            x1_arr,
+            n1_amse,
+            h1,
+            max_k_index1,
+            x2_arr,
+            n2_amse,
+            h2,
+            max_k_index2,
+            level1.n_drawn,
+        )
 
-    if verbose:
-        logging.info("--- Kernel-type double-bootstrap information ---")
-        logging.info("Size of the 1st bootstrap sample n1:", n1)
-        logging.info("Size of the 2nd bootstrap sample n2:", n2)
-        logging.info("Estimated h1:", h1)
-        logging.info("Estimated h2:", h2)
-        logging.info("Estimated constant A:", A)
-        logging.info("Estimated optimal h:", h_star)
-        logging.info("------------------------------------------------")
-    if not diagn_plots:
-        x1_arr, x2_arr, n1_amse, n2_amse = None, None, None, None
-    if x1_arr is not None:
-        max_k_index1 = x1_arr[max_index1]
-    else:
-        max_k_index1 = None
-    if x2_arr is not None:
-        max_k_index2 = x2_arr[max_index2]
-    else:
-        max_k_index2 = None
-    return h_star, x1_arr, n1_amse, h1, max_k_index1, x2_arr, n2_amse, h2, max_k_index2
+    def report(*state):
+        progress(dbs_results(*state, final=False))
+
+    # the kernel-type procedure has no false minimum criterion
+    state = double_bootstrap(
+        ordered_data,
+        kernel_amse,
+        log_grid,
+        t_bootstrap=t_bootstrap,
+        r_bootstrap=r_bootstrap,
+        eps_stop=eps_stop,
+        base_seed=base_seed,
+        check_false_minimum=False,
+        adaptive=adaptive,
+        adaptive_block=adaptive_block,
+        adaptive_tol=adaptive_tol,
+        antithetic=antithetic,
+        control=tail_control if control_variate else None,
+        rng_mode=rng_mode,
+        warm_start=warm_start,
+        label="kernel",
+        progress=None if progress is None else report,
+        interrupt=interrupt,
+    )
+    return dbs_results(*state)
 
 
 def kernel_type_estimator(
@@ -1141,6 +3180,17 @@ def kernel_type_estimator(
     diagn_plots=False,
     eps_stop=0.99,
     base_seed=None,
+    adaptive=False,
+    adaptive_block=50,
+    adaptive_tol=0.1,
+    antithetic=False,
+    control_variate=False,
+    rng_mode="legacy",
+    warm_start=None,
+    prefix_block_size=None,
+    progress=None,
+    fallback=False,
+    interrupt=None,
 ):
     """
     Function to calculate kernel-type estimator for a given dataset.
@@ -1168,6 +3218,38 @@ def kernel_type_estimator(
         diagn_plots:  flag to switch on/off generation of AMSE diagnostic
                       plots.
         base_seed:    base random seed for reproducibility of bootstrap (default is None).
+        adaptive:     flag to switch on/off adaptive early stopping of the
+                      bootstrap replicates, with r_bootstrap as upper bound.
+        adaptive_block: number of replicates added per block in adaptive
+                      mode.
+        adaptive_tol: tolerance on the relative argmin movement and on the
+                      relative standard error of the AMSE near the minimum
+                      in adaptive mode.
+        antithetic:   flag to switch on/off antithetic resampling pairs
+                      in the double-bootstrap.
+        control_variate: flag to switch on/off the control variate in the
+                      double-bootstrap.
+        rng_mode:     "legacy" to reproduce the resamples of earlier
+                      versions for a given base_seed, or "fast" to draw
+                      them from one generator per bootstrap level (see
+                      double_bootstrap).
+        warm_start:   fractions (x1, x2) of the AMSE minima of a previous
+                      fit to a subset of the data, or None (see
+                      double_bootstrap).
+        prefix_block_size: None for plain NumPy cumulative sums of the
+                      estimates, or the number of elements per block of
+                      the blocked prefix sums (see blocked_cumsums), which
+                      round more accurately on large data but differ from
+                      the plain sums in the last digits.
+        progress:     function called with the intermediate results of
+                      the double-bootstrap after every block of
+                      adaptive_block replicates, or None (see
+                      double_bootstrap).
+        fallback:     flag to pass the estimates without a bandwidth
+                      selection to progress before the double-bootstrap
+                      starts.
+        interrupt:    function called before every resample, which raises
+                      to abandon the double-bootstrap, or None.
 
     Returns:
         results: list containing an array of fractions of order statistics,
@@ -1180,13 +3262,25 @@ def kernel_type_estimator(
                  corresponding to the minimum of AMSE for the 1st bootstrap
                  sample, index of the 1st bootstrap sample's order statistics
                  array corresponding to the minimization boundary set
-                 by eps_stop parameter; and the same characteristics for the
-                 2nd bootstrap sample.
+                 by eps_stop parameter; the same characteristics for the
+                 2nd bootstrap sample; and the number of bootstrap
+                 replicates drawn per bootstrap level.
     """
 
     n = len(ordered_data)
-    h_arr, xi_arr = get_biweight_kernel_estimates(ordered_data, hsteps, alpha=alpha)
+    h_arr, xi_arr = get_biweight_kernel_estimates(
+        ordered_data, hsteps, alpha=alpha, block_size=prefix_block_size
+    )
+
+    def report(dbs_results):
+        index = np.argmin(np.abs(h_arr - dbs_results[0]))
+        k_star = int(np.floor(h_arr[index] * n)) - 1
+        progress([np.floor(h_arr * n), xi_arr, k_star, xi_arr[index], *dbs_results[1:]])
+
     if bootstrap:
+        if fallback and progress is not None:
+            # the estimates before any resampling
+            progress([np.floor(h_arr * n), xi_arr, *11 * [None]])
         results = kernel_type_dbs(
             ordered_data,
             hsteps,
@@ -1197,26 +3291,28 @@ def kernel_type_estimator(
             diagn_plots=diagn_plots,
             eps_stop=eps_stop,
             base_seed=base_seed,
+            adaptive=adaptive,
+            adaptive_block=adaptive_block,
+            adaptive_tol=adaptive_tol,
+            antithetic=antithetic,
+            control_variate=control_variate,
+            rng_mode=rng_mode,
+            warm_start=warm_start,
+            progress=None if progress is None else report,
+            interrupt=interrupt,
         )
-        h_star, x1_arr, n1_amse, h1, max_index1, x2_arr, n2_amse, h2, max_index2 = (
-            results
-        )
-        while h_star is None:
-            logging.debug("Resampling...")
-            results = kernel_type_dbs(
-                ordered_data,
-                hsteps,
-                t_bootstrap=t_bootstrap,
-                alpha=alpha,
-                r_bootstrap=r_bootstrap,
-                verbose=verbose,
-                diagn_plots=diagn_plots,
-                eps_stop=eps_stop,
-                base_seed=base_seed,
-            )
-            h_star, x1_arr, n1_amse, h1, max_index1, x2_arr, n2_amse, h2, max_index2 = (
-                results
-            )
+        (
+            h_star,
+            x1_arr,
+            n1_amse,
+            h1,
+            max_index1,
+            x2_arr,
+            n2_amse,
+            h2,
+            max_index2,
+            n_replicates,
+        ) = results
 
         # get k index which corresponds to h_star
         k_star = np.argmin(np.abs(h_arr - h_star))
@@ -1225,13 +3321,14 @@ def kernel_type_estimator(
         k_star = int(np.floor(h_arr[k_star] * n)) - 1
         k_arr = np.floor(h_arr * n)
         if xi_star <= 0:
-            logging.info("Kernel-type estimated gamma: infinity (xi <= 0).")
+            logger.info("Kernel-type estimated gamma: infinity (xi <= 0).")
         else:
-            logging.info(f"Kernel-type estimated gamma: {1 + 1.0 / xi_star}")
+            logger.info(f"Kernel-type estimated gamma: {1 + 1.0 / xi_star}")
     else:
         k_star, xi_star = None, None
         x1_arr, n1_amse, h1, max_index1 = 4 * [None]
         x2_arr, n2_amse, h2, max_index2 = 4 * [None]
+        n_replicates = None
         k_arr = np.floor(h_arr * n)
     results = [
         np.array(k_arr),
@@ -1246,6 +3343,7 @@ def kernel_type_estimator(
         n2_amse,
         h2,
         max_index2,
+        n_replicates,
     ]
     return results
 
@@ -1280,3 +3378,398 @@ def pickands_estimator(ordered_data):
     xi_arr = (1.0 / np.log(2)) * np.log((Z_k - Z_2k) / (Z_2k - Z_4k))
     k_arr = np.array([float(i) for i in range(1, int(np.floor(n / 4.0)) + 1)])
     return k_arr, xi_arr
+
+
+# =======================================================
+# ========== Power-law (Clauset) xmin Scan ==========
+# =======================================================
+
+
+def power_law_estimator(
+    ordered_data, discrete=False, max_candidates=1000, block_size=1 << 22
+):
+    """
+    Function to fit a power-law tail by maximum likelihood with the
+    xmin minimizing the Kolmogorov-Smirnov distance (Clauset, Shalizi
+    and Newman, 2009), for all candidate xmin values at once.
+
+    The candidates are the unique data values (see get_ccdf). The MLE
+    alpha = 1 + k / sum_i log(x_i / xmin) of every candidate follows from
+    the cumulative sums of the logs of the ordered data, and the KS
+    distances are computed in blocks of candidates, comparing the fitted
+    tail with the empirical CCDF at the unique values above xmin. For
+    discrete data the continuous approximation of Clauset et al. is used,
+    with xmin - 1/2 in place of xmin in the MLE and the fitted CCDF
+    ((x - 1/2) / (xmin - 1/2))^(1 - alpha). If there are more candidates
+    than max_candidates, a subset with logarithmically spaced tail sizes
+    is scanned.
+
+    Args:
+        ordered_data:   numpy array of data in decreasing order.
+        discrete:       flag to switch on/off the discrete approximation.
+        max_candidates: maximum number of candidate xmin values.
+        block_size:     maximum number of (candidate, value) pairs
+                        evaluated at once in the KS sweep.
+
+    Returns:
+        xmin_arr:  array of candidate xmin values (decreasing).
+        k_arr:     array of the corresponding numbers of tail values.
+        alpha_arr: array of the MLE exponents of the density.
+        ks_arr:    array of the KS distances.
+        xmin_star: xmin with the smallest KS distance.
+        k_star:    number of tail values of xmin_star.
+        alpha_star: MLE exponent at xmin_star.
+        ks_star:   KS distance at xmin_star.
+    """
+    n = len(ordered_data)
+    shift = 0.5 if discrete else 0.0
+    uniques, ccdf = get_ccdf(np.asarray(ordered_data))
+    # number of values >= and > each unique value
+    tail_counts = np.rint(n * np.concatenate((ccdf[1:], [1.0]))).astype(np.int64)
+    greater_counts = np.rint(n * ccdf).astype(np.int64)
+
+    positive = uniques - shift > 0
+    n_positive = int(tail_counts[positive][-1]) if positive.any() else 0
+    logs_cumsum = blocked_cumsums(
+        n_positive,
+        lambda start, stop: np.log(ordered_data[start:stop], dtype=np.float64)[None],
+    )[0]
+    log_uniques = np.full(len(uniques), np.nan)
+    log_uniques[positive] = np.log(uniques[positive] - shift)
+
+    candidates = np.flatnonzero(positive & (tail_counts >= 2))
+    log_sums = (
+        logs_cumsum[tail_counts[candidates] - 1]
+        - tail_counts[candidates] * log_uniques[candidates]
+    )
+    candidates = candidates[log_sums > 0]
+    if len(candidates) == 0:
+        raise ValueError("No candidate xmin with at least two tail values.")
+    if len(candidates) > max_candidates:
+        sizes = tail_counts[candidates]
+        targets = np.geomspace(sizes[0], sizes[-1], max_candidates)
+        positions = np.searchsorted(sizes, targets)
+        candidates = candidates[np.unique(np.minimum(positions, len(sizes) - 1))]
+
+    k_arr = tail_counts[candidates]
+    alpha_arr = 1.0 + k_arr / (logs_cumsum[k_arr - 1] - k_arr * log_uniques[candidates])
+
+    # KS sweep over blocks of candidates, vectorized over the unique
+    # values above each xmin
+    ks_arr = np.empty(len(candidates))
+    start = 0
+    while start < len(candidates):
+        stop = start + 1
+        while (
+            stop < len(candidates)
+            and (stop - start + 1) * (candidates[stop] + 1) <= block_size
+        ):
+            stop += 1
+        block = candidates[start:stop]
+        width = block[-1] + 1
+        exponent = (1.0 - alpha_arr[start:stop])[:, None]
+        model = np.exp(
+            exponent * (log_uniques[None, :width] - log_uniques[block][:, None])
+        )
+        size = k_arr[start:stop, None].astype(np.float64)
+        distance = np.maximum(
+            np.abs(tail_counts[None, :width] / size - model),
+            np.abs(greater_counts[None, :width] / size - model),
+        )
+        distance[np.arange(width)[None, :] > block[:, None]] = 0.0
+        ks_arr[start:stop] = distance.max(axis=1)
+        start = stop
+
+    best = int(np.argmin(ks_arr))
+    return (
+        uniques[candidates],
+        k_arr,
+        alpha_arr,
+        ks_arr,
+        uniques[candidates[best]],
+        int(k_arr[best]),
+        alpha_arr[best],
+        ks_arr[best],
+    )
+
+
+# ==========================================================
+# ========== Peaks-over-Threshold (GPD) Estimation ==========
+# ==========================================================
+
+
+def _gpd_profile_sums(exceedances, theta):
+    """
+    Sums over the exceedances of every threshold (rows, zero-padded) of
+    log(1 + theta*y) and of its 1st and 2nd derivatives in theta.
+    """
+    w = 1.0 + theta[:, None] * exceedances
+    ratio = exceedances / w
+    return (
+        np.log(w).sum(axis=1),
+        ratio.sum(axis=1),
+        (ratio * ratio).sum(axis=1),
+    )
+
+
+def _gpd_profile_newton(exceedances, k, theta, bound, max_iter=50, tol=1e-10):
+    """
+    Maximize the GPD profile log-likelihood -log(xi/theta) - xi, with
+    xi = sum(log(1 + theta*y)) / k, for all thresholds at once. Steps are
+    restricted to xi > -1, where the maximum likelihood estimator is
+    regular; the likelihood is unbounded towards the support boundary.
+
+    Args:
+        exceedances: 2D numpy array with the exceedances of one threshold
+                     per row, zero-padded (padding does not contribute).
+        k:           numpy array of the numbers of exceedances.
+        theta:       numpy array of starting values.
+        bound:       numpy array of the lower bounds -1/max(y) of theta.
+        max_iter:    maximum number of Newton iterations.
+        tol:         relative tolerance on theta.
+
+    Returns:
+        theta: numpy array of the maximizers.
+        xi:    numpy array of the corresponding GPD shapes.
+    """
+
+    def loglik(S0, k, theta):
+        xi = S0 / k
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -np.log(xi / theta) - xi
+
+    theta = theta.copy()
+    S0, S1, S2 = _gpd_profile_sums(exceedances, theta)
+    current = loglik(S0, k, theta)
+    active = np.arange(len(theta))
+    for _i in range(max_iter):
+        xi = S0[active] / k[active]
+        d1, d2 = S1[active] / k[active], -S2[active] / k[active]
+        th = theta[active]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            grad = -d1 / xi + 1.0 / th - d1
+            hess = -(d2 / xi - (d1 / xi) ** 2) - 1.0 / th**2 - d2
+            # Newton step where the profile is concave, otherwise a
+            # gradient step relative to theta
+            step = np.where(hess < 0, -grad / hess, np.sign(grad) * 0.5 * np.abs(th))
+        step = np.nan_to_num(step)
+        # step halving until the likelihood does not decrease
+        pending = np.arange(len(active))
+        done = np.zeros(len(active), dtype=bool)
+        for _j in range(40):
+            candidate = th[pending] + step[pending]
+            rows = active[pending]
+            valid = candidate > bound[rows]
+            sums = _gpd_profile_sums(exceedances[rows[valid]], candidate[valid])
+            value = loglik(sums[0], k[rows[valid]], candidate[valid])
+            better = (value >= current[rows[valid]]) & (sums[0] > -k[rows[valid]])
+            accepted = rows[valid][better]
+            theta[accepted] = candidate[valid][better]
+            S0[accepted], S1[accepted], S2[accepted] = (x[better] for x in sums)
+            current[accepted] = value[better]
+            done[pending[valid][better]] = True
+            pending = pending[~done[pending]]
+            if len(pending) == 0:
+                break
+            step[pending] *= 0.5
+        converged = np.abs(step) <= tol * np.abs(theta[active])
+        active = active[done & ~converged]
+        if len(active) == 0:
+            break
+    return theta, S0 / k
+
+
+def pot_estimator(
+    ordered_data,
+    n_grid=100,
+    max_iter=50,
+    tol=1e-10,
+    block_size=1 << 22,
+    prefix_block_size=None,
+):
+    """
+    Function to fit the generalized Pareto distribution (GPD) to the
+    exceedances over the thresholds X_(k+1) for a logarithmically spaced
+    grid of k by maximum likelihood (peaks over threshold).
+
+    The likelihood is maximized over the profile parameter theta = xi/sigma
+    (Grimshaw, 1993), for which xi = mean(log(1 + theta*y)) and
+    sigma = xi/theta are explicit. Newton iterations with step halving run
+    simultaneously for all thresholds of a block, with the exceedances of
+    the thresholds stored as rows of a zero-padded matrix, and are seeded
+    from the moments estimates of xi and sigma.
+
+    Args:
+        ordered_data: numpy array for which tail index estimation
+                      is performed. Decreasing ordering is required.
+        n_grid:       number of grid points.
+        max_iter:     maximum number of Newton iterations.
+        tol:          relative tolerance on theta.
+        block_size:   maximum number of exceedances processed at once.
+        prefix_block_size: None for plain NumPy cumulative sums of the
+                      moments estimates, or the number of elements per
+                      block of the blocked prefix sums (see
+                      blocked_cumsums), which round more accurately on
+                      large data but differ from the plain sums in the
+                      last digits.
+
+    Returns:
+        k_arr:     array of order statistics of the grid.
+        xi_arr:    array of GPD shape (tail index) estimates.
+        sigma_arr: array of GPD scale estimates.
+    """
+    ordered_data = np.asarray(ordered_data, dtype=np.float64)
+    n = len(ordered_data)
+    k_arr = np.unique(np.geomspace(2, n - 1, n_grid).astype(int))
+    thresholds = ordered_data[k_arr]
+
+    # seed from the moments estimates, or from the exponential limit
+    # theta = 1 / mean excess where they are not usable
+    M1, M2 = get_moments_estimates_2(ordered_data, block_size=prefix_block_size)
+    M1 = M1[k_arr - 1]
+    xi_seed = moments_xi(M1, M2[k_arr - 1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        theta_seed = xi_seed / (thresholds * M1 * (1.0 - (xi_seed - M1)))
+    data_cumsum = blocked_cumsums(n, lambda start, stop: ordered_data[None, start:stop])
+    mean_excess = data_cumsum[0, k_arr - 1] / k_arr - thresholds
+    bound = -1.0 / (ordered_data[0] - thresholds)
+    unusable = (
+        ~np.isfinite(theta_seed)
+        | (theta_seed <= bound)
+        | (theta_seed == 0)
+        | (xi_seed <= -1)
+    )
+    theta_seed[unusable] = 1.0 / mean_excess[unusable]
+
+    xi_arr = np.empty(len(k_arr))
+    theta_arr = np.empty(len(k_arr))
+    start = 0
+    while start < len(k_arr):
+        # group thresholds with similar k to bound the zero padding
+        stop = start + 1
+        while (
+            stop < len(k_arr)
+            and k_arr[stop] <= 2 * k_arr[start]
+            and (stop - start + 1) * k_arr[stop] <= block_size
+        ):
+            stop += 1
+        width = k_arr[stop - 1]
+        exceedances = ordered_data[None, :width] - thresholds[start:stop, None]
+        exceedances[np.arange(width)[None, :] >= k_arr[start:stop, None]] = 0.0
+        theta_arr[start:stop], xi_arr[start:stop] = _gpd_profile_newton(
+            exceedances,
+            k_arr[start:stop].astype(np.float64),
+            theta_seed[start:stop],
+            bound[start:stop],
+            max_iter=max_iter,
+            tol=tol,
+        )
+        start = stop
+    sigma_arr = xi_arr / theta_arr
+    return k_arr, xi_arr, sigma_arr
+
+
+# ==============================================================
+# ========== Extreme Quantiles and Exceedance Probabilities ==========
+# ==============================================================
+
+
+def _broadcast_tail(k, values):
+    """Reshape k so that it broadcasts to k.shape + values.shape."""
+    k = np.asarray(k)
+    return k.reshape(k.shape + (1,) * np.ndim(values))
+
+
+def tail_quantile(ordered_data, k, xi, q, scale=None):
+    """
+    Function to compute extreme quantiles from the tail fitted above the
+    threshold X_(k+1) (Weissman, 1978):
+
+        x_q = X_(k+1) * (k / (n * (1 - q)))**xi
+
+    or, if GPD scales are given (peaks over threshold),
+
+        x_q = X_(k+1) + scale / xi * ((k / (n * (1 - q)))**xi - 1).
+
+    Quantiles with 1 - q >= k / n lie below the threshold and are the
+    empirical quantiles of the data. The sorted data are only indexed,
+    never sorted.
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+        k:            order statistic(s) of the threshold(s), integer or
+                      array of integers in [1, n - 1].
+        xi:           tail index estimate(s), same shape as k.
+        q:            quantile level(s) in [0, 1].
+        scale:        optional GPD scale estimate(s), same shape as k.
+
+    Returns:
+        numpy array of quantiles with shape k.shape + q.shape. The
+        Weissman quantiles are NaN where xi <= 0.
+    """
+    n = len(ordered_data)
+    q = np.asarray(q, dtype=np.float64)
+    if np.any((q < 0) | (q > 1)):
+        raise ValueError("Quantile levels must lie in [0, 1].")
+    k = _broadcast_tail(k, q)
+    xi = _broadcast_tail(np.asarray(xi, dtype=np.float64), q)
+    threshold = ordered_data[k]
+    p = 1.0 - q
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        growth = (k / (n * p)) ** xi
+        if scale is None:
+            fitted = np.where(xi > 0, threshold * growth, np.nan)
+        else:
+            scale = _broadcast_tail(np.asarray(scale, dtype=np.float64), q)
+            fitted = np.where(
+                xi == 0,
+                threshold + scale * np.log(k / (n * p)),
+                threshold + scale / xi * (growth - 1.0),
+            )
+    empirical = ordered_data[np.minimum(np.floor(n * p).astype(np.int64), n - 1)]
+    return np.where(n * p < k, fitted, empirical)
+
+
+def tail_sf(ordered_data, k, xi, x, scale=None):
+    """
+    Function to compute exceedance probabilities P(X > x) from the tail
+    fitted above the threshold X_(k+1) (Weissman, 1978):
+
+        P(X > x) = k / n * (x / X_(k+1))**(-1 / xi)
+
+    or, if GPD scales are given (peaks over threshold),
+
+        P(X > x) = k / n * (1 + xi * (x - X_(k+1)) / scale)**(-1 / xi).
+
+    Below the threshold the empirical survival function of the data is
+    returned, found by binary search in the sorted data.
+
+    Args:
+        ordered_data: numpy array of data in decreasing order.
+        k:            order statistic(s) of the threshold(s), integer or
+                      array of integers in [1, n - 1].
+        xi:           tail index estimate(s), same shape as k.
+        x:            query value(s).
+        scale:        optional GPD scale estimate(s), same shape as k.
+
+    Returns:
+        numpy array of exceedance probabilities with shape
+        k.shape + x.shape. The Weissman probabilities are NaN where
+        xi <= 0.
+    """
+    n = len(ordered_data)
+    x = np.asarray(x, dtype=np.float64)
+    k = _broadcast_tail(k, x)
+    xi = _broadcast_tail(np.asarray(xi, dtype=np.float64), x)
+    threshold = ordered_data[k]
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if scale is None:
+            fitted = np.where(xi > 0, k / n * (x / threshold) ** (-1.0 / xi), np.nan)
+        else:
+            scale = _broadcast_tail(np.asarray(scale, dtype=np.float64), x)
+            z = (x - threshold) / scale
+            base = np.maximum(1.0 + xi * z, 0.0)
+            fitted = k / n * np.where(xi == 0, np.exp(-z), base ** (-1.0 / xi))
+    # number of values larger than x, from the increasing view of the data
+    n_above = n - np.searchsorted(ordered_data[::-1], x, side="right")
+    return np.where(x >= threshold, fitted, n_above / n)
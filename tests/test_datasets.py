@@ -1,10 +1,15 @@
+import array
+import bz2
+import gzip
+import lzma
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
 
-from tailestim.datasets import TailData
+from tailestim.datasets import DatasetCatalog, TailData, generate_samples
 
 
 def test_load_existing_data():
@@ -137,3 +142,408 @@ def test_path_precedence():
     finally:
         # Clean up the temporary file
         os.unlink(temp_path)
+
+
+def test_histogram_representation_is_lazy():
+    """Test that the dense array is only built when data is accessed"""
+    data = TailData(name="CAIDA_KONECT")
+    assert not data.is_materialized
+
+    # Summary accessors work on the histogram alone
+    assert data.n == data.counts.sum()
+    repr(data)
+    assert not data.is_materialized
+
+    dense = data.data
+    assert data.is_materialized
+    assert data.data is dense
+    assert data.n == len(dense)
+    assert data.n_unique == len(np.unique(dense))
+    assert data.max_value == dense.max()
+
+    # Assigning data replaces the observations and their histogram
+    data.data = np.array([3.0, 1.0, 3.0])
+    assert data.n == 3
+    assert data.n_unique == 2
+    assert data.max_value == 3.0
+    np.testing.assert_array_equal(data.counts, [1, 2])
+
+
+def test_histogram_ccdf_matches_dense_ccdf():
+    """Test that the histogram CCDF matches the CCDF of the expanded data"""
+    from tailestim.estimators.tail_methods import get_ccdf
+
+    with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_file:
+        # Unsorted values, a repeated value and a zero count
+        temp_file.write("30 1\n")
+        temp_file.write("10 3\n")
+        temp_file.write("20 2\n")
+        temp_file.write("10 1\n")
+        temp_file.write("40 0\n")
+        temp_path = temp_file.name
+
+    try:
+        data = TailData(path=temp_path)
+        uniques, ccdf = data.get_ccdf()
+        assert not data.is_materialized
+        assert data.n == 7
+        assert data.n_unique == 3
+        assert data.max_value == 30
+
+        expected_uniques, expected_ccdf = get_ccdf(data.data)
+        np.testing.assert_array_equal(uniques, expected_uniques)
+        np.testing.assert_array_equal(ccdf, expected_ccdf)
+    finally:
+        os.unlink(temp_path)
+
+
+def test_from_array():
+    """Test wrapping an in-memory array"""
+    arr = np.array([3, 1, 2, 3], dtype=np.int32)
+
+    data = TailData.from_array(arr)
+    assert data.data.dtype == np.int32
+    assert np.shares_memory(data.data, arr)
+    assert data.n == 4
+    assert data.n_unique == 3
+    assert data.max_value == 3
+    np.testing.assert_array_equal(data.values, [1, 2, 3])
+    np.testing.assert_array_equal(data.counts, [1, 1, 2])
+    assert repr(data) == "TailData(data_length=4)"
+
+    copied = TailData.from_array(arr, copy=True)
+    assert not np.shares_memory(copied.data, arr)
+
+    with pytest.raises(ValueError):
+        TailData.from_array(np.ones((2, 2)))
+
+
+def test_from_buffer():
+    """Test wrapping objects that expose the buffer protocol without copying"""
+    buf = array.array("I", [5, 1, 4])
+    data = TailData.from_buffer(buf)
+    assert data.data.dtype == np.uint32
+    np.testing.assert_array_equal(data.data, [5, 1, 4])
+    buf[0] = 7
+    assert data.data[0] == 7
+
+    raw = np.array([1.5, 2.5], dtype=np.float32).tobytes()
+    data = TailData.from_buffer(raw, dtype=np.float32)
+    assert data.data.dtype == np.float32
+    np.testing.assert_array_equal(data.data, [1.5, 2.5])
+
+    data = TailData.from_buffer(memoryview(raw), dtype=np.float32)
+    assert data.n == 2
+
+
+def test_from_npy():
+    """Test loading a .npy file with and without memory mapping"""
+    arr = np.array([10, 20, 20, 30], dtype=np.int32)
+    with tempfile.NamedTemporaryFile(suffix=".npy", delete=False) as temp_file:
+        temp_path = temp_file.name
+    np.save(temp_path, arr)
+
+    try:
+        data = TailData.from_npy(temp_path)
+        assert isinstance(data.data, np.memmap)
+        assert data.data.dtype == np.int32
+        assert data.max_value == 30
+        assert temp_path in repr(data)
+
+        data = TailData.from_npy(temp_path, mmap=False)
+        assert not isinstance(data.data, np.memmap)
+        np.testing.assert_array_equal(data.data, arr)
+        del data
+    finally:
+        os.unlink(temp_path)
+
+    with pytest.raises(FileNotFoundError):
+        TailData.from_npy(temp_path)
+
+
+@pytest.mark.parametrize(
+    "opener,extension",
+    [(gzip.open, ".gz"), (bz2.open, ".bz2"), (lzma.open, ".xz")],
+)
+def test_load_compressed_data(opener, extension):
+    """Test streaming compressed histogram files"""
+    expected = TailData(name="CAIDA_KONECT")
+    with open(expected._resolve_path(), "rb") as file:
+        content = file.read()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = os.path.join(temp_dir, "CAIDA_KONECT.dat" + extension)
+        with opener(temp_path, "wb") as file:
+            file.write(content)
+
+        # Use a small chunk size so that lines straddle chunk boundaries
+        data = TailData(path=temp_path, chunk_size=64)
+        np.testing.assert_array_equal(data.values, expected.values)
+        np.testing.assert_array_equal(data.counts, expected.counts)
+
+        # Compression is also detected from the magic bytes alone
+        plain_name = os.path.join(temp_dir, "degrees")
+        os.rename(temp_path, plain_name)
+        data = TailData(path=plain_name, chunk_size=64)
+        np.testing.assert_array_equal(data.data, expected.data)
+
+
+def test_load_raw_samples():
+    """Test loading a file with one raw sample per line"""
+    samples = np.random.default_rng(0).pareto(2, 1000) + 1
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = os.path.join(temp_dir, "samples.txt.gz")
+        with gzip.open(temp_path, "wt") as file:
+            file.write("% raw samples\n")
+            file.writelines(f"{float(v)!r}\n" for v in samples[:500])
+            file.write("\n")
+            file.writelines(f"{float(v)!r}\n" for v in samples[500:])
+
+        data = TailData(path=temp_path, chunk_size=100)
+        np.testing.assert_array_equal(data.data, samples)
+        assert data.n == 1000
+        assert data.max_value == samples.max()
+        np.testing.assert_array_equal(data.load_data(), samples)
+        _, counts = data.load_counts()
+        assert counts.sum() == 1000
+
+
+def test_load_malformed_data():
+    """Test that malformed lines raise a ValueError"""
+    # the second file has as many fields in total as three full lines
+    for content in ("10 3\n20\n", "10 3\n20\n30 1 5\n"):
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_file:
+            temp_file.write(content)
+            temp_path = temp_file.name
+
+        try:
+            with pytest.raises(ValueError):
+                TailData(path=temp_path)
+        finally:
+            os.unlink(temp_path)
+
+
+def test_from_edgelist():
+    """Test extracting degree sequences from an edge list in one pass"""
+    rng = np.random.default_rng(0)
+    edges = rng.integers(1, 200, size=(5000, 2))
+    out_expected = np.bincount(edges[:, 0])
+    in_expected = np.bincount(edges[:, 1])
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = os.path.join(temp_dir, "out.test.gz")
+        with gzip.open(temp_path, "wt") as file:
+            file.write("% asym unweighted\n")
+            file.write("% 5000 200 200\n")
+            file.writelines(f"{u} {v} 1\n" for u, v in edges)
+
+        in_deg, out_deg, total_deg = TailData.from_edgelist(
+            temp_path, direction=("in", "out", "total"), chunk_size=256
+        )
+        np.testing.assert_array_equal(
+            np.sort(in_deg.data), np.sort(in_expected[in_expected > 0])
+        )
+        np.testing.assert_array_equal(
+            np.sort(out_deg.data), np.sort(out_expected[out_expected > 0])
+        )
+        assert total_deg.n == len(np.union1d(edges[:, 0], edges[:, 1]))
+        assert total_deg.data.sum() == 2 * len(edges)
+
+        single = TailData.from_edgelist(temp_path, direction="in")
+        np.testing.assert_array_equal(single.values, in_deg.values)
+        np.testing.assert_array_equal(single.counts, in_deg.counts)
+
+        with pytest.raises(ValueError):
+            TailData.from_edgelist(temp_path, direction="up")
+
+
+def test_from_csr():
+    """Test extracting degree sequences from CSR arrays"""
+    # 0 -> 1, 0 -> 2, 1 -> 2, 3 -> 2
+    indptr = np.array([0, 2, 3, 3, 4])
+    indices = np.array([1, 2, 2, 2])
+
+    out_deg = TailData.from_csr(indptr)
+    np.testing.assert_array_equal(np.sort(out_deg.data), [1, 1, 2])
+
+    in_deg = TailData.from_csr(indptr, indices, direction="in")
+    np.testing.assert_array_equal(np.sort(in_deg.data), [1, 3])
+
+    total_deg = TailData.from_csr(indptr, indices, direction="total")
+    np.testing.assert_array_equal(np.sort(total_deg.data), [1, 2, 2, 3])
+
+    with pytest.raises(ValueError):
+        TailData.from_csr(indptr, direction="in")
+
+
+@pytest.fixture
+def catalog_dir():
+    """Directory with a few small datasets in different formats"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for i in range(3):
+            with open(os.path.join(temp_dir, f"hist{i}.dat"), "w") as file:
+                file.writelines(f"{v} {10 * (i + 1)}\n" for v in range(1, 101))
+        with gzip.open(os.path.join(temp_dir, "packed.dat.gz"), "wt") as file:
+            file.write("5 2\n7 1\n")
+        np.save(os.path.join(temp_dir, "dense.npy"), np.arange(1, 11, dtype=np.int32))
+        with open(os.path.join(temp_dir, "notes.txt"), "w") as file:
+            file.write("not a dataset\n")
+        yield temp_dir
+
+
+def test_catalog_lookup(catalog_dir):
+    """Test that the catalog finds and loads datasets by name"""
+    with DatasetCatalog(catalog_dir) as catalog:
+        assert catalog.names == ["dense", "hist0", "hist1", "hist2", "packed"]
+        assert "notes" not in catalog
+        assert len(catalog) == 5
+
+        # Metadata and statistics are read from the files without loading them
+        info = catalog.info("hist1")
+        assert info["format"] == "text"
+        assert info["compression"] is None
+        assert info["size"] == os.path.getsize(catalog.path("hist1"))
+        assert (info["n"], info["n_unique"], info["max_value"]) == (2000, 100, 100)
+        packed = catalog.info("packed")
+        assert packed["compression"] == "gz"
+        assert (packed["n"], packed["n_unique"], packed["max_value"]) == (3, 2, 7)
+        dense = catalog.info("dense")
+        assert (dense["format"], dense["n"], dense["dtype"]) == ("npy", 10, "int32")
+        assert (dense["n_unique"], dense["max_value"]) == (10, 10)
+        assert not any(catalog.is_cached(name) for name in catalog)
+
+        # Loaded datasets agree with the streamed statistics
+        assert not catalog["hist1"].is_materialized
+        assert catalog["hist1"].n_unique == catalog.info("hist1")["n_unique"]
+        assert catalog["packed"].n == 3
+        assert catalog["dense"].data.dtype == np.int32
+
+        # Cached datasets are returned without reloading
+        assert catalog["hist1"] is catalog.get("hist1")
+
+        with pytest.raises(KeyError):
+            catalog.get("missing")
+
+
+def test_catalog_info_streaming():
+    """Test that streamed statistics match the loaded datasets"""
+    rng = np.random.default_rng(5)
+    samples = rng.integers(1, 300, size=1000).astype(float)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with open(os.path.join(temp_dir, "raw.dat"), "w") as file:
+            file.writelines(f"{float(v)!r}\n" for v in samples)
+        with open(os.path.join(temp_dir, "zeros.dat"), "w") as file:
+            file.write("1 4\n9 0\n3 2\n")
+        with DatasetCatalog(temp_dir, chunk_size=64) as catalog:
+            for name in ("raw", "zeros"):
+                info = catalog.info(name)
+                assert not catalog.is_cached(name)
+                dataset = catalog[name]
+                assert (info["n"], info["n_unique"], info["max_value"]) == (
+                    dataset.n,
+                    dataset.n_unique,
+                    dataset.max_value,
+                )
+            assert catalog.info("zeros")["max_value"] == 3
+
+            # statistics follow changes of the file
+            with open(os.path.join(temp_dir, "zeros.dat"), "a") as file:
+                file.write("12 1\n")
+            assert catalog.info("zeros")["max_value"] == 12
+
+
+def test_catalog_default_directory():
+    """Test that the catalog defaults to the built-in datasets"""
+    with DatasetCatalog() as catalog:
+        assert {"CAIDA_KONECT", "Libimseti_in_KONECT", "Pareto"} <= set(catalog)
+        assert catalog.info("Pareto")["size"] > 0
+        assert catalog["Pareto"].n == catalog.info("Pareto")["n"] == 5000
+
+
+def test_catalog_lru_eviction(catalog_dir):
+    """Test that the cache is bounded and evicts the least recently used dataset"""
+    # Each histogram holds 100 float64 values and 100 int64 counts
+    with DatasetCatalog(catalog_dir, max_bytes=2 * 1600) as catalog:
+        catalog.get("hist0")
+        catalog.get("hist1")
+        catalog.get("hist0")
+        catalog.get("hist2")
+        assert catalog.is_cached("hist0")
+        assert catalog.is_cached("hist2")
+        assert not catalog.is_cached("hist1")
+
+        # Metadata survives eviction
+        catalog.info("hist0")
+        catalog.get("hist1")
+        catalog.get("hist2")
+        assert not catalog.is_cached("hist0")
+        assert catalog.info("hist0")["n"] == 1000
+        assert not catalog.is_cached("hist0")
+
+
+def test_catalog_prefetch_and_concurrent_access(catalog_dir):
+    """Test background prefetching and concurrent access to the same dataset"""
+    with DatasetCatalog(catalog_dir) as catalog:
+        futures = catalog.prefetch(["hist0", "hist1", "hist2"])
+        datasets = [future.result() for future in futures]
+        assert [d.n for d in datasets] == [1000, 2000, 3000]
+        assert all(catalog.is_cached(name) for name in ("hist0", "hist1", "hist2"))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            loaded = list(pool.map(catalog.get, ["packed"] * 16))
+        assert all(dataset is loaded[0] for dataset in loaded)
+
+
+@pytest.mark.parametrize("distribution", ["pareto", "student_t", "frechet", "zipf"])
+def test_generate_samples_deterministic(distribution):
+    """Test that generated samples only depend on the seed and chunk size"""
+    single = generate_samples(
+        distribution, 10_000, xi=0.5, seed=7, chunk_size=999, max_workers=1
+    )
+    threaded = generate_samples(
+        distribution, 10_000, xi=0.5, seed=7, chunk_size=999, max_workers=4
+    )
+    assert isinstance(single, TailData)
+    assert single.n == 10_000
+    assert np.all(single.data > 0)
+    np.testing.assert_array_equal(single.data, threaded.data)
+
+    other = generate_samples(distribution, 10_000, xi=0.5, seed=8, chunk_size=999)
+    assert not np.array_equal(single.data, other.data)
+
+
+def test_generate_samples_tail_index():
+    """Test that generated Pareto samples have the requested tail index"""
+    from tailestim.estimators.tail_methods import get_moments_estimates_1
+
+    data = generate_samples("pareto", 100_000, xi=0.5, seed=0).data
+    xi_hill = get_moments_estimates_1(np.sort(data)[::-1])[999]
+    assert abs(xi_hill - 0.5) < 0.05
+
+
+def test_generate_samples_outputs():
+    """Test memmap and histogram outputs"""
+    expected = generate_samples("zipf", 5_000, xi=0.8, seed=3, chunk_size=1000)
+    assert expected.data.dtype == np.int64
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = os.path.join(temp_dir, "zipf.npy")
+        mapped = generate_samples(
+            "zipf", 5_000, xi=0.8, seed=3, chunk_size=1000, out=temp_path
+        )
+        assert isinstance(mapped.data, np.memmap)
+        np.testing.assert_array_equal(mapped.data, expected.data)
+        del mapped
+
+    hist = generate_samples(
+        "zipf", 5_000, xi=0.8, seed=3, chunk_size=1000, histogram=True
+    )
+    assert not hist.is_materialized
+    values, counts = np.unique(expected.data, return_counts=True)
+    np.testing.assert_array_equal(hist.values, values)
+    np.testing.assert_array_equal(hist.counts, counts)
+
+    with pytest.raises(ValueError):
+        generate_samples("pareto", 10, histogram=True)
+    with pytest.raises(ValueError):
+        generate_samples("cauchy", 10)
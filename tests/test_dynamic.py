@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from tailestim.dynamic import DegreeTracker
+from tailestim.estimators.hill import HillEstimator
+from tailestim.estimators.tail_methods import (
+    get_moments_estimates_2,
+    moments_xi,
+    pickands_estimator,
+)
+
+
+def random_edges(rng, n_nodes, n_edges):
+    """Edges between nodes drawn with heavy-tailed weights."""
+    weights = rng.pareto(1.5, n_nodes) + 1
+    return rng.choice(n_nodes, size=(n_edges, 2), p=weights / weights.sum())
+
+
+def test_degree_tracker_updates():
+    """Test the incremental degrees and histogram against recomputation."""
+    rng = np.random.default_rng(0)
+    edges = random_edges(rng, 2000, 5000)
+    tracker = DegreeTracker()
+    tracker.add_edges(edges[:3000])
+    tracker.update(inserted=edges[3000:], deleted=edges[:1000])
+    tracker.remove_edges(edges[1000:1500])
+
+    degrees = np.bincount(edges[1500:].ravel(), minlength=len(tracker.degrees))
+    np.testing.assert_array_equal(tracker.degrees, degrees)
+    values, counts = tracker.histogram()
+    np.testing.assert_array_equal(values, np.unique(degrees[degrees > 0])[::-1])
+    np.testing.assert_array_equal(counts, np.bincount(degrees)[values])
+    assert tracker.n == np.count_nonzero(degrees)
+    np.testing.assert_array_equal(
+        tracker.ordered_data(), np.sort(degrees[degrees > 0])[::-1]
+    )
+
+    with pytest.raises(ValueError):
+        DegreeTracker().remove_edges(edges[:1])
+
+
+def test_degree_tracker_estimates():
+    """Test the histogram estimates against the estimators on sorted data."""
+    rng = np.random.default_rng(1)
+    tracker = DegreeTracker()
+    tracker.add_edges(random_edges(rng, 5000, 20000))
+    ordered_data = tracker.ordered_data()
+
+    k = np.array([1, 10, 100, 1000, len(ordered_data) - 1])
+    M1, M2 = get_moments_estimates_2(ordered_data)
+    np.testing.assert_allclose(tracker.hill(k), M1[k - 1], rtol=1e-9)
+    np.testing.assert_allclose(
+        tracker.moments(k[:-1]), moments_xi(M1, M2)[k[:-1] - 1], rtol=1e-9
+    )
+    k_arr, xi_arr = pickands_estimator(ordered_data)
+    k = np.array([1, 5, 50, len(k_arr)])
+    np.testing.assert_array_equal(tracker.pickands(k), xi_arr[k - 1])
+
+    with pytest.raises(ValueError):
+        tracker.hill()
+    result = tracker.select_k_star(HillEstimator(r_bootstrap=50, base_seed=0))
+    assert tracker.k_star == result.k_star_
+    assert tracker.hill() == pytest.approx(result.xi_star_)
+    with pytest.raises(ValueError):
+        tracker.hill(len(ordered_data))
@@ -46,6 +46,43 @@ def test_tail_estimator_set_fit():
     assert (
         estimator_set.ordered_data[0] >= estimator_set.ordered_data[-1]
     )  # Check ordering
+    assert estimator_set.results["power_law"]["k_star_"] > 1
+
+
+def test_tail_estimator_set_deadline():
+    """Test that a fit without time left degrades every bootstrap estimator."""
+    data = np.random.default_rng(42).pareto(2, 1000)
+    estimator_set = TailEstimatorSet(base_seed=1)
+    estimator_set.fit(data, deadline=0.0)
+
+    cuts = estimator_set.results["cuts"]
+    assert cuts["hill"] == ["bootstrap"]
+    assert cuts["kernel"] == ["bootstrap"]
+    assert cuts["power_law"] == ["skipped"]
+    assert "power_law" not in estimator_set.results
+    assert "k_star_" in estimator_set.results["hill"]
+    assert "k_star_" not in estimator_set.results["kernel"]
+
+
+def test_tail_estimator_set_plan():
+    """Test that the plan of the set covers the plans of its estimators."""
+    estimator_set = TailEstimatorSet(r_bootstrap=100)
+    plan = estimator_set.plan(5000)
+    estimators = vars(plan.estimators_)
+    assert set(estimators) == {
+        "pickands",
+        "pot",
+        "smooth_hill",
+        "hill",
+        "power_law",
+        "moments",
+        "kernel",
+    }
+    assert plan.cost_ > sum(estimator.cost_ for estimator in estimators.values())
+    assert plan.phases_.hill_bootstrap_1.cost_ == (
+        estimators["hill"].phases_.bootstrap_1.cost_
+    )
+    assert estimator_set.results is None
 
 
 def test_tail_estimator_set_plot():
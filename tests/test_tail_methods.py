@@ -1,15 +1,36 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 
+import tailestim
+from tailestim.estimators.cost import calibrate
 from tailestim.estimators.hill import HillEstimator
 from tailestim.estimators.kernel import KernelTypeEstimator
 from tailestim.estimators.moments import MomentsEstimator
 from tailestim.estimators.pickands import PickandsEstimator
+from tailestim.estimators.pot import POTEstimator
+from tailestim.estimators.power_law import PowerLawEstimator, goodness_of_fit
 from tailestim.estimators.smooth_hill import SmoothHillEstimator
 from tailestim.estimators.tail_methods import (
+    BootstrapLevel,
+    PrefixSumCache,
     add_uniform_noise,
+    blocked_cumsums,
+    double_bootstrap,
+    exceedance_control,
+    get_biweight_kernel_estimates,
     get_ccdf,
     get_distribution,
+    get_moments_estimates_3,
+    hill_amse,
+    linear_grid,
+    log_power_cumsums,
+    merge_descending,
+    single_bootstrap,
 )
 
 pytestmark = [
@@ -126,8 +147,9 @@ def test_hill_estimator():
 def test_hill_estimator_max_resample():
     """Test that HillEstimator raises RuntimeError when max_resample is exceeded."""
     # Near-constant degree sequence (n=115).
-    # With n < 200, the boundary shift int(0.005*n) == 0, so k2 > k1
-    # persists indefinitely and max_resample is always hit.
+    # The bootstrap samples are far smaller than 200, so the window shift
+    # int(0.005*n1) == 0; every retry adds fresh replicates, k2 > k1
+    # persists and max_resample is always hit.
     data = np.array(
         [
             12,
@@ -253,6 +275,370 @@ def test_hill_estimator_max_resample():
         estimator.fit(data)
 
 
+def _false_minimum_statistic(n1):
+    """AMSE curve increasing for the 1st bootstrap, minimal at index 5 for the 2nd."""
+
+    def statistic(sample):
+        curve = np.arange(len(sample), dtype=float)
+        if len(sample) != n1:
+            curve = np.abs(curve - 5)
+        return curve
+
+    return statistic
+
+
+def test_double_bootstrap_retries_reuse_replicates():
+    """Test that false minima are resolved on the accumulated AMSE curves."""
+    data = np.sort(np.random.default_rng(0).pareto(2, 10000) + 1)[::-1]
+    n1 = int(10000 ** (0.5 * (1 + np.log(5000) / np.log(10000))))
+    level1, index1, level2, index2 = double_bootstrap(
+        data,
+        _false_minimum_statistic(n1),
+        linear_grid,
+        r_bootstrap=5,
+        base_seed=42,
+        max_resample=3,
+    )
+    assert index2 <= index1
+    assert index1 == int(0.005 * n1)
+    assert level1.n_replicates == level2.n_replicates == 5
+
+    # without a window shift every retry adds fresh replicates, up to the bound
+    with pytest.raises(RuntimeError, match="failed to converge after 3 resampling"):
+        double_bootstrap(
+            data,
+            _false_minimum_statistic(n1),
+            linear_grid,
+            r_bootstrap=5,
+            base_seed=42,
+            max_resample=3,
+            window_shift=0,
+        )
+
+    # replicates drawn before a retry stay in the averages
+    calls = [0]
+
+    def statistic(sample):
+        curve = np.arange(len(sample), dtype=float)
+        if len(sample) == n1:
+            return curve
+        calls[0] += 1
+        return np.abs(curve - 5) if calls[0] <= 5 else 10 * curve
+
+    level1, index1, level2, index2 = double_bootstrap(
+        data, statistic, linear_grid, r_bootstrap=5, base_seed=42, window_shift=0
+    )
+    assert index2 <= index1
+    assert level1.n_replicates == level2.n_replicates == level2.n_drawn == 10
+
+
+@pytest.mark.parametrize("estimator_cls", [HillEstimator, MomentsEstimator])
+def test_adaptive_bootstrap_stops_early(estimator_cls):
+    """Test that adaptive mode stops before r_bootstrap and reports its count."""
+    data = np.random.default_rng(3).pareto(2, 5000) + 1
+
+    fixed = estimator_cls(r_bootstrap=400, base_seed=7)
+    fixed.fit(data)
+    assert fixed.get_result().bootstrap_results_.n_replicates_ == 400
+
+    results = []
+    for _ in range(2):
+        estimator = estimator_cls(
+            r_bootstrap=400, adaptive=True, adaptive_block=25, base_seed=7
+        )
+        estimator.fit(data)
+        results.append(estimator.get_result())
+    n_replicates = results[0].bootstrap_results_.n_replicates_
+    assert n_replicates < 400
+    assert n_replicates % 25 == 0
+    assert results[0].k_star_ == results[1].k_star_
+    assert n_replicates == results[1].bootstrap_results_.n_replicates_
+
+
+def test_exceedance_control_expectation():
+    """Test that the control variate's expectation matches its bootstrap mean."""
+    rng = np.random.default_rng(0)
+    data = np.sort(np.floor(rng.pareto(1.2, 2000) + 1))[::-1]
+    fractions = np.linspace(1.0 / 400, 1.0, 400)[:-1]
+    control, expectation = exceedance_control(data, fractions)
+    mean = np.mean(
+        [control(np.sort(rng.choice(data, 400))[::-1]) for _ in range(2000)], axis=0
+    )
+    np.testing.assert_allclose(mean, expectation, rtol=0.05)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"antithetic": True}, {"control_variate": True}],
+)
+def test_variance_reduced_bootstrap(options):
+    """Test the variance-reduced double-bootstrap modes."""
+    data = np.random.default_rng(3).pareto(2, 5000) + 1
+    k_stars = []
+    for _ in range(2):
+        estimator = MomentsEstimator(r_bootstrap=51, base_seed=7, **options)
+        estimator.fit(data)
+        result = estimator.get_result()
+        k_stars.append(result.k_star_)
+    assert k_stars[0] == k_stars[1]
+    assert 0 < k_stars[0] < len(data)
+    # antithetic pairs round the number of replicates up to an even number
+    expected = 52 if options.get("antithetic") else 51
+    assert result.bootstrap_results_.n_replicates_ == expected
+
+
+@pytest.mark.parametrize("control", [False, True])
+def test_antithetic_standard_error(control):
+    """Test that the antithetic standard error is the one of the pair means."""
+    data = np.sort(np.random.default_rng(5).pareto(2, 1000) + 1)[::-1]
+    outputs, controls = [], []
+
+    def statistic(sample):
+        outputs.append(np.cumsum(np.log(sample))[:20])
+        return outputs[-1]
+
+    def control_curve(sample):
+        controls.append(np.log(sample[:20]))
+        return controls[-1]
+
+    level = BootstrapLevel(
+        data,
+        200,
+        statistic,
+        linear_grid(200)[:20],
+        1.0,
+        antithetic=True,
+        control=(control_curve, np.zeros(20)) if control else None,
+    )
+    level.add_replicates(40, np.random.default_rng(0))
+    pairs = np.array(outputs).reshape(20, 2, -1).mean(axis=1)
+    var = pairs.var(axis=0)
+    if control:
+        pair_controls = np.array(controls).reshape(20, 2, -1).mean(axis=1)
+        cov = (pairs * pair_controls).mean(axis=0) - pairs.mean(
+            axis=0
+        ) * pair_controls.mean(axis=0)
+        var = var - cov * cov / pair_controls.var(axis=0)
+    expected = np.sqrt(var * 20 / 19 / 20)
+    np.testing.assert_allclose(level.standard_error, expected, atol=1e-6)
+
+
+@pytest.mark.parametrize("estimator_class", [HillEstimator, MomentsEstimator])
+@pytest.mark.parametrize("weights", ["multinomial", "bayesian"])
+def test_weighted_bootstrap(estimator_class, weights):
+    """Test the sort-free weighted double-bootstrap against the classic one."""
+    data = np.random.default_rng(3).pareto(2, 5000) + 1
+    classic = estimator_class(r_bootstrap=50, base_seed=7)
+    classic.fit(data)
+    expected = classic.get_result()
+    k_stars = []
+    for _ in range(2):
+        estimator = estimator_class(
+            r_bootstrap=50, base_seed=7, weighted_bootstrap=weights, batch_size=16
+        )
+        estimator.fit(data)
+        result = estimator.get_result()
+        k_stars.append(result.k_star_)
+    assert k_stars[0] == k_stars[1]
+    # both weight modes agree with the classic estimate on a pure Pareto
+    # sample, not a minimum among the first few (fractional) order statistics;
+    # the moments AMSE is too flat here to compare thresholds
+    np.testing.assert_allclose(result.xi_star_, expected.xi_star_, atol=0.02)
+    assert result.k_star_ > 100
+    if estimator_class is HillEstimator:
+        np.testing.assert_allclose(result.k_star_, expected.k_star_, rtol=0.3)
+    # retries after a false minimum draw a fresh round of replicates
+    assert result.bootstrap_results_.n_replicates_ % 50 == 0
+
+    with pytest.raises(ValueError):
+        estimator_class(weighted_bootstrap="poisson").fit(data)
+    with pytest.raises(ValueError):
+        estimator_class(weighted_bootstrap=weights, antithetic=True).fit(data)
+
+
+@pytest.mark.parametrize(
+    "estimator_class", [HillEstimator, MomentsEstimator, KernelTypeEstimator]
+)
+def test_verbose_logging(estimator_class, caplog):
+    """Test the double-bootstrap information logged in verbose mode."""
+    data = np.random.default_rng(3).pareto(2, 2000) + 1
+    estimator = estimator_class(r_bootstrap=20, base_seed=1, verbose=True)
+    with caplog.at_level(logging.INFO, logger="tailestim"):
+        estimator.fit(data)
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(
+        message.startswith("Size of the 1st bootstrap sample n1: ")
+        for message in messages
+    )
+    assert all(not message.endswith(":") for message in messages)
+
+
+@pytest.mark.parametrize("estimator_class", [HillEstimator, MomentsEstimator])
+def test_single_bootstrap(estimator_class):
+    """Test the single-bootstrap threshold selection."""
+    data = np.random.default_rng(3).pareto(2, 5000) + 1
+    results = []
+    for _ in range(2):
+        estimator = estimator_class(
+            threshold_method="single_bootstrap",
+            r_bootstrap=50,
+            base_seed=7,
+            diagn_plots=True,
+        )
+        estimator.fit(data)
+        results.append(estimator.get_result())
+    result = results[0]
+    assert result.k_star_ == results[1].k_star_
+    assert 1 < result.k_star_ < len(data)
+    bootstrap_results = result.bootstrap_results_
+    assert bootstrap_results.n_replicates_ == 50
+    first = bootstrap_results.first_bootstrap_
+    assert 0 < first.k_min_ < 1
+    assert bootstrap_results.second_bootstrap_.amse_ is None
+
+    # the single level is the 1st level of the double-bootstrap
+    estimator = estimator_class(r_bootstrap=50, base_seed=7, diagn_plots=True)
+    estimator.fit(data)
+    double = estimator.get_result().bootstrap_results_.first_bootstrap_
+    np.testing.assert_array_equal(first.x_arr_, double.x_arr_)
+
+
+@pytest.mark.parametrize(
+    "params", [{}, {"antithetic": True}, {"weighted_bootstrap": "multinomial"}]
+)
+def test_rng_mode(params):
+    """Test the legacy and the fast random streams of the replicates."""
+    data = np.random.default_rng(3).pareto(2, 3000) + 1
+
+    def fit(base_seed, **kwargs):
+        estimator = HillEstimator(
+            r_bootstrap=60, base_seed=base_seed, diagn_plots=True, **params, **kwargs
+        )
+        estimator.fit(data)
+        return estimator.get_result()
+
+    # legacy is the default stream
+    default, legacy = fit(7), fit(7, rng_mode="legacy")
+    assert default.k_star_ == legacy.k_star_
+    np.testing.assert_array_equal(
+        default.bootstrap_results_.first_bootstrap_.amse_,
+        legacy.bootstrap_results_.first_bootstrap_.amse_,
+    )
+
+    # fast streams are reproducible, also from a SeedSequence
+    for seed in (7, np.random.SeedSequence(7)):
+        first, second = fit(seed, rng_mode="fast"), fit(seed, rng_mode="fast")
+        assert first.k_star_ == second.k_star_
+        np.testing.assert_array_equal(
+            first.bootstrap_results_.second_bootstrap_.amse_,
+            second.bootstrap_results_.second_bootstrap_.amse_,
+        )
+        assert 1 < first.k_star_ < len(data)
+
+    with pytest.raises(ValueError):
+        fit(7, rng_mode="unknown")
+
+
+# results of tailestim 0.7.0, before rng_mode, on a Pareto sample without false
+# AMSE minima: k_star, xi_star, the minima of both bootstrap levels and
+# xi_arr at the indices
+LEGACY_BASELINE = {
+    HillEstimator: (
+        1380,
+        0.39573377316829095,
+        (0.9207547169811321, 0.9212283044058746),
+        [9, 99, 999],
+        [0.4815921178987348, 0.36520949525618396, 0.39560258770733325],
+    ),
+    MomentsEstimator: (
+        1477,
+        0.3888926639490937,
+        (0.9735849056603774, 0.9626168224299065),
+        [9, 99, 999],
+        [0.2925163428619906, 0.38914048733526274, 0.3946517785325223],
+    ),
+    KernelTypeEstimator: (
+        1291,
+        0.3980753553155403,
+        (0.8674791873983777, 0.8736492446521672),
+        [9, 30, 49],
+        [0.5679689631879465, 0.3349784367753238, 0.3887484512996672],
+    ),
+}
+
+
+@pytest.mark.parametrize("estimator_class", list(LEGACY_BASELINE))
+def test_rng_mode_legacy_baseline(estimator_class):
+    """Test that legacy streams reproduce the results of earlier versions."""
+    data = np.random.default_rng(4).pareto(2.5, 1500) + 1
+    params = {"hsteps": 50} if estimator_class is KernelTypeEstimator else {}
+    estimator = estimator_class(
+        r_bootstrap=40, base_seed=4, rng_mode="legacy", diagn_plots=True, **params
+    )
+    estimator.fit(data)
+    result = estimator.get_result()
+    k_star, xi_star, minima, indices, xi_values = LEGACY_BASELINE[estimator_class]
+    assert result.k_star_ == k_star
+    assert result.xi_star_ == xi_star
+    assert (estimator.results[6], estimator.results[10]) == minima
+    np.testing.assert_array_equal(result.xi_arr_[indices], xi_values)
+
+
+def test_rng_mode_levels():
+    """Test that fast streams do not depend on the number of levels."""
+    ordered_data = np.sort(np.random.default_rng(3).pareto(2, 3000) + 1)[::-1]
+    options = {"r_bootstrap": 30, "base_seed": 11, "rng_mode": "fast"}
+    level1, _, _, _ = double_bootstrap(
+        ordered_data, hill_amse, linear_grid, check_false_minimum=False, **options
+    )
+    level, _ = single_bootstrap(ordered_data, hill_amse, linear_grid, **options)
+    np.testing.assert_array_equal(level.amse, level1.amse)
+
+
+@pytest.mark.parametrize("estimator_class", [HillEstimator, MomentsEstimator])
+@pytest.mark.parametrize("method", ["stability", "guillou_hall", "min_ks"])
+def test_closed_form_threshold(estimator_class, method):
+    """Test the threshold selections without resampling."""
+    data = np.random.default_rng(3).pareto(2, 5000) + 1
+    estimator = estimator_class(threshold_method=method, diagn_plots=True)
+    estimator.fit(data)
+    result = estimator.get_result()
+    assert 1 < result.k_star_ < len(data)
+    assert result.xi_star_ == result.xi_arr_[result.k_star_ - 1]
+    assert abs(result.xi_star_ - 0.5) < 0.1
+    bootstrap_results = result.bootstrap_results_
+    assert bootstrap_results.n_replicates_ == 0
+    first = bootstrap_results.first_bootstrap_
+    assert first.k_min_ == result.k_star_ / len(data)
+    assert len(first.x_arr_) == len(first.amse_)
+    assert bootstrap_results.second_bootstrap_.amse_ is None
+
+    with pytest.raises(ValueError):
+        estimator_class(threshold_method="hill_plot").fit(data)
+
+
+def test_hill_estimator_native_dtypes():
+    """Test that narrow dtypes are upcast for the log sums, not truncated."""
+    np.random.seed(42)
+    data = np.random.pareto(2, 1000) + 1
+
+    expected = HillEstimator(bootstrap=False)
+    expected.fit(data.astype(np.float32).astype(np.float64))
+
+    estimator = HillEstimator(bootstrap=False)
+    estimator.fit(data.astype(np.float32))
+    np.testing.assert_allclose(
+        estimator.get_result().xi_arr_, expected.get_result().xi_arr_, rtol=1e-12
+    )
+
+    degrees = np.ceil(data * 10).astype(np.int32)
+    expected.fit(degrees.astype(np.float64))
+    estimator.fit(degrees)
+    np.testing.assert_array_equal(
+        estimator.get_result().xi_arr_, expected.get_result().xi_arr_
+    )
+
+
 def test_smooth_hill_estimator():
     np.random.seed(42)
     data = np.random.pareto(2, 1000)
@@ -390,3 +776,427 @@ def test_pickands_estimator():
     # Test that params are returned
     params = estimator.get_params()
     assert params is not None
+
+
+@pytest.mark.parametrize("discrete", [False, True])
+def test_power_law_estimator(discrete):
+    """Test the xmin scan against a direct fit for every candidate."""
+    rng = np.random.default_rng(5)
+    tail = 10.0 * rng.uniform(size=3000) ** (-1 / 1.5)
+    body = rng.uniform(1.0, 10.0, size=3000)
+    data = np.concatenate([tail, body])
+    if discrete:
+        data = np.floor(data)
+
+    estimator = PowerLawEstimator(discrete=discrete)
+    estimator.fit(data)
+    res = estimator.get_result()
+    assert len(res.xmin_arr_) == len(res.k_arr_) == len(res.ks_arr_)
+    assert res.xmin_ == res.xmin_arr_[np.argmin(res.ks_arr_)]
+    assert abs(res.gamma_ - 2.5) < 0.2
+    if not discrete:
+        assert abs(res.xmin_ - 10.0) < 3.0
+
+    shift = 0.5 if discrete else 0.0
+    for xmin, k, xi, ks in zip(res.xmin_arr_, res.k_arr_, res.xi_arr_, res.ks_arr_):
+        tail_values = np.sort(data[data >= xmin])
+        alpha = 1 + len(tail_values) / np.sum(np.log(tail_values / (xmin - shift)))
+        uniques, first = np.unique(tail_values, return_index=True)
+        model = 1 - ((uniques - shift) / (xmin - shift)) ** (1 - alpha)
+        below = first / len(tail_values)
+        above = np.append(first[1:], len(tail_values)) / len(tail_values)
+        expected = max(np.abs(below - model).max(), np.abs(above - model).max())
+        assert k == len(tail_values)
+        assert xi == pytest.approx(1 / (alpha - 1))
+        assert ks == pytest.approx(expected)
+
+
+def test_goodness_of_fit():
+    """Test the bootstrap p-value and its independence of the process count."""
+    data = np.floor(np.random.default_rng(5).pareto(1.5, 2000) + 1)
+    estimator = PowerLawEstimator(discrete=True)
+    estimator.fit(data)
+    result = estimator.get_result()
+
+    gof = goodness_of_fit(result, n_sims=20, n_jobs=1, base_seed=3)
+    assert len(gof.ks_sims_) == gof.n_sims_ == 20
+    assert 0.0 <= gof.p_value_ <= 1.0
+    assert gof.p_value_ == np.mean(gof.ks_sims_ >= result.ks_distance_)
+
+    parallel = goodness_of_fit(result, n_sims=20, n_jobs=2, base_seed=3)
+    np.testing.assert_array_equal(parallel.ks_sims_, gof.ks_sims_)
+
+    hill = HillEstimator(bootstrap=False)
+    hill.fit(data)
+    with pytest.raises(ValueError):
+        goodness_of_fit(hill.get_result(), n_sims=20)
+
+
+def test_pot_estimator():
+    """Test the GPD fits against the exact shape of Pareto exceedances."""
+    data = np.random.default_rng(7).pareto(2.0, 20000) + 1
+    estimator = POTEstimator(n_grid=50)
+    estimator.fit(data)
+    res = estimator.get_result()
+
+    assert len(res.k_arr_) == len(res.xi_arr_) == len(res.sigma_arr_)
+    assert np.all(np.diff(res.k_arr_) > 0)
+    assert np.all(res.sigma_arr_ > 0)
+    large = res.k_arr_ >= 500
+    assert np.all(np.abs(res.xi_arr_[large] - 0.5) < 0.15)
+
+    # the fit is a stationary point of the GPD log-likelihood
+    k = res.k_arr_[-10]
+    i = np.searchsorted(res.k_arr_, k)
+    exceedances = estimator.ordered_data[:k] - estimator.ordered_data[k]
+
+    def loglik(xi, sigma):
+        return -k * np.log(sigma) - (1 + 1 / xi) * np.sum(
+            np.log1p(xi * exceedances / sigma)
+        )
+
+    best = loglik(res.xi_arr_[i], res.sigma_arr_[i])
+    for dxi, dsigma in ((1e-3, 0), (-1e-3, 0), (0, 1e-3), (0, -1e-3)):
+        assert best >= loglik(res.xi_arr_[i] + dxi, res.sigma_arr_[i] * (1 + dsigma))
+
+
+def test_tail_quantile_and_sf():
+    """Test Weissman quantiles and exceedance probabilities of a Hill fit."""
+    data = np.random.default_rng(11).pareto(2.0, 50000) + 1
+    estimator = HillEstimator()
+    estimator.fit(data)
+    res = estimator.get_result()
+    n = len(data)
+
+    levels = np.array([0.999, 0.9999, 0.99999])
+    assert np.allclose(res.quantile(levels), (1 - levels) ** -0.5, rtol=0.1)
+    assert np.allclose(res.sf(res.quantile(levels)), 1 - levels)
+
+    # Weissman formula above the threshold, empirical survival below it
+    threshold = estimator.ordered_data[res.k_star_]
+    x = threshold * np.array([1.0, 2.0, 50.0])
+    expected = res.k_star_ / n * (x / threshold) ** (-1 / res.xi_star_)
+    assert np.allclose(res.sf(x), expected)
+    assert res.sf(1.5, k=1000) == np.mean(data > 1.5)
+    assert res.quantile(0.5, k=1000) == estimator.ordered_data[n // 2]
+
+    # vectorized over k
+    k = res.k_arr_[[99, 999, 9999]]
+    grid = res.quantile(levels, k=k)
+    assert grid.shape == (3, 3)
+    assert grid[1, 2] == res.quantile(levels[2], k=k[1])
+    assert res.sf(x, k=k).shape == (3, 3)
+
+    with pytest.raises(ValueError):
+        res.quantile(1.5)
+    with pytest.raises(ValueError):
+        res.quantile(0.99, k=n)
+    pickands = PickandsEstimator()
+    pickands.fit(data)
+    with pytest.raises(ValueError):
+        pickands.get_result().quantile(0.99)
+
+
+@pytest.mark.parametrize("estimator_class", [HillEstimator, PickandsEstimator])
+def test_two_tailed(estimator_class):
+    """Test the two-tailed fit against separate fits of both tails."""
+    data = np.random.default_rng(13).standard_t(3, 5000)
+    params = (
+        {"r_bootstrap": 50, "base_seed": 2} if estimator_class is HillEstimator else {}
+    )
+    estimator = estimator_class(two_tailed=True, **params)
+    estimator.fit(data)
+    res = estimator.get_result()
+    assert estimator.get_params()["two_tailed"]
+
+    for tail_res, tail_data in (
+        (res.upper_, data[data > 0]),
+        (res.lower_, -data[data < 0]),
+    ):
+        single = estimator_class(**params)
+        single.fit(tail_data)
+        expected = single.get_result()
+        np.testing.assert_allclose(tail_res.xi_arr_, expected.xi_arr_, rtol=1e-12)
+        if estimator_class is HillEstimator:
+            assert tail_res.k_star_ == expected.k_star_
+            assert tail_res.xi_star_ == pytest.approx(expected.xi_star_)
+
+    with pytest.raises(ValueError):
+        estimator.fit(np.abs(data))
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"antithetic": True, "adaptive_block": 25},
+        {"adaptive": True},
+        {"rng_mode": "fast", "antithetic": True, "adaptive_block": 25},
+    ],
+)
+def test_fit_iter(params):
+    """Test that the progressive fit ends with the result of fit."""
+    data = np.random.default_rng(19).pareto(1.5, 3000) + 1
+    params = {"r_bootstrap": 150, "base_seed": 4, **params}
+    estimator = HillEstimator(**params)
+    snapshots = list(estimator.fit_iter(data))
+    assert len(snapshots) > 1
+    assert snapshots[0].bootstrap_results_.first_bootstrap_.amse_ is not None
+
+    reference = HillEstimator(**params)
+    reference.fit(data)
+    expected = reference.get_result()
+    last = snapshots[-1]
+    assert last.k_star_ == expected.k_star_
+    assert last.xi_star_ == expected.xi_star_
+    assert (
+        last.bootstrap_results_.n_replicates_
+        == expected.bootstrap_results_.n_replicates_
+    )
+
+    # stopping early keeps the latest snapshot
+    estimator = HillEstimator(**params)
+    snapshots = estimator.fit_iter(data)
+    next(snapshots)
+    snapshot = next(snapshots)
+    snapshots.close()
+    assert estimator.get_result().k_star_ == snapshot.k_star_
+
+
+def test_fit_deadline():
+    """Test the results of fits with and without time left."""
+    data = np.random.default_rng(23).pareto(1.5, 3000) + 1
+    params = {"r_bootstrap": 100, "base_seed": 4}
+    reference = HillEstimator(**params)
+    reference.fit(data)
+    assert not hasattr(reference.get_result(), "cuts_")
+
+    estimator = HillEstimator(**params)
+    estimator.fit(data, deadline=60.0)
+    res = estimator.get_result()
+    assert res.cuts_ == []
+    assert res.k_star_ == reference.get_result().k_star_
+
+    # no time left: the closed-form fallback threshold
+    estimator.fit(data, deadline=0.0)
+    res = estimator.get_result()
+    assert res.cuts_ == ["bootstrap"]
+    assert res.bootstrap_results_.n_replicates_ == 0
+    assert 2 <= res.k_star_ < len(data)
+
+    # the fit returns at the deadline, and the fitting thread stops
+    # by itself before its next resample
+    threads = threading.active_count()
+    estimator = HillEstimator(r_bootstrap=2000, base_seed=4)
+    start = time.monotonic()
+    estimator.fit(data)
+    full = time.monotonic() - start
+    start = time.monotonic()
+    estimator.fit(data, deadline=0.0)
+    assert time.monotonic() - start < full / 2
+    assert estimator.cuts_ == ["bootstrap"]
+    estimator = HillEstimator(r_bootstrap=2000, adaptive_block=500, base_seed=4)
+    estimator.fit(data, deadline=0.0)
+    assert estimator.cuts_ == ["bootstrap"]
+    stopped = time.monotonic() + 10.0
+    while threading.active_count() > threads and time.monotonic() < stopped:
+        time.sleep(0.01)
+    assert threading.active_count() == threads
+
+    # on large data, the deadline is overrun by no more than the passes
+    # over the data needed by the fallback
+    data = np.random.default_rng(29).pareto(1.5, 300_000) + 1
+    for estimator_class in (HillEstimator, MomentsEstimator, KernelTypeEstimator):
+        start = time.monotonic()
+        estimator_class(bootstrap=False).fit(data)
+        passes = time.monotonic() - start
+        estimator = estimator_class(base_seed=4)
+        start = time.monotonic()
+        estimator.fit(data, deadline=0.05)
+        assert time.monotonic() - start < 0.05 + 3 * passes + 0.2
+        assert estimator.cuts_ == ["bootstrap"]
+
+
+def test_plan():
+    """Test the predicted costs of fits and the calibration of the model."""
+    coefficients = calibrate(n=2000, repeats=1, update=False)
+    assert all(value > 0 for value in coefficients.values())
+
+    plan = HillEstimator(r_bootstrap=100).plan(10_000, coefficients)
+    assert list(vars(plan.phases_)) == [
+        "sort",
+        "estimates",
+        "bootstrap_1",
+        "bootstrap_2",
+    ]
+    assert plan.seconds_ == pytest.approx(
+        sum(phase.seconds_ for phase in vars(plan.phases_).values())
+    )
+    assert plan.memory_ >= 8 * 10_000
+
+    # the cost grows with the data and the replicates
+    assert HillEstimator(r_bootstrap=100).plan(20_000).cost_ > plan.cost_
+    assert HillEstimator(r_bootstrap=200).plan(10_000).cost_ > plan.cost_
+    assert HillEstimator(bootstrap=False).plan(10_000).cost_ < plan.cost_
+    single = HillEstimator(r_bootstrap=100, threshold_method="single_bootstrap")
+    assert list(vars(single.plan(10_000).phases_))[-1] == "bootstrap"
+
+    # one sort, then the phases of both tails
+    two_tailed = MomentsEstimator(r_bootstrap=100, two_tailed=True).plan(10_000)
+    assert list(vars(two_tailed.phases_))[:3] == [
+        "sort",
+        "upper_estimates",
+        "upper_bootstrap_1",
+    ]
+    for estimator in (KernelTypeEstimator(), POTEstimator(), PowerLawEstimator()):
+        assert estimator.plan(10_000).seconds_ > 0
+
+
+def test_concurrent_fits():
+    """Test that concurrent fits in threads match sequential fits."""
+    datasets = [np.random.default_rng(seed).pareto(1.5, 2000) + 1 for seed in range(8)]
+    functions = [tailestim.hill, tailestim.moments, tailestim.pickands]
+
+    def fit(i):
+        function = functions[i % len(functions)]
+        params = {} if function is tailestim.pickands else {"r_bootstrap": 50}
+        return function(datasets[i], base_seed=i, **params)
+
+    expected = [fit(i) for i in range(len(datasets))]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(fit, range(len(datasets))))
+    for result, reference in zip(results, expected):
+        np.testing.assert_array_equal(result.xi_arr_, reference.xi_arr_)
+        assert getattr(result, "k_star_", None) == getattr(reference, "k_star_", None)
+
+    # one instance shared between threads
+    estimator = HillEstimator(r_bootstrap=50, base_seed=3)
+    expected = [estimator.estimate(data) for data in datasets]
+    assert estimator.results is None
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(estimator.estimate, datasets))
+        list(executor.map(estimator.fit, datasets))
+    assert [result.k_star_ for result in results] == [
+        result.k_star_ for result in expected
+    ]
+    # the state of the shared instance is the one of a single fit
+    fitted = expected[
+        next(
+            i
+            for i, data in enumerate(datasets)
+            if estimator.ordered_data.max() == data.max()
+        )
+    ]
+    assert estimator.get_result().k_star_ == fitted.k_star_
+
+
+@pytest.mark.parametrize(
+    "estimator_class",
+    [HillEstimator, MomentsEstimator, KernelTypeEstimator, PickandsEstimator],
+)
+def test_update(estimator_class):
+    """Test that updates with new data match a fit to the concatenated data."""
+    rng = np.random.default_rng(23)
+    batches = [rng.pareto(1.5, size) + 1 for size in (2000, 200, 30)]
+    params = {} if estimator_class is PickandsEstimator else {"r_bootstrap": 50}
+    block_sizes = [None]
+    if estimator_class in (HillEstimator, MomentsEstimator):
+        # plain and blocked prefix sums, kept between updates
+        block_sizes.append(256)
+    for block_size in block_sizes:
+        if block_size is not None:
+            params["prefix_block_size"] = block_size
+        estimator = estimator_class(base_seed=5, **params)
+        with pytest.raises(ValueError):
+            estimator.update(batches[0])
+        estimator.fit(batches[0])
+        for batch in batches[1:]:
+            estimator.update(batch)
+        reference = estimator_class(base_seed=5, **params)
+        reference.fit(np.concatenate(batches))
+        np.testing.assert_array_equal(estimator.ordered_data, reference.ordered_data)
+        result, expected = estimator.get_result(), reference.get_result()
+        np.testing.assert_array_equal(result.xi_arr_, expected.xi_arr_)
+        assert getattr(result, "k_star_", None) == getattr(expected, "k_star_", None)
+
+    if estimator_class is not PickandsEstimator:
+        # warm start from the previous minima, with fewer replicates
+        estimator = estimator_class(base_seed=5, r_bootstrap=500)
+        estimator.fit(batches[0])
+        estimator.update(batches[2], warm_start=True)
+        assert estimator.results[12] < 500
+        assert estimator.results[2] is not None
+
+    with pytest.raises(ValueError):
+        HillEstimator(two_tailed=True).update(batches[0])
+
+
+def test_blocked_cumsums():
+    """Test the blocked prefix sums against exactly rounded sums."""
+    import math
+
+    values = np.random.default_rng(17).pareto(1.0, 100_003) + 1
+    summands = lambda start, stop: np.log(values[None, start:stop])  # noqa: E731
+    cumsums = blocked_cumsums(len(values), summands, block_size=10_000, sub_block=64)
+    indices = [0, 63, 64, 9_999, 10_000, 54_321, len(values) - 1]
+    logs = np.log(values)
+    expected = [math.fsum(logs[: i + 1]) for i in indices]
+    np.testing.assert_allclose(cumsums[0, indices], expected, rtol=1e-15)
+
+    parallel = blocked_cumsums(len(values), summands, block_size=10_000, n_jobs=3)
+    np.testing.assert_array_equal(
+        parallel, blocked_cumsums(len(values), summands, block_size=10_000, n_jobs=1)
+    )
+
+    # the blocked and the plain curves agree to rounding
+    ordered_data = np.sort(values)[::-1]
+    for blocked, plain in zip(
+        get_moments_estimates_3(ordered_data, block_size=1000),
+        get_moments_estimates_3(ordered_data),
+    ):
+        np.testing.assert_allclose(blocked, plain, rtol=1e-9)
+    np.testing.assert_allclose(
+        get_biweight_kernel_estimates(ordered_data, 50, 0.6, block_size=1000)[1],
+        get_biweight_kernel_estimates(ordered_data, 50, 0.6)[1],
+        rtol=1e-9,
+    )
+
+    # every estimator with a full-sample curve opts in with prefix_block_size
+    for estimator_class, params in (
+        (HillEstimator, {"bootstrap": False}),
+        (MomentsEstimator, {"bootstrap": False}),
+        (KernelTypeEstimator, {"bootstrap": False}),
+        (SmoothHillEstimator, {}),
+        (POTEstimator, {}),
+    ):
+        blocked = estimator_class(prefix_block_size=1000, **params)
+        blocked.fit(values)
+        plain = estimator_class(**params)
+        plain.fit(values)
+        assert blocked.get_params()["prefix_block_size"] == 1000
+        np.testing.assert_allclose(
+            blocked.get_result().xi_arr_, plain.get_result().xi_arr_, rtol=1e-9
+        )
+
+
+def test_prefix_sum_cache():
+    """Test that prefix sums reusing leading blocks match a fresh computation."""
+    rng = np.random.default_rng(29)
+    ordered_data = np.sort(rng.pareto(1.5, 5000) + 1)[::-1]
+    merged, first_changed = merge_descending(ordered_data, [1.0001, 1.5, 1.2])
+    assert first_changed == np.count_nonzero(ordered_data > 1.5)
+    np.testing.assert_array_equal(
+        merged, np.sort(np.concatenate([ordered_data, [1.0001, 1.5, 1.2]]))[::-1]
+    )
+
+    cache = PrefixSumCache()
+    log_power_cumsums(ordered_data, 2, block_size=256, cache=cache)
+    cache = cache.changed(first_changed)
+    kept, n_logs = cache.reusable(2, 256)
+    assert n_logs == first_changed
+    assert len(kept[1]) == first_changed // 256
+    logs, cumsums = log_power_cumsums(merged, 2, block_size=256, cache=cache)
+    expected_logs, expected = log_power_cumsums(merged, 2, block_size=256)
+    np.testing.assert_array_equal(logs, expected_logs)
+    for cumsum, reference in zip(cumsums, expected):
+        np.testing.assert_array_equal(cumsum, reference)